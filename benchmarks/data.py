@@ -0,0 +1,109 @@
+"""
+Generators of tables shaped like ``examples/data/*.csv`` used by the benchmarks. The values are random but
+reproducible for given `scale` and `seed`, so results of different versions can be compared.
+"""
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+import pandas2neo4j
+from pandas2neo4j import properties
+
+
+class Address(pandas2neo4j.PandasModel):
+    __primarykey__ = "uuid"
+
+    uuid = properties.IntegerProperty(not_null=True)
+    country = properties.StringProperty()
+    city = properties.StringProperty()
+    street_address = properties.StringProperty()
+    lat = properties.FloatProperty()
+    lon = properties.FloatProperty()
+
+
+class Person(pandas2neo4j.PandasModel):
+    __primarykey__ = "uuid"
+
+    uuid = properties.IntegerProperty(not_null=True)
+    firstname = properties.StringProperty(not_null=True)
+    lastname = properties.StringProperty(not_null=True)
+    company = properties.StringProperty()
+    email = properties.StringProperty()
+    phone_number = properties.StringProperty()
+
+
+class Publication(pandas2neo4j.PandasModel):
+    __primarykey__ = "uuid"
+
+    uuid = properties.IntegerProperty(not_null=True)
+    title = properties.StringProperty(not_null=True)
+    year = properties.IntegerProperty()
+    url = properties.StringProperty()
+
+
+MODELS = {"people": Person, "addresses": Address, "publications": Publication}
+
+# link table name -> (relationship, start table, end table, start key column, end key column)
+LINKS = {
+    "addresses_people": ("ADDRESS", "addresses", "people", "address_uuid", "person_uuid"),
+    "addresses_publications": ("AFFILIATION", "addresses", "publications", "address_uuid", "publication_uuid"),
+    "people_publications": ("AUTHOR", "people", "publications", "person_uuid", "publication_uuid"),
+}
+
+
+def _words(rng: np.random.Generator, prefix: str, size: int, vocabulary: int = 1000) -> np.ndarray:
+    return np.char.add(prefix, rng.integers(0, vocabulary, size).astype(str))
+
+
+def generate_tables(scale: int, seed: int = 0) -> Dict[str, pd.DataFrame]:
+    """
+    Generate node and link tables with `scale` people, `scale / 2` addresses, `scale / 5` publications and
+    `scale` rows in each link table.
+
+    :param scale: number of rows of the largest node table.
+    :type scale: int
+    :param seed: seed of the random numbers generator.
+    :type seed: int, optional
+    :return: dictionary mapping names of ``examples/data`` tables (without extension) to the generated tables.
+    """
+    rng = np.random.default_rng(seed)
+    sizes = {"people": scale, "addresses": max(scale // 2, 1), "publications": max(scale // 5, 1)}
+    tables = {
+        "people": pd.DataFrame(
+            {
+                "uuid": np.arange(sizes["people"]),
+                "firstname": _words(rng, "first", sizes["people"]),
+                "lastname": _words(rng, "last", sizes["people"]),
+                "company": _words(rng, "company", sizes["people"]),
+                "email": np.char.add(_words(rng, "user", sizes["people"], 10 ** 6), "@example.com"),
+                "phone_number": rng.integers(10 ** 9, 10 ** 10, sizes["people"]).astype(str),
+            }
+        ),
+        "addresses": pd.DataFrame(
+            {
+                "uuid": np.arange(sizes["addresses"]),
+                "country": _words(rng, "country", sizes["addresses"], 200),
+                "city": _words(rng, "city", sizes["addresses"]),
+                "street_address": _words(rng, "street", sizes["addresses"], 10 ** 5),
+                "lat": rng.uniform(-90, 90, sizes["addresses"]),
+                "lon": rng.uniform(-180, 180, sizes["addresses"]),
+            }
+        ),
+        "publications": pd.DataFrame(
+            {
+                "uuid": np.arange(sizes["publications"]),
+                "title": _words(rng, "title", sizes["publications"], 10 ** 6),
+                "year": rng.integers(1990, 2022, sizes["publications"]),
+                "url": np.char.add("http://example.com/", _words(rng, "post", sizes["publications"], 10 ** 6)),
+            }
+        ),
+    }
+    for name, (_, start, end, start_column, end_column) in LINKS.items():
+        tables[name] = pd.DataFrame(
+            {
+                start_column: rng.integers(0, sizes[start], scale).astype(float),
+                end_column: rng.integers(0, sizes[end], scale).astype(float),
+            }
+        )
+    return tables
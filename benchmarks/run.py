@@ -0,0 +1,249 @@
+"""
+Benchmarks of :class:`pandas2neo4j.PandasGraph` methods.
+
+Tables shaped like ``examples/data/*.csv`` are generated at each requested scale (see :mod:`benchmarks.data`)
+and the scenarios below are timed one after another on an empty graph: node creation, relationship creation,
+matching of nodes and relationships and export of nodes. For each scenario the throughput (rows per second),
+the number of round trips (statements and commits sent to the graph) and the peak memory allocated by Python
+(measured with :mod:`tracemalloc`, which slows the execution down, see ``--no-memory``) are reported.
+
+By default the in-process :class:`pandas2neo4j.InMemoryGraph` backend is used, so no network access or
+database is needed. Use ``--uri`` to run the benchmarks against a local database instead - the database
+should be empty, as the generated nodes are created in it (and are not removed afterwards).
+
+Run from the repository root, e.g.::
+
+    python -m benchmarks.run --scale 1000 10000 --output results.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from pandas2neo4j import InMemoryGraph, PandasGraph
+
+from benchmarks.data import LINKS, MODELS, generate_tables
+
+
+class RoundTripCounter:
+    """
+    Proxy of :class:`py2neo.Graph` (or :class:`.InMemoryGraph`) counting statements run with :meth:`run`
+    and within transactions, and commits of these transactions.
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+        self._lock = threading.Lock()
+        self.round_trips = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._graph, name)
+
+    def count(self):
+        with self._lock:
+            self.round_trips += 1
+
+    def run(self, query: str, *args, **kwargs):
+        self.count()
+        return self._graph.run(query, *args, **kwargs)
+
+    def begin(self, *args, **kwargs) -> "_CountedTransaction":
+        return _CountedTransaction(self, self._graph.begin(*args, **kwargs))
+
+
+class _CountedTransaction:
+    def __init__(self, counter: RoundTripCounter, tx):
+        self._counter = counter
+        self._tx = tx
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tx, name)
+
+    def run(self, query: str, *args, **kwargs):
+        self._counter.count()
+        return self._tx.run(query, *args, **kwargs)
+
+    def commit(self, *args, **kwargs):
+        self._counter.count()
+        return self._tx.commit(*args, **kwargs)
+
+
+def connect(uri: str = None, node_cache_size: int = 0) -> PandasGraph:
+    """
+    Create a :class:`.PandasGraph` connected to `uri` database or using a new :class:`.InMemoryGraph`, with
+    round trips counted by :class:`RoundTripCounter`.
+    """
+    backend = InMemoryGraph() if uri is None else None
+    graph = PandasGraph(uri, node_cache_size=node_cache_size, backend=backend)
+    graph.graph = RoundTripCounter(graph.graph)
+    return graph
+
+
+def scenarios(tables: Dict[str, pd.DataFrame], chunk_size: int, max_workers: int) -> List[tuple]:
+    """
+    Build the list of `(name, rows, function)` scenarios, where `function` accepts a :class:`.PandasGraph`.
+    """
+    result = []
+    for name, model_class in MODELS.items():
+        result.append(
+            (
+                f"create_nodes[{name}]",
+                len(tables[name]),
+                lambda graph, df=tables[name], model_class=model_class: graph.create_nodes_from_dataframe(
+                    df, model_class, chunk_size, bulk=True, return_ids=False, max_workers=max_workers
+                ),
+            )
+        )
+    for name, (relationship, start, end, start_column, end_column) in LINKS.items():
+        arguments = (tables[name], relationship, MODELS[start], MODELS[end], start_column, end_column)
+        result.append(
+            (
+                f"create_relationships[{name}]",
+                len(tables[name]),
+                lambda graph, arguments=arguments: graph.create_relationships_from_dataframe(
+                    *arguments,
+                    chunk_size=chunk_size,
+                    bulk=True,
+                    return_ids=False,
+                    max_workers=max_workers,
+                ),
+            )
+        )
+    for name, model_class in MODELS.items():
+        result.append(
+            (
+                f"match_nodes[{name}]",
+                len(tables[name]),
+                lambda graph, df=tables[name], model_class=model_class: graph.prefetch_nodes(
+                    df, model_class, "uuid", chunk_size=chunk_size
+                ),
+            )
+        )
+    for name, (relationship, start, end, start_column, end_column) in LINKS.items():
+        arguments = (tables[name], relationship, MODELS[start], MODELS[end], start_column, end_column)
+        result.append(
+            (
+                f"match_relationships[{name}]",
+                len(tables[name]),
+                lambda graph, arguments=arguments: graph.relationships_exist_for_dataframe(
+                    *arguments, chunk_size=chunk_size
+                ),
+            )
+        )
+    for name, model_class in MODELS.items():
+        result.append(
+            (
+                f"export_nodes[{name}]",
+                len(tables[name]),
+                lambda graph, model_class=model_class: graph.get_dataframe_for_models(model_class),
+            )
+        )
+        result.append(
+            (
+                f"iter_export_nodes[{name}]",
+                len(tables[name]),
+                lambda graph, model_class=model_class: sum(
+                    len(df) for df in graph.iter_dataframe_for_models(model_class, chunk_size=chunk_size)
+                ),
+            )
+        )
+    return result
+
+
+def measure(graph: PandasGraph, rows: int, function: Callable, memory: bool = True) -> Dict[str, Any]:
+    """
+    Run `function` with `graph` and return its elapsed time, throughput, round trips and peak memory.
+    """
+    round_trips = graph.graph.round_trips
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    function(graph)
+    elapsed = time.perf_counter() - start
+    result = {
+        "rows": rows,
+        "elapsed": elapsed,
+        "rows_per_second": rows / elapsed if elapsed > 0 else None,
+        "round_trips": graph.graph.round_trips - round_trips,
+        "peak_memory": None,
+    }
+    if memory:
+        result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def _revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    scales: List[int],
+    uri: str = None,
+    chunk_size: int = 10000,
+    max_workers: int = 1,
+    seed: int = 0,
+    memory: bool = True,
+) -> Dict[str, Any]:
+    """
+    Run all the scenarios at each of `scales` and return the results with the environment description.
+    """
+    results = []
+    for scale in scales:
+        tables = generate_tables(scale, seed)
+        graph = connect(uri, node_cache_size=scale)
+        for model_class in MODELS.values():
+            graph.ensure_indexes(model_class)
+        for name, rows, function in scenarios(tables, chunk_size, max_workers):
+            result = {"scenario": name, "scale": scale, **measure(graph, rows, function, memory)}
+            print(
+                f"{scale:>10} {name:<45} {result['rows_per_second'] or 0:>14,.0f} rows/s "
+                f"{result['round_trips']:>8} round trips "
+                + (f"{result['peak_memory'] / 2 ** 20:>10.1f} MiB" if memory else ""),
+                file=sys.stderr,
+            )
+            results.append(result)
+    return {
+        "revision": _revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "graph": "database" if uri is not None else "in-memory",
+        "chunk_size": chunk_size,
+        "max_workers": max_workers,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1000, 10000], help="rows of the largest tables")
+    parser.add_argument("--uri", help="URI of an empty database, the in-memory backend is used by default")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="chunk size passed to the methods")
+    parser.add_argument("--max-workers", type=int, default=1, help="concurrent writers passed to the methods")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated tables")
+    parser.add_argument("--no-memory", action="store_true", help="do not trace the peak memory")
+    parser.add_argument("--output", help="path of a JSON file the results are written to")
+    args = parser.parse_args(argv)
+    report = run(args.scale, args.uri, args.chunk_size, args.max_workers, args.seed, not args.no_memory)
+    if args.output is not None:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
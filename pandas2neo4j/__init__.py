@@ -1,2 +1,10 @@
 from .pandas_graph import PandasGraph
 from .pandas_model import *
+from .summary import IngestionSummary, SyncSummary
+from .chunking import AdaptiveChunkSize
+from .checkpoint import CheckpointStore, FileCheckpointStore, NodeCheckpointStore
+from .admin_import import AdminImportExporter
+from .instrumentation import Instrumentation, Metrics, MetricsCollector
+from .profiling import Profiler, QueryProfile
+from .async_graph import AsyncPandasGraph
+from .backends import GraphBackend, InMemoryGraph
@@ -0,0 +1,279 @@
+import os
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from pandas2neo4j.checkpoint import Checkpoint
+from pandas2neo4j.chunking import ChunkSize, _next_size
+from pandas2neo4j.errors import InvalidDataFrameError
+from pandas2neo4j.pandas_model import PandasModel, model_properties
+from pandas2neo4j.properties import ListProperty, SchemaProperty
+
+ArrowSource = Any
+"""
+Parquet file path, :class:`pyarrow.Table`, :class:`pyarrow.RecordBatch` or an iterable of them.
+"""
+
+_ARROW_TYPES = {bool: "bool_", int: "int64", float: "float64", str: "string"}
+_KINDS = ("integer", "floating", "boolean", "string")
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "Arrow ingestion requires pyarrow package. Install it with `pip install pandas2neo4j[arrow]`."
+        ) from error
+    return pyarrow
+
+
+class ArrowChunk:
+    """
+    Slice of a :class:`pyarrow.RecordBatch` written by :class:`.PandasGraph` within a single transaction.
+    It provides the part of :class:`pandas.DataFrame` interface used when writing chunks: its length,
+    `empty` flag and `index` holding positions of the rows in the whole source.
+
+    :param batch: rows of the chunk.
+    :type batch: :class:`pyarrow.RecordBatch`
+    :param index: positions of the rows.
+    :type index: :class:`pandas.Index`
+    """
+
+    def __init__(self, batch: Any, index: pd.Index):
+        self.batch = batch
+        self.index = index
+
+    def __len__(self) -> int:
+        return self.batch.num_rows
+
+    @property
+    def empty(self) -> bool:
+        return self.batch.num_rows == 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, columns={self.batch.schema.names})"
+
+
+def _source_batches(source: ArrowSource, columns: Optional[List[str]], batch_size: int) -> Iterator[Any]:
+    pa = _pyarrow()
+    if isinstance(source, (str, os.PathLike)):
+        parquet_file = pa.parquet.ParquetFile(source, memory_map=True)
+        available = parquet_file.schema_arrow.names
+        selected = None if columns is None else [column for column in columns if column in available]
+        yield from parquet_file.iter_batches(batch_size=batch_size, columns=selected)
+    elif isinstance(source, pa.Table):
+        yield from source.to_batches(max_chunksize=batch_size)
+    elif isinstance(source, pa.RecordBatch):
+        yield source
+    else:
+        for item in source:
+            yield from _source_batches(item, columns, batch_size)
+
+
+def iter_arrow_chunks(
+    source: ArrowSource,
+    chunk_size: ChunkSize,
+    columns: Optional[List[str]] = None,
+    checkpoint: Checkpoint = None,
+    batch_size: int = 65536,
+) -> Iterator[ArrowChunk]:
+    """
+    Split record batches of `source` into :class:`ArrowChunk` slices with `chunk_size` rows. Parquet files are
+    memory mapped and read in batches of `batch_size` rows (only the `columns` if used), so chunks never cross
+    the boundaries of the read batches (or of given record batches) and a chunk size of 0 means a chunk per batch.
+    Slices share the data of the batches. Rows already committed according to `checkpoint` are skipped.
+
+    :param source: Parquet file path, :class:`pyarrow.Table`, :class:`pyarrow.RecordBatch` or an iterable of them.
+    :type source: ArrowSource
+    :param chunk_size: number of rows of each chunk or :class:`.AdaptiveChunkSize`.
+    :type chunk_size: ChunkSize
+    :param columns: names of the read columns of Parquet files. Missing columns are ignored.
+    :type columns: List[str], optional
+    :param checkpoint: progress of the load job.
+    :type checkpoint: :class:`.Checkpoint`, optional
+    :param batch_size: number of rows of batches read from Parquet files.
+    :type batch_size: int, optional
+    :return: Iterator of chunks.
+    """
+    pa = _pyarrow()
+    offset = 0
+    for batch in _source_batches(source, columns, batch_size):
+        positions = pd.RangeIndex(offset, offset + batch.num_rows)
+        offset += batch.num_rows
+        if checkpoint is not None:
+            committed = checkpoint.committed(positions.to_numpy())
+            if committed.any():
+                checkpoint.skipped += int(committed.sum())
+                batch = batch.filter(pa.array(~committed))
+                positions = positions[~committed]
+        start = 0
+        while start < batch.num_rows:
+            stop = start + max(_next_size(chunk_size, batch.num_rows - start), 1)
+            yield ArrowChunk(batch.slice(start, stop - start), positions[start:stop])
+            start = stop
+
+
+def _arrow_type(schema_property: SchemaProperty) -> Any:
+    pa = _pyarrow()
+    if isinstance(schema_property, ListProperty):
+        nested = _ARROW_TYPES.get(schema_property.nested_type)
+        return None if nested is None else pa.list_(getattr(pa, nested)())
+    name = _ARROW_TYPES.get(schema_property.TYPE)
+    return None if name is None else getattr(pa, name)()
+
+
+def _without_nan(column: Any) -> Any:
+    pa = _pyarrow()
+    if pa.types.is_floating(column.type) and column.null_count < len(column):
+        return pa.compute.if_else(pa.compute.is_nan(column), pa.scalar(None, column.type), column)
+    return column
+
+
+def _kind(arrow_type: Any) -> Optional[str]:
+    pa = _pyarrow()
+    if pa.types.is_large_string(arrow_type):
+        return "string"
+    return next((kind for kind in _KINDS if getattr(pa.types, f"is_{kind}")(arrow_type)), None)
+
+
+def _cast_series_column(
+    column: Any, schema_property: SchemaProperty, arrow_type: Any, name: str, index: pd.Index,
+    invalid_rows: Dict[str, List[int]]
+) -> Any:
+    pa = _pyarrow()
+    values, invalid = schema_property.cast_series(pd.Series(column.to_pylist(), dtype=object))
+    if invalid.any():
+        invalid_rows[name] = list(index[invalid.to_numpy()])
+    return pa.array(values.tolist(), type=arrow_type)
+
+
+def _cast_column(
+    column: Any, schema_property: SchemaProperty, name: str, index: pd.Index, invalid_rows: Dict[str, List[int]]
+) -> Any:
+    pa = _pyarrow()
+    arrow_type = _arrow_type(schema_property)
+    column = _without_nan(column)
+    if arrow_type is None or column.type == arrow_type:
+        return column
+    if _kind(column.type) is not None and _kind(column.type) == _kind(arrow_type):
+        try:
+            return pa.compute.cast(column, arrow_type)
+        except pa.ArrowInvalid:
+            return _cast_series_column(column, schema_property, arrow_type, name, index, invalid_rows)
+    if schema_property.cast_value and _kind(column.type) in ("integer", "floating"):
+        if pa.types.is_boolean(arrow_type):
+            return pa.compute.not_equal(column, pa.scalar(0, column.type))
+        if _kind(arrow_type) in ("integer", "floating"):
+            if pa.types.is_floating(column.type) and pa.types.is_integer(arrow_type):
+                infinite = pa.compute.fill_null(pa.compute.invert(pa.compute.is_finite(column)), False)
+                if pa.compute.any(infinite).as_py():
+                    invalid_rows[name] = list(index[infinite.to_numpy(zero_copy_only=False)])
+                    column = pa.compute.if_else(infinite, pa.scalar(None, column.type), column)
+            return pa.compute.cast(column, arrow_type, safe=False)
+    return _cast_series_column(column, schema_property, arrow_type, name, index, invalid_rows)
+
+
+def validate_batch(model_class: PandasModel, chunk: ArrowChunk) -> Any:
+    """
+    Arrow counterpart of :meth:`.PandasModel.validate_dataframe`. Select columns of `chunk` matching
+    the properties of `model_class`, rename them to the properties' keys and cast them to the Arrow types
+    matching the properties' types. Only casts with the semantics of :class:`.SchemaProperty` are done with
+    :mod:`pyarrow.compute`: between integer and float types and from numbers to booleans (by comparing them
+    with 0). Other widths of the property's type (e.g. `int32` for integer properties) are accepted also if
+    `cast_value` is False. Remaining columns are cast with :meth:`.SchemaProperty.cast_series`, so the values
+    always match the ones returned by :meth:`.PandasModel.validate_dataframe`. `NaN` values are replaced
+    with nulls and `not_null` flags are checked. The offending rows (identified by their positions) are
+    reported with a single :class:`.InvalidDataFrameError`.
+
+    :param model_class: model determining the schema.
+    :type model_class: :class:`.PandasModel`
+    :param chunk: validated rows.
+    :type chunk: :class:`ArrowChunk`
+    :return: :class:`pyarrow.RecordBatch` with the casted columns.
+    """
+    pa = _pyarrow()
+    properties = model_properties(model_class)
+    arrays, keys = [], []
+    invalid_rows, null_rows = {}, {}
+    for name in chunk.batch.schema.names:
+        if name not in properties:
+            continue
+        schema_property = properties[name]
+        column = chunk.batch.column(name)
+        if isinstance(schema_property, SchemaProperty):
+            column = _cast_column(column, schema_property, name, chunk.index, invalid_rows)
+            if schema_property.not_null and column.null_count:
+                nulls = column.is_null().to_numpy(zero_copy_only=False)
+                if name in invalid_rows:
+                    nulls &= ~np.isin(chunk.index, invalid_rows[name])
+                if nulls.any():
+                    null_rows[name] = list(chunk.index[nulls])
+        else:
+            column = _without_nan(column)
+        arrays.append(column)
+        keys.append(schema_property.key)
+    if invalid_rows or null_rows:
+        raise InvalidDataFrameError(model_class, invalid_rows, null_rows)
+    return pa.RecordBatch.from_arrays(arrays, names=keys)
+
+
+def batch_to_records(batch: Any) -> List[Dict[str, Any]]:
+    """
+    Convert `batch` into a list of dictionaries that can be sent to the graph as a query parameter, without
+    constructing a :class:`pandas.DataFrame`. `NaN` values are replaced with None.
+
+    :param batch: converted rows.
+    :type batch: :class:`pyarrow.RecordBatch`
+    :return: List with a dictionary for each row.
+    """
+    pa = _pyarrow()
+    if batch.num_columns == 0:
+        return [{} for _ in range(batch.num_rows)]
+    return pa.RecordBatch.from_arrays(
+        [_without_nan(column) for column in batch.columns], names=batch.schema.names
+    ).to_pylist()
+
+
+def node_records(chunk: ArrowChunk, model_class: Union[PandasModel, str]) -> List[Dict[str, Any]]:
+    """
+    Convert rows of `chunk` into properties of nodes. If `model_class` is a :class:`.PandasModel` subclass
+    the rows are validated with :func:`validate_batch`, otherwise all the columns are used.
+    """
+    if isinstance(model_class, str):
+        return batch_to_records(chunk.batch)
+    return batch_to_records(validate_batch(model_class, chunk))
+
+
+def relationship_rows(chunk: ArrowChunk, from_key_column: str, to_key_column: str) -> List[Dict[str, Any]]:
+    """
+    Convert rows of `chunk` into the `$rows` parameter of relationships statements (see
+    :func:`.queries.unwind_create_relationships_query`). Columns other than `from_key_column`
+    and `to_key_column` become properties of the relationships.
+    """
+    pa = _pyarrow()
+    batch = chunk.batch
+    names = [name for name in batch.schema.names if name not in (from_key_column, to_key_column)]
+    properties = pa.RecordBatch.from_arrays([batch.column(name) for name in names], names=names)
+    return [
+        {"f": from_key, "t": to_key, "p": props, "i": position}
+        for position, (from_key, to_key, props) in enumerate(
+            zip(
+                batch.column(from_key_column).to_pylist(),
+                batch.column(to_key_column).to_pylist(),
+                batch_to_records(properties),
+            )
+        )
+    ]
+
+
+def model_columns(model_class: Union[PandasModel, str]) -> Optional[List[str]]:
+    """
+    Names of the columns read from Parquet files for nodes of `model_class` (None for all the columns).
+    """
+    if isinstance(model_class, str):
+        return None
+    return list(model_properties(model_class))
@@ -0,0 +1,260 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import inspect
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Union
+
+import pandas as pd
+import py2neo
+from py2neo import ogm
+
+from pandas2neo4j.pandas_graph import PandasGraph
+from pandas2neo4j.summary import IngestionSummary, SyncSummary
+
+_EXHAUSTED = object()
+
+
+class AsyncPandasGraph:
+    """
+    asyncio counterpart of :class:`.PandasGraph`. Each method of :class:`.PandasGraph` operating on the graph
+    is available as a coroutine accepting the same arguments and returning the same result, while the blocking
+    database calls are executed by a pool of `concurrency` threads, so the event loop is never blocked.
+
+    Write methods use the same defaults as :class:`.PandasGraph`, so they return the same results. If
+    `write_workers` is used it becomes the default `max_workers` argument of the write methods (when the
+    argument is not passed), so the chunks are pipelined: the next chunk is being serialized while the previous
+    one is committed. Note that chunks of relationships written concurrently without the `bulk` mode are not
+    partitioned. The `iter_*` methods are asynchronous generators which request the next page before the current
+    one is yielded, and the streaming `create_*_from_dataframes` methods accept asynchronous iterables of
+    `pandas.DataFrame` tables as well.
+
+    The instance should be closed with :meth:`AsyncPandasGraph.close` (or used as an async context manager)
+    to release the threads.
+
+    :param profile: Connection profile passed to :class:`.PandasGraph` constructor.
+    :param name: Name of the database passed to :class:`.PandasGraph` constructor.
+    :param concurrency: Number of threads executing the blocking calls.
+    :type concurrency: int, optional
+    :param write_workers: Default `max_workers` argument of the write methods. If not used the default
+        of :class:`.PandasGraph` methods (a single worker) is kept.
+    :type write_workers: int, optional
+    :param settings: Other arguments passed to :class:`.PandasGraph` constructor.
+    """
+    def __init__(self, profile=None, name=None, concurrency: int = 2, write_workers: int = None, **settings):
+        self._init(PandasGraph(profile, name=name, **settings), concurrency, write_workers)
+
+    def _init(self, graph: PandasGraph, concurrency: int, write_workers: int = None):
+        self.graph = graph
+        self.concurrency = concurrency
+        self.write_workers = write_workers
+        self._executor = ThreadPoolExecutor(concurrency)
+
+    @classmethod
+    def wrap(cls, graph: PandasGraph, concurrency: int = 2, write_workers: int = None) -> "AsyncPandasGraph":
+        """
+        Create an :class:`.AsyncPandasGraph` using already connected :class:`.PandasGraph`.
+
+        :param graph: graph that should be used to execute the calls.
+        :type graph: :class:`.PandasGraph`
+        :param concurrency: Number of threads executing the blocking calls.
+        :type concurrency: int, optional
+        :param write_workers: Default `max_workers` argument of the write methods.
+        :type write_workers: int, optional
+        """
+        async_graph = cls.__new__(cls)
+        async_graph._init(graph, concurrency, write_workers)
+        return async_graph
+
+    def close(self):
+        """
+        Shut down the threads used to execute the blocking calls.
+        """
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncPandasGraph":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def _submit(self, function: Callable, *args, **kwargs) -> asyncio.Future:
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(function, *args, **kwargs)
+        )
+
+    async def _run(self, function: Callable, *args, **kwargs) -> Any:
+        return await self._submit(function, *args, **kwargs)
+
+    async def _write(self, function: Callable, *args, **kwargs) -> Any:
+        if self.write_workers is not None:
+            signature = inspect.signature(function)
+            if (
+                "max_workers" in signature.parameters
+                and "max_workers" not in signature.bind_partial(*args, **kwargs).arguments
+            ):
+                kwargs["max_workers"] = self.write_workers
+        return await self._run(function, *args, **kwargs)
+
+    async def _iterate(self, iterator: Iterator) -> AsyncIterator:
+        page = self._submit(next, iterator, _EXHAUSTED)
+        while True:
+            result = await page
+            if result is _EXHAUSTED:
+                return
+            page = self._submit(next, iterator, _EXHAUSTED)
+            yield result
+
+    def _blocking_iterable(
+        self, dfs: Union[Iterable[pd.DataFrame], AsyncIterable[pd.DataFrame]]
+    ) -> Iterable[pd.DataFrame]:
+        if not hasattr(dfs, "__aiter__"):
+            return dfs
+        loop = asyncio.get_running_loop()
+        iterator = dfs.__aiter__()
+
+        async def next_dataframe():
+            return await iterator.__anext__()
+
+        def dataframes():
+            while True:
+                try:
+                    yield asyncio.run_coroutine_threadsafe(next_dataframe(), loop).result()
+                except StopAsyncIteration:
+                    return
+
+        return dataframes()
+
+    async def ensure_indexes(self, *args, **kwargs) -> List[str]:
+        """Coroutine variant of :meth:`.PandasGraph.ensure_indexes`."""
+        return await self._run(self.graph.ensure_indexes, *args, **kwargs)
+
+    async def create_graph_object(self, *args, **kwargs):
+        """Coroutine variant of :meth:`.PandasGraph.create_graph_object`."""
+        return await self._run(self.graph.create_graph_object, *args, **kwargs)
+
+    async def create_graph_objects(self, *args, **kwargs):
+        """Coroutine variant of :meth:`.PandasGraph.create_graph_objects`."""
+        return await self._run(self.graph.create_graph_objects, *args, **kwargs)
+
+    async def prefetch_nodes(self, *args, **kwargs) -> int:
+        """Coroutine variant of :meth:`.PandasGraph.prefetch_nodes`."""
+        return await self._run(self.graph.prefetch_nodes, *args, **kwargs)
+
+    async def create_nodes_from_dataframe(self, *args, **kwargs) -> Union[pd.Series, IngestionSummary]:
+        """Coroutine variant of :meth:`.PandasGraph.create_nodes_from_dataframe`."""
+        return await self._write(self.graph.create_nodes_from_dataframe, *args, **kwargs)
+
+    async def create_relationships_from_dataframe(
+        self, *args, **kwargs
+    ) -> Union[pd.Series, IngestionSummary]:
+        """Coroutine variant of :meth:`.PandasGraph.create_relationships_from_dataframe`."""
+        return await self._write(self.graph.create_relationships_from_dataframe, *args, **kwargs)
+
+    async def create_nodes_from_dataframes(
+        self, dfs: Union[Iterable[pd.DataFrame], AsyncIterable[pd.DataFrame]], *args, **kwargs
+    ) -> IngestionSummary:
+        """
+        Coroutine variant of :meth:`.PandasGraph.create_nodes_from_dataframes`. `dfs` may be an asynchronous
+        iterable as well.
+        """
+        return await self._write(
+            self.graph.create_nodes_from_dataframes, self._blocking_iterable(dfs), *args, **kwargs
+        )
+
+    async def create_relationships_from_dataframes(
+        self, dfs: Union[Iterable[pd.DataFrame], AsyncIterable[pd.DataFrame]], *args, **kwargs
+    ) -> IngestionSummary:
+        """
+        Coroutine variant of :meth:`.PandasGraph.create_relationships_from_dataframes`. `dfs` may be
+        an asynchronous iterable as well.
+        """
+        return await self._write(
+            self.graph.create_relationships_from_dataframes, self._blocking_iterable(dfs), *args, **kwargs
+        )
+
+    async def create_dynamic_relationships_from_dataframe(self, *args, **kwargs) -> IngestionSummary:
+        """Coroutine variant of :meth:`.PandasGraph.create_dynamic_relationships_from_dataframe`."""
+        return await self._write(self.graph.create_dynamic_relationships_from_dataframe, *args, **kwargs)
+
+    async def create_nodes_from_arrow(self, *args, **kwargs) -> IngestionSummary:
+        """Coroutine variant of :meth:`.PandasGraph.create_nodes_from_arrow`."""
+        return await self._write(self.graph.create_nodes_from_arrow, *args, **kwargs)
+
+    async def create_relationships_from_arrow(self, *args, **kwargs) -> IngestionSummary:
+        """Coroutine variant of :meth:`.PandasGraph.create_relationships_from_arrow`."""
+        return await self._write(self.graph.create_relationships_from_arrow, *args, **kwargs)
+
+    async def upsert_nodes_from_dataframe(self, *args, **kwargs) -> IngestionSummary:
+        """Coroutine variant of :meth:`.PandasGraph.upsert_nodes_from_dataframe`."""
+        return await self._write(self.graph.upsert_nodes_from_dataframe, *args, **kwargs)
+
+    async def upsert_relationships_from_dataframe(self, *args, **kwargs) -> IngestionSummary:
+        """Coroutine variant of :meth:`.PandasGraph.upsert_relationships_from_dataframe`."""
+        return await self._write(self.graph.upsert_relationships_from_dataframe, *args, **kwargs)
+
+    async def sync_dataframe(self, *args, **kwargs) -> SyncSummary:
+        """Coroutine variant of :meth:`.PandasGraph.sync_dataframe`."""
+        return await self._write(self.graph.sync_dataframe, *args, **kwargs)
+
+    async def get_graph_models(self, *args, **kwargs) -> List[ogm.Model]:
+        """Coroutine variant of :meth:`.PandasGraph.get_graph_models`."""
+        return await self._run(self.graph.get_graph_models, *args, **kwargs)
+
+    async def get_graph_nodes(self, *args, **kwargs) -> List[py2neo.Node]:
+        """Coroutine variant of :meth:`.PandasGraph.get_graph_nodes`."""
+        return await self._run(self.graph.get_graph_nodes, *args, **kwargs)
+
+    async def get_nodes_for_dataframe(self, *args, **kwargs) -> List[py2neo.Node]:
+        """Coroutine variant of :meth:`.PandasGraph.get_nodes_for_dataframe`."""
+        return await self._run(self.graph.get_nodes_for_dataframe, *args, **kwargs)
+
+    async def get_nodes_models_for_dataframe(self, *args, **kwargs) -> pd.DataFrame:
+        """Coroutine variant of :meth:`.PandasGraph.get_nodes_models_for_dataframe`."""
+        return await self._run(self.graph.get_nodes_models_for_dataframe, *args, **kwargs)
+
+    async def get_models_for_dataframe(self, *args, **kwargs) -> pd.DataFrame:
+        """Coroutine variant of :meth:`.PandasGraph.get_models_for_dataframe`."""
+        return await self._run(self.graph.get_models_for_dataframe, *args, **kwargs)
+
+    async def get_dataframe_for_models(self, *args, **kwargs) -> pd.DataFrame:
+        """Coroutine variant of :meth:`.PandasGraph.get_dataframe_for_models`."""
+        return await self._run(self.graph.get_dataframe_for_models, *args, **kwargs)
+
+    async def get_dataframe_for_label(self, *args, **kwargs) -> pd.DataFrame:
+        """Coroutine variant of :meth:`.PandasGraph.get_dataframe_for_label`."""
+        return await self._run(self.graph.get_dataframe_for_label, *args, **kwargs)
+
+    async def iter_graph_nodes(self, *args, **kwargs) -> AsyncIterator[List[py2neo.Node]]:
+        """Asynchronous generator variant of :meth:`.PandasGraph.iter_graph_nodes`."""
+        async for nodes in self._iterate(self.graph.iter_graph_nodes(*args, **kwargs)):
+            yield nodes
+
+    async def iter_dataframe_for_label(self, *args, **kwargs) -> AsyncIterator[pd.DataFrame]:
+        """Asynchronous generator variant of :meth:`.PandasGraph.iter_dataframe_for_label`."""
+        async for df in self._iterate(self.graph.iter_dataframe_for_label(*args, **kwargs)):
+            yield df
+
+    async def iter_dataframe_for_models(self, *args, **kwargs) -> AsyncIterator[pd.DataFrame]:
+        """Asynchronous generator variant of :meth:`.PandasGraph.iter_dataframe_for_models`."""
+        async for df in self._iterate(self.graph.iter_dataframe_for_models(*args, **kwargs)):
+            yield df
+
+    async def get_relationships(self, *args, **kwargs) -> List[py2neo.Relationship]:
+        """Coroutine variant of :meth:`.PandasGraph.get_relationships`."""
+        return await self._run(self.graph.get_relationships, *args, **kwargs)
+
+    async def get_dataframe_for_relationship(self, *args, **kwargs) -> pd.DataFrame:
+        """Coroutine variant of :meth:`.PandasGraph.get_dataframe_for_relationship`."""
+        return await self._run(self.graph.get_dataframe_for_relationship, *args, **kwargs)
+
+    async def get_relationships_for_dataframe(self, *args, **kwargs) -> pd.DataFrame:
+        """Coroutine variant of :meth:`.PandasGraph.get_relationships_for_dataframe`."""
+        return await self._run(self.graph.get_relationships_for_dataframe, *args, **kwargs)
+
+    async def relationships_exist_for_dataframe(self, *args, **kwargs) -> pd.Series:
+        """Coroutine variant of :meth:`.PandasGraph.relationships_exist_for_dataframe`."""
+        return await self._run(self.graph.relationships_exist_for_dataframe, *args, **kwargs)
+
+    async def get_missing_relationships_for_dataframe(self, *args, **kwargs) -> pd.DataFrame:
+        """Coroutine variant of :meth:`.PandasGraph.get_missing_relationships_for_dataframe`."""
+        return await self._run(self.graph.get_missing_relationships_for_dataframe, *args, **kwargs)
@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+import py2neo
+from py2neo import matching
+
+
+class GraphBackend(ABC):
+    """
+    Graph used by :class:`.PandasGraph` in place of :class:`py2neo.Graph` (see `backend` argument
+    of :class:`.PandasGraph`). A backend implements the subset of :class:`py2neo.Graph` interface used by
+    :class:`.PandasGraph`: running statements (directly or within transactions returned by
+    :meth:`GraphBackend.begin`), creating :class:`py2neo.Subgraph` objects, managing indexes with
+    :attr:`GraphBackend.schema` and matching nodes and relationships with py2neo matchers.
+
+    Transactions returned by :meth:`GraphBackend.begin` should provide `run`, `create`, `commit` and `rollback`
+    methods and `closed` attribute, and cursors returned by `run` should be iterables of
+    :class:`py2neo.cypher.Record` objects with `stats` and `plan` methods.
+    """
+    name = None
+
+    @property
+    @abstractmethod
+    def schema(self) -> Any:
+        """
+        Object managing indexes with the subset of :class:`py2neo.Schema` interface used by :class:`.PandasGraph`:
+        `get_indexes`, `get_uniqueness_constraints`, `create_index` and `create_uniqueness_constraint` methods.
+        """
+
+    @abstractmethod
+    def begin(self, readonly: bool = False) -> Any:
+        """
+        Begin a new transaction.
+        """
+
+    @abstractmethod
+    def run(self, query: str, parameters: Dict[str, Any] = None, **kwparameters) -> Any:
+        """
+        Run a single statement within its own transaction and return its cursor.
+        """
+
+    @abstractmethod
+    def create(self, subgraph: py2neo.Subgraph):
+        """
+        Create nodes and relationships of `subgraph` which are not bound to the graph yet and bind them.
+        """
+
+    def evaluate(self, query: str, parameters: Dict[str, Any] = None, **kwparameters) -> Any:
+        """
+        Run a single statement and return the first value of its first record (or None).
+        """
+        for record in self.run(query, parameters, **kwparameters):
+            return record[0]
+        return None
+
+    @property
+    def nodes(self) -> matching.NodeMatcher:
+        """
+        :class:`py2neo.NodeMatcher` of the graph.
+        """
+        return matching.NodeMatcher(self)
+
+    @property
+    def relationships(self) -> matching.RelationshipMatcher:
+        """
+        :class:`py2neo.RelationshipMatcher` of the graph.
+        """
+        return matching.RelationshipMatcher(self)
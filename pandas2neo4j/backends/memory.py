@@ -0,0 +1,867 @@
+from array import array
+import operator
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+import py2neo
+from py2neo.cypher import Record
+
+from pandas2neo4j import queries
+from pandas2neo4j.backends.base import GraphBackend
+from pandas2neo4j.chunking import ChunkSize, measured, split_sequence
+from pandas2neo4j.errors import NullMergeKeyError, UniquenessConstraintViolationError, UnsupportedQueryError
+from pandas2neo4j.summary import IngestionSummary
+
+if TYPE_CHECKING:
+    from pandas2neo4j.pandas_graph import PandasGraph
+
+Undo = List[Callable[[], None]]
+
+_NAME = r"(?:\w+|`(?:[^`]|``)+`)"
+_NODE = (
+    r"MATCH \((?P<{v}>[ab])(?::(?P<{v}_label>{name}))?"
+    r"(?: \{{(?P<{v}_key>{name}): row\.[ft]\}}\)|\) WHERE id\([ab]\) = row\.[ft])"
+)
+_CREATE_NODES = re.compile(
+    rf"UNWIND \$rows AS row CREATE \(n(?P<labels>(?::{_NAME})*)\) SET n = row "
+    r"RETURN (?:id\(n\) AS id|count\(n\) AS created)"
+)
+_MERGE_NODES = re.compile(
+    rf"UNWIND \$rows AS row MERGE \(n:(?P<label>{_NAME}) \{{(?P<key>{_NAME}): row\.k\}}\) SET n \+= row\.p "
+    r"RETURN (?:row\.i AS i, id\(n\) AS id|count\(n\) AS merged)"
+)
+_APPEND_LISTS = re.compile(
+    rf"MERGE \(n:(?P<label>{_NAME}) \{{(?P<key>{_NAME}): \$key\}}\) SET (?P<updates>.+) RETURN count\(n\) AS merged"
+)
+_APPEND_LIST = re.compile(rf"n\.(?P<name>{_NAME}) = coalesce\(n\.(?P=name), \[\]\) \+ \$lists\.(?P=name)")
+_RELATIONSHIPS = re.compile(
+    rf"UNWIND \$rows AS row {_NODE.format(v='a', name=_NAME)} {_NODE.format(v='b', name=_NAME)} "
+    rf"(?P<op>CREATE|MERGE|MATCH) \(a\)-\[r:(?P<type>{_NAME})\]->\(b\)(?: SET r (?P<set>\+?=) row\.p)? "
+    r"RETURN (?P<ret>row\.i AS i, id\(r\) AS id|count\(r\) AS \w+|row\.i AS i, a, r, b|DISTINCT row\.i AS i)"
+)
+_KEYS = rf"MATCH \(n:(?P<label>{_NAME})\) WHERE (?:n\.(?P<key>{_NAME})|id\(n\)) IN \$keys"
+_MATCH_BY_KEYS = re.compile(
+    rf"{_KEYS} RETURN (?:n\.{_NAME}|id\(n\)) AS key, (?P<ret>n AS node|id\(n\) AS id|n\.(?P<value>{_NAME}) AS value)"
+)
+_DELETE_BY_KEYS = re.compile(rf"{_KEYS} DETACH DELETE n RETURN count\(n\) AS deleted")
+_PROJECT = re.compile(
+    rf"MATCH \(n:(?P<label>{_NAME})\)(?: WHERE (?:n\.(?P<key>{_NAME})|id\(n\)) (?P<cond>IS NOT NULL|> \$last))?"
+    r" RETURN (?P<fields>.+?)(?P<paged> ORDER BY page_key LIMIT \$limit)?"
+)
+_FIELD = re.compile(rf"(?:n\.(?P<key>{_NAME})|id\(n\)|(?P<expr>properties\(n\)|n)) AS (?P<alias>\w+)")
+_RELATIONSHIPS_FOR_NODES = re.compile(
+    rf"MATCH \(a\)-\[r:(?P<type>{_NAME})\]->\(b\) WHERE (?P<where>.+?) RETURN a, r, b"
+)
+_ID_CONDITION = re.compile(r"(?P<not>NOT )?id\((?P<v>[ab])\) IN \$(?P<parameter>\w+)")
+_NODE_MATCH = re.compile(
+    rf"MATCH \(_(?P<labels>(?::{_NAME})*)\)(?: WHERE (?P<where>.+?))? RETURN (?P<ret>_|count\(_\))"
+    r"(?: SKIP (?P<skip>\d+))?(?: LIMIT (?P<limit>\d+))?"
+)
+_RELATIONSHIP_MATCH = re.compile(
+    rf"MATCH \(a\)-\[_(?::(?P<type>{_NAME}))?\]->\(b\) RETURN (?P<ret>_|count\(_\))"
+    r"(?: SKIP (?P<skip>\d+))?(?: LIMIT (?P<limit>\d+))?"
+)
+_PROPERTY_CONDITION = re.compile(
+    rf"_\.(?P<key>{_NAME}) (?:(?P<null>IS (?:NOT )?NULL)|(?P<op>=|<>|>=|<=|>|<|IN) \$(?P<parameter>{_NAME}))"
+)
+_ID_MATCH = re.compile(r"id\(_\) (?:= (?P<id>\d+)|(?:in|IN) \[(?P<ids>[\d, ]*)\])")
+_OPERATORS = {
+    "=": operator.eq,
+    "<>": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "IN": lambda value, values: value in values,
+}
+_MIN_DELTA = 1024
+
+
+def _unescape(name: Optional[str]) -> Optional[str]:
+    if name is not None and name.startswith("`"):
+        return name[1:-1].replace("``", "`")
+    return name
+
+
+def _labels(pattern: str) -> Tuple[str, ...]:
+    return tuple(_unescape(label) for label in re.findall(rf":({_NAME})", pattern))
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def _compress(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    indptr = np.zeros(int(keys.max()) + 2 if len(keys) else 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys), out=indptr[1:])
+    return indptr, np.argsort(keys, kind="stable")
+
+
+class _Adjacency:
+    """
+    Relationships of a single type stored in compressed sparse row (CSR) arrays indexed by start and end nodes.
+    Relationships added after the arrays were built are kept in a delta which is merged into the arrays once
+    it grows, so bulk writes do not rebuild the arrays for each statement.
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.starts = array("q")
+        self.ends = array("q")
+        self._built = 0
+        self._outgoing: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._incoming: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._delta_outgoing: Dict[int, List[int]] = {}
+        self._delta_incoming: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, relationship_id: int, start: int, end: int):
+        position = len(self.ids)
+        self.ids.append(relationship_id)
+        self.starts.append(start)
+        self.ends.append(end)
+        self._delta_outgoing.setdefault(start, []).append(position)
+        self._delta_incoming.setdefault(end, []).append(position)
+
+    def _build(self):
+        self._outgoing = _compress(np.frombuffer(self.starts, dtype=np.int64).copy())
+        self._incoming = _compress(np.frombuffer(self.ends, dtype=np.int64).copy())
+        self._built = len(self.ids)
+        self._delta_outgoing.clear()
+        self._delta_incoming.clear()
+
+    def relationships(self, node_id: int, outgoing: bool = True) -> List[int]:
+        """
+        Return ids of relationships starting (or ending if `outgoing` is False) at `node_id` node.
+        """
+        if len(self.ids) - self._built > max(_MIN_DELTA, self._built // 4):
+            self._build()
+        compressed = self._outgoing if outgoing else self._incoming
+        positions = []
+        if compressed is not None and node_id + 1 < len(compressed[0]):
+            indptr, order = compressed
+            positions = order[indptr[node_id]:indptr[node_id + 1]].tolist()
+        positions.extend((self._delta_outgoing if outgoing else self._delta_incoming).get(node_id, ()))
+        return [self.ids[position] for position in positions]
+
+
+class InMemoryCursor:
+    """
+    Records returned by a statement run with :class:`InMemoryGraph`.
+    """
+
+    def __init__(self, keys: List[str], values: Iterable[list] = (), stats: Dict[str, int] = None):
+        self._keys = keys
+        self._records = [Record(keys, row) for row in values]
+        self._stats = stats or {}
+
+    def __iter__(self) -> Iterator[Record]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def plan(self) -> None:
+        """In-memory statements have no execution plans."""
+        return None
+
+    def data(self) -> List[Dict[str, Any]]:
+        return [dict(record) for record in self._records]
+
+    def evaluate(self, field: int = 0) -> Any:
+        return self._records[0][field] if self._records else None
+
+
+class InMemorySchema:
+    """
+    Hash indexes of :class:`InMemoryGraph` with the subset of :class:`py2neo.Schema` interface used by
+    :class:`.PandasGraph`. Only single-property indexes are supported.
+    """
+
+    def __init__(self, graph: "InMemoryGraph"):
+        self._graph = graph
+
+    def get_indexes(self, label: str) -> List[Tuple[str]]:
+        return [(key,) for index_label, key in self._graph._indexes if index_label == label]
+
+    def get_uniqueness_constraints(self, label: str) -> List[str]:
+        return [key for constraint_label, key in self._graph._unique if constraint_label == label]
+
+    def create_index(self, label: str, key: str):
+        self._graph._create_index(label, key)
+
+    def create_uniqueness_constraint(self, label: str, key: str):
+        self._graph._create_index(label, key, unique=True)
+
+
+class InMemoryTransaction:
+    """
+    Transaction of :class:`InMemoryGraph`. Statements are applied immediately (so they are visible to other
+    transactions before the commit) and undone if the transaction is rolled back.
+    """
+
+    def __init__(self, graph: "InMemoryGraph"):
+        self.graph = graph
+        self.closed = False
+        self._undo: Undo = []
+
+    def run(self, query: str, parameters: Dict[str, Any] = None, **kwparameters) -> InMemoryCursor:
+        return self.graph._execute(query, {**(parameters or {}), **kwparameters}, self._undo)
+
+    def evaluate(self, query: str, parameters: Dict[str, Any] = None, **kwparameters) -> Any:
+        return self.run(query, parameters, **kwparameters).evaluate()
+
+    def create(self, subgraph: py2neo.Subgraph):
+        self.graph._create(subgraph, self._undo)
+
+    def commit(self):
+        self._undo.clear()
+        self.closed = True
+
+    def rollback(self):
+        self.graph._undo(self._undo, 0)
+        self.closed = True
+
+
+class InMemoryGraph(GraphBackend):
+    """
+    In-process graph engine which can be used as :class:`.PandasGraph` backend, e.g. in offline pipelines
+    and tests. It answers the statements built by :mod:`pandas2neo4j.queries` and :mod:`py2neo.matching`
+    (other statements raise :class:`.UnsupportedQueryError`), so the methods of :class:`.PandasGraph` work
+    with it as with a database.
+
+    Node properties are stored in columns (a list for each property key indexed by internal ids of nodes),
+    relationships of each type in compressed sparse row (CSR) adjacency arrays and indexes created with
+    :attr:`InMemoryGraph.schema` are hash indexes. Nodes are looked up by properties without an index by
+    scanning all nodes with the label (once per ``IN $keys`` statement), like the database does.
+
+    Statements are serialized with a lock. Transactions are not isolated: their writes are visible before
+    the commit and are undone on rollback.
+
+    Created nodes and relationships can be written to a database with :meth:`InMemoryGraph.flush`.
+    """
+
+    def __init__(self):
+        self.service = f"memory:{id(self):x}"
+        self._lock = threading.RLock()
+        self._node_labels: List[Tuple[str, ...]] = []
+        self._node_alive = bytearray()
+        self._columns: Dict[str, List[Any]] = {}
+        self._label_nodes: Dict[str, List[int]] = {}
+        self._indexes: Dict[Tuple[str, str], Dict[Any, List[int]]] = {}
+        self._unique: Set[Tuple[str, str]] = set()
+        self._relationship_types: List[str] = []
+        self._relationship_starts = array("q")
+        self._relationship_ends = array("q")
+        self._relationship_properties: List[Dict[str, Any]] = []
+        self._relationship_alive = bytearray()
+        self._adjacency: Dict[str, _Adjacency] = {}
+        self._flushed_nodes: Dict[int, int] = {}
+        self._flushed_relationships: Set[int] = set()
+        self._schema = InMemorySchema(self)
+
+    @property
+    def schema(self) -> InMemorySchema:
+        return self._schema
+
+    def begin(self, readonly: bool = False) -> InMemoryTransaction:
+        return InMemoryTransaction(self)
+
+    def run(self, query: str, parameters: Dict[str, Any] = None, **kwparameters) -> InMemoryCursor:
+        return self._execute(query, {**(parameters or {}), **kwparameters}, [])
+
+    def create(self, subgraph: py2neo.Subgraph):
+        self._create(subgraph, [])
+
+    def _undo(self, undo: Undo, size: int):
+        with self._lock:
+            while len(undo) > size:
+                undo.pop()()
+
+    def _execute(self, query: str, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        mode, _, statement = query.partition(" ")
+        if mode == "EXPLAIN":
+            return InMemoryCursor([])
+        if mode != "PROFILE":
+            statement = query
+        for pattern, handler in (
+            (_CREATE_NODES, self._create_nodes),
+            (_MERGE_NODES, self._merge_nodes),
+            (_APPEND_LISTS, self._append_lists),
+            (_RELATIONSHIPS, self._relationships_rows),
+            (_MATCH_BY_KEYS, self._match_by_keys),
+            (_DELETE_BY_KEYS, self._delete_by_keys),
+            (_PROJECT, self._project),
+            (_NODE_MATCH, self._node_match),
+            (_RELATIONSHIP_MATCH, self._relationship_match),
+        ):
+            match = pattern.fullmatch(statement)
+            if match:
+                break
+        else:
+            if " UNION " not in statement and not _RELATIONSHIPS_FOR_NODES.fullmatch(statement):
+                raise UnsupportedQueryError(query)
+            match, handler = statement, self._relationships_for_nodes
+        with self._lock:
+            size = len(undo)
+            try:
+                return handler(match, parameters, undo)
+            except Exception:
+                self._undo(undo, size)
+                raise
+
+    # storage
+
+    def _value(self, node_id: int, key: str) -> Any:
+        column = self._columns.get(key)
+        return column[node_id] if column is not None and node_id < len(column) else None
+
+    def _properties(self, node_id: int) -> Dict[str, Any]:
+        return {
+            key: column[node_id]
+            for key, column in self._columns.items()
+            if node_id < len(column) and column[node_id] is not None
+        }
+
+    def _create_index(self, label: str, key: str, unique: bool = False):
+        with self._lock:
+            index = self._indexes.get((label, key))
+            if index is None:
+                index = self._indexes[(label, key)] = {}
+                for node_id in self._label_nodes.get(label, []):
+                    value = self._value(node_id, key)
+                    if self._node_alive[node_id] and value is not None:
+                        index.setdefault(_hashable(value), []).append(node_id)
+            if unique:
+                for value, node_ids in index.items():
+                    if len(node_ids) > 1:
+                        raise UniquenessConstraintViolationError(label, key, value)
+                self._unique.add((label, key))
+
+    def _check_unique(self, labels: Tuple[str, ...], key: str, value: Any, node_id: int = None):
+        for label in labels:
+            if (label, key) in self._unique:
+                if any(other != node_id for other in self._indexes[(label, key)].get(_hashable(value), ())):
+                    raise UniquenessConstraintViolationError(label, key, value)
+
+    def _index_value(self, node_id: int, key: str, value: Any, add: bool):
+        for label in self._node_labels[node_id]:
+            index = self._indexes.get((label, key))
+            if index is None:
+                continue
+            if add:
+                index.setdefault(_hashable(value), []).append(node_id)
+            else:
+                node_ids = index[_hashable(value)]
+                node_ids.remove(node_id)
+                if not node_ids:
+                    del index[_hashable(value)]
+
+    def _write_node(self, node_id: int, properties: Dict[str, Any]):
+        for key, value in properties.items():
+            previous = self._value(node_id, key)
+            if previous is not None:
+                self._index_value(node_id, key, previous, add=False)
+            column = self._columns.setdefault(key, [])
+            if len(column) <= node_id:
+                column.extend([None] * (node_id + 1 - len(column)))
+            column[node_id] = value
+            if value is not None:
+                self._index_value(node_id, key, value, add=True)
+
+    def _add_node(self, labels: Tuple[str, ...], properties: Dict[str, Any], undo: Undo) -> int:
+        properties = {key: value for key, value in properties.items() if value is not None}
+        for key, value in properties.items():
+            self._check_unique(labels, key, value)
+        node_id = len(self._node_labels)
+        self._node_labels.append(labels)
+        self._node_alive.append(1)
+        for label in labels:
+            self._label_nodes.setdefault(label, []).append(node_id)
+        self._write_node(node_id, properties)
+        undo.append(lambda: self._remove_node(node_id))
+        return node_id
+
+    def _update_node(self, node_id: int, properties: Dict[str, Any], undo: Undo):
+        previous = {key: self._value(node_id, key) for key in properties}
+        for key, value in properties.items():
+            if value is not None and value != previous[key]:
+                self._check_unique(self._node_labels[node_id], key, value, node_id)
+        self._write_node(node_id, properties)
+        undo.append(lambda: self._write_node(node_id, previous))
+
+    def _remove_node(self, node_id: int):
+        for key, value in self._properties(node_id).items():
+            self._index_value(node_id, key, value, add=False)
+        self._node_alive[node_id] = 0
+
+    def _restore_node(self, node_id: int):
+        self._node_alive[node_id] = 1
+        for key, value in self._properties(node_id).items():
+            self._index_value(node_id, key, value, add=True)
+
+    def _delete_node(self, node_id: int, undo: Undo):
+        relationship_ids = [
+            relationship_id
+            for adjacency in self._adjacency.values()
+            for outgoing in (True, False)
+            for relationship_id in adjacency.relationships(node_id, outgoing)
+            if self._relationship_alive[relationship_id]
+        ]
+        for relationship_id in dict.fromkeys(relationship_ids):
+            self._set_relationship_alive(relationship_id, False, undo)
+        self._remove_node(node_id)
+        undo.append(lambda: self._restore_node(node_id))
+
+    def _add_relationship(
+        self, relationship_type: str, start: int, end: int, properties: Dict[str, Any], undo: Undo
+    ) -> int:
+        relationship_id = len(self._relationship_types)
+        self._relationship_types.append(relationship_type)
+        self._relationship_starts.append(start)
+        self._relationship_ends.append(end)
+        self._relationship_properties.append({key: value for key, value in properties.items() if value is not None})
+        self._relationship_alive.append(1)
+        self._adjacency.setdefault(relationship_type, _Adjacency()).add(relationship_id, start, end)
+        undo.append(lambda: self._relationship_alive.__setitem__(relationship_id, 0))
+        return relationship_id
+
+    def _update_relationship(self, relationship_id: int, properties: Dict[str, Any], replace: bool, undo: Undo):
+        previous = self._relationship_properties[relationship_id]
+        updated = {} if replace else dict(previous)
+        updated.update(properties)
+        self._relationship_properties[relationship_id] = {
+            key: value for key, value in updated.items() if value is not None
+        }
+        undo.append(lambda: self._relationship_properties.__setitem__(relationship_id, previous))
+
+    def _set_relationship_alive(self, relationship_id: int, alive: bool, undo: Undo):
+        self._relationship_alive[relationship_id] = int(alive)
+        undo.append(lambda: self._relationship_alive.__setitem__(relationship_id, int(not alive)))
+
+    def _create(self, subgraph: py2neo.Subgraph, undo: Undo):
+        if hasattr(subgraph, "__node__"):
+            subgraph = subgraph.__node__
+        with self._lock:
+            bound = []
+            for node in subgraph.nodes:
+                if node.graph is not self or node.identity is None:
+                    node_id = self._add_node(tuple(node.labels), dict(node), undo)
+                    node.graph, node.identity = self, node_id
+                    bound.append(node)
+            for relationship in subgraph.relationships:
+                if relationship.graph is not self or relationship.identity is None:
+                    relationship_id = self._add_relationship(
+                        type(relationship).__name__,
+                        relationship.start_node.identity,
+                        relationship.end_node.identity,
+                        dict(relationship),
+                        undo,
+                    )
+                    relationship.graph, relationship.identity = self, relationship_id
+                    bound.append(relationship)
+
+            def unbind():
+                for entity in bound:
+                    entity.graph, entity.identity = None, None
+
+            undo.append(unbind)
+
+    # lookups
+
+    def _label_scan(self, labels: Tuple[str, ...]) -> Iterator[int]:
+        if not labels:
+            return (node_id for node_id, alive in enumerate(self._node_alive) if alive)
+        candidates = self._label_nodes.get(labels[0], [])
+        return (
+            node_id
+            for node_id in candidates
+            if self._node_alive[node_id] and all(label in self._node_labels[node_id] for label in labels[1:])
+        )
+
+    def _find_nodes(self, label: Optional[str], key: Optional[str], value: Any) -> List[int]:
+        labels = () if label is None else (label,)
+        if key is None:
+            if (
+                isinstance(value, int)
+                and 0 <= value < len(self._node_labels)
+                and self._node_alive[value]
+                and all(label in self._node_labels[value] for label in labels)
+            ):
+                return [value]
+            return []
+        if value is None:
+            return []
+        index = self._indexes.get((label, key))
+        if index is not None:
+            return list(index.get(_hashable(value), ()))
+        return [node_id for node_id in self._label_scan(labels) if self._value(node_id, key) == value]
+
+    def _find_nodes_in(self, label: str, key: Optional[str], values: List[Any]) -> Iterator[Tuple[Any, int]]:
+        values = dict.fromkeys(_hashable(value) for value in values)
+        if key is None or (label, key) in self._indexes:
+            return ((value, node_id) for value in values for node_id in self._find_nodes(label, key, value))
+        scanned = ((_hashable(self._value(node_id, key)), node_id) for node_id in self._label_scan((label,)))
+        return ((value, node_id) for value, node_id in scanned if value is not None and value in values)
+
+    def _node(self, node_id: int) -> py2neo.Node:
+        node = py2neo.Node(*self._node_labels[node_id], **self._properties(node_id))
+        node.graph, node.identity = self, node_id
+        return node
+
+    def _relationship(self, relationship_id: int, nodes: Dict[int, py2neo.Node] = None) -> py2neo.Relationship:
+        nodes = {} if nodes is None else nodes
+        start, end = self._relationship_starts[relationship_id], self._relationship_ends[relationship_id]
+        for node_id in (start, end):
+            if node_id not in nodes:
+                nodes[node_id] = self._node(node_id)
+        relationship = py2neo.Relationship(
+            nodes[start],
+            self._relationship_types[relationship_id],
+            nodes[end],
+            **self._relationship_properties[relationship_id],
+        )
+        relationship.graph, relationship.identity = self, relationship_id
+        return relationship
+
+    def _connecting(self, relationship_type: str, start: int, end: int) -> List[int]:
+        adjacency = self._adjacency.get(relationship_type)
+        if adjacency is None:
+            return []
+        return [
+            relationship_id
+            for relationship_id in adjacency.relationships(start)
+            if self._relationship_alive[relationship_id] and self._relationship_ends[relationship_id] == end
+        ]
+
+    # statements
+
+    def _create_nodes(self, match: re.Match, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        labels = _labels(match["labels"])
+        ids = [self._add_node(labels, row, undo) for row in parameters["rows"]]
+        stats = {"nodes_created": len(ids)}
+        if match[0].endswith("AS id"):
+            return InMemoryCursor(["id"], ([node_id] for node_id in ids), stats)
+        return InMemoryCursor(["created"], [[len(ids)]], stats)
+
+    def _merge_nodes(self, match: re.Match, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        label, key = _unescape(match["label"]), _unescape(match["key"])
+        rows, created = [], 0
+        for row in parameters["rows"]:
+            if row["k"] is None:
+                raise NullMergeKeyError(label, key)
+            node_ids = self._find_nodes(label, key, row["k"])
+            if not node_ids:
+                node_ids, created = [self._add_node((label,), {key: row["k"]}, undo)], created + 1
+            for node_id in node_ids:
+                self._update_node(node_id, row["p"], undo)
+            rows.extend((row.get("i"), node_id) for node_id in node_ids)
+        stats = {"nodes_created": created}
+        if match[0].endswith("AS id"):
+            return InMemoryCursor(["i", "id"], rows, stats)
+        return InMemoryCursor(["merged"], [[len(rows)]], stats)
+
+    def _append_lists(self, match: re.Match, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        label, key = _unescape(match["label"]), _unescape(match["key"])
+        names = []
+        for update in re.split(r", (?=n\.)", match["updates"]):
+            update_match = _APPEND_LIST.fullmatch(update)
+            if update_match is None:
+                raise UnsupportedQueryError(match[0])
+            names.append(_unescape(update_match["name"]))
+        node_ids = self._find_nodes(label, key, parameters["key"])
+        created = 0
+        if not node_ids:
+            node_ids, created = [self._add_node((label,), {key: parameters["key"]}, undo)], 1
+        for node_id in node_ids:
+            self._update_node(
+                node_id,
+                {name: list(self._value(node_id, name) or []) + list(parameters["lists"][name]) for name in names},
+                undo,
+            )
+        return InMemoryCursor(["merged"], [[len(node_ids)]], {"nodes_created": created})
+
+    def _relationships_rows(self, match: re.Match, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        relationship_type, operation = _unescape(match["type"]), match["op"]
+        rows, created = [], 0
+        for row in parameters["rows"]:
+            for start in self._find_nodes(_unescape(match["a_label"]), _unescape(match["a_key"]), row["f"]):
+                for end in self._find_nodes(_unescape(match["b_label"]), _unescape(match["b_key"]), row["t"]):
+                    existing = [] if operation == "CREATE" else self._connecting(relationship_type, start, end)
+                    if operation == "MATCH":
+                        rows.extend((row["i"], relationship_id) for relationship_id in existing)
+                        continue
+                    if existing:
+                        relationship_id = existing[0]
+                    else:
+                        relationship_id = self._add_relationship(relationship_type, start, end, {}, undo)
+                        created += 1
+                    if match["set"] is not None:
+                        self._update_relationship(relationship_id, row["p"], match["set"] == "=", undo)
+                    rows.append((row["i"], relationship_id))
+        stats = {"relationships_created": created}
+        returned = match["ret"]
+        if returned.startswith("count"):
+            return InMemoryCursor([returned.split(" AS ")[1]], [[len(rows)]], stats)
+        if returned == "row.i AS i, id(r) AS id":
+            return InMemoryCursor(["i", "id"], ([position, r_id] for position, r_id in rows), stats)
+        if returned == "DISTINCT row.i AS i":
+            return InMemoryCursor(["i"], ([position] for position in dict.fromkeys(i for i, _ in rows)), stats)
+        nodes = {}
+        records = []
+        for position, relationship_id in rows:
+            relationship = self._relationship(relationship_id, nodes)
+            records.append([position, relationship.start_node, relationship, relationship.end_node])
+        return InMemoryCursor(["i", "a", "r", "b"], records, stats)
+
+    def _match_by_keys(self, match: re.Match, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        label, key = _unescape(match["label"]), _unescape(match["key"])
+        found = self._find_nodes_in(label, key, parameters["keys"])
+        if match["ret"] == "id(n) AS id":
+            return InMemoryCursor(["key", "id"], [[value, node_id] for value, node_id in found])
+        if match["value"] is not None:
+            property_key = _unescape(match["value"])
+            return InMemoryCursor(
+                ["key", "value"], [[value, self._value(node_id, property_key)] for value, node_id in found]
+            )
+        records = [[value, self._node(node_id)] for value, node_id in found]
+        return InMemoryCursor(["key", "node"], records)
+
+    def _delete_by_keys(self, match: re.Match, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        label, key = _unescape(match["label"]), _unescape(match["key"])
+        deleted = 0
+        for _, node_id in list(self._find_nodes_in(label, key, parameters["keys"])):
+            self._delete_node(node_id, undo)
+            deleted += 1
+        return InMemoryCursor(["deleted"], [[deleted]], {"nodes_deleted": deleted})
+
+    def _project(self, match: re.Match, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        label, key = _unescape(match["label"]), _unescape(match["key"])
+        node_ids = list(self._label_scan((label,)))
+        if match["cond"] is not None:
+            keyed = [(node_id if key is None else self._value(node_id, key), node_id) for node_id in node_ids]
+            keyed = [(page_key, node_id) for page_key, node_id in keyed if page_key is not None]
+            if match["cond"] == "> $last":
+                keyed = [(page_key, node_id) for page_key, node_id in keyed if page_key > parameters["last"]]
+            if match["paged"]:
+                keyed = sorted(keyed, key=operator.itemgetter(0))[: parameters["limit"]]
+            node_ids = [node_id for _, node_id in keyed]
+        elif match["paged"]:
+            node_ids = node_ids[: parameters["limit"]]
+        fields = list(_FIELD.finditer(match["fields"]))
+        if ", ".join(field[0] for field in fields) != match["fields"]:
+            raise UnsupportedQueryError(match[0])
+        records = []
+        for node_id in node_ids:
+            values = []
+            for field in fields:
+                if field["expr"] == "properties(n)":
+                    values.append(self._properties(node_id))
+                elif field["expr"] == "n":
+                    values.append(self._node(node_id))
+                elif field["key"] is None:
+                    values.append(node_id)
+                else:
+                    values.append(self._value(node_id, _unescape(field["key"])))
+            records.append(values)
+        return InMemoryCursor([field["alias"] for field in fields], records)
+
+    def _node_predicate(self, condition: str, parameters: Dict[str, Any]) -> Callable[[int], bool]:
+        match = _PROPERTY_CONDITION.fullmatch(condition)
+        if match is not None:
+            key = _unescape(match["key"])
+            if match["null"] is not None:
+                is_null = match["null"] == "IS NULL"
+                return lambda node_id: (self._value(node_id, key) is None) == is_null
+            compare = _OPERATORS[match["op"]]
+            argument = parameters[_unescape(match["parameter"])]
+
+            def predicate(node_id: int) -> bool:
+                value = self._value(node_id, key)
+                try:
+                    return value is not None and compare(value, argument)
+                except TypeError:
+                    return False
+
+            return predicate
+        match = _ID_MATCH.fullmatch(condition)
+        if match is not None:
+            if match["id"] is not None:
+                ids = {int(match["id"])}
+            else:
+                ids = {int(node_id) for node_id in match["ids"].split(",") if node_id.strip()}
+            return lambda node_id: node_id in ids
+        raise UnsupportedQueryError(condition)
+
+    def _node_match(self, match: re.Match, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        labels = _labels(match["labels"])
+        conditions = [] if match["where"] is None else match["where"].split(" AND ")
+        predicates = [self._node_predicate(condition, parameters) for condition in conditions]
+        candidates = None
+        for condition in conditions:
+            property_match = _PROPERTY_CONDITION.fullmatch(condition)
+            id_match = _ID_MATCH.fullmatch(condition)
+            if id_match is not None and id_match["id"] is not None:
+                candidates = self._find_nodes(None, None, int(id_match["id"]))
+                break
+            if property_match is not None and property_match["op"] == "=" and labels:
+                key = _unescape(property_match["key"])
+                for label in labels:
+                    if (label, key) in self._indexes:
+                        value = parameters[_unescape(property_match["parameter"])]
+                        candidates = self._find_nodes(label, key, value)
+                        break
+        if candidates is None:
+            candidates = self._label_scan(labels)
+        node_ids = [
+            node_id
+            for node_id in candidates
+            if all(label in self._node_labels[node_id] for label in labels)
+            and all(predicate(node_id) for predicate in predicates)
+        ]
+        if match["ret"] != "_":
+            return InMemoryCursor([match["ret"]], [[len(node_ids)]])
+        node_ids = node_ids[int(match["skip"] or 0):]
+        if match["limit"] is not None:
+            node_ids = node_ids[: int(match["limit"])]
+        return InMemoryCursor(["_"], ([self._node(node_id)] for node_id in node_ids))
+
+    def _relationship_match(self, match: re.Match, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        relationship_type = _unescape(match["type"])
+        relationship_ids = [
+            relationship_id
+            for relationship_id, alive in enumerate(self._relationship_alive)
+            if alive and (relationship_type is None or self._relationship_types[relationship_id] == relationship_type)
+        ]
+        if match["ret"] != "_":
+            return InMemoryCursor([match["ret"]], [[len(relationship_ids)]])
+        relationship_ids = relationship_ids[int(match["skip"] or 0):]
+        if match["limit"] is not None:
+            relationship_ids = relationship_ids[: int(match["limit"])]
+        nodes = {}
+        return InMemoryCursor(
+            ["_"], ([self._relationship(relationship_id, nodes)] for relationship_id in relationship_ids)
+        )
+
+    def _relationships_for_nodes(self, statement: str, parameters: Dict[str, Any], undo: Undo) -> InMemoryCursor:
+        found = {}
+        for part in statement.split(" UNION "):
+            match = _RELATIONSHIPS_FOR_NODES.fullmatch(part)
+            if match is None:
+                raise UnsupportedQueryError(statement)
+            conditions = []
+            for condition in match["where"].split(" AND "):
+                condition_match = _ID_CONDITION.fullmatch(condition)
+                if condition_match is None:
+                    raise UnsupportedQueryError(statement)
+                conditions.append(
+                    (
+                        condition_match["not"] is None,
+                        condition_match["v"],
+                        set(parameters[condition_match["parameter"]]),
+                    )
+                )
+            anchor = next((condition for condition in conditions if condition[0]), None)
+            if anchor is None:
+                raise UnsupportedQueryError(statement)
+            adjacency = self._adjacency.get(_unescape(match["type"]))
+            if adjacency is None:
+                continue
+            for node_id in anchor[2]:
+                for relationship_id in adjacency.relationships(node_id, outgoing=anchor[1] == "a"):
+                    if not self._relationship_alive[relationship_id]:
+                        continue
+                    ends = {
+                        "a": self._relationship_starts[relationship_id],
+                        "b": self._relationship_ends[relationship_id],
+                    }
+                    if all((ends[variable] in ids) == positive for positive, variable, ids in conditions):
+                        found.setdefault(relationship_id, None)
+        nodes = {}
+        records = []
+        for relationship_id in found:
+            relationship = self._relationship(relationship_id, nodes)
+            records.append([relationship.start_node, relationship, relationship.end_node])
+        return InMemoryCursor(["a", "r", "b"], records)
+
+    # flushing
+
+    def flush(self, graph: "PandasGraph", chunk_size: ChunkSize = 10000) -> IngestionSummary:
+        """
+        Write nodes and relationships created since the previous flush to the database of `graph` with bulk
+        ``UNWIND`` statements (a transaction per chunk). Nodes are created with their labels and properties
+        and relationships between them are matched by internal ids of the written nodes.
+
+        Only creation is propagated: changes of properties of already flushed nodes or relationships and
+        deletions are not written. Relationships of nodes deleted before being flushed are counted as missing.
+
+        :param graph: :class:`.PandasGraph` connected to the database the entities should be written to.
+        :type graph: :class:`.PandasGraph`
+        :param chunk_size: Maximal number of nodes or relationships written within a single transaction. If 0
+            all nodes with the same labels (or relationships of the same type) are written at once.
+        :type chunk_size: Union[int, :class:`.AdaptiveChunkSize`], optional
+        :return: :class:`.IngestionSummary` counting written nodes and relationships.
+        """
+        start = time.perf_counter()
+        with self._lock:
+            node_groups: Dict[Tuple[str, ...], List[Tuple[int, Dict[str, Any]]]] = {}
+            for node_id, alive in enumerate(self._node_alive):
+                if alive and node_id not in self._flushed_nodes:
+                    node_groups.setdefault(self._node_labels[node_id], []).append(
+                        (node_id, self._properties(node_id))
+                    )
+            relationship_groups: Dict[str, List[Tuple[int, int, int, Dict[str, Any]]]] = {}
+            for relationship_id, alive in enumerate(self._relationship_alive):
+                if alive and relationship_id not in self._flushed_relationships:
+                    relationship_groups.setdefault(self._relationship_types[relationship_id], []).append(
+                        (
+                            relationship_id,
+                            self._relationship_starts[relationship_id],
+                            self._relationship_ends[relationship_id],
+                            dict(self._relationship_properties[relationship_id]),
+                        )
+                    )
+        summary = IngestionSummary()
+        for labels, nodes in node_groups.items():
+            query = queries.unwind_create_nodes_query(labels)
+            for chunk in split_sequence(nodes, chunk_size):
+                with measured(chunk_size, chunk):
+                    records = graph._run_in_transaction(query, rows=[properties for _, properties in chunk])
+                for (node_id, _), record in zip(chunk, records):
+                    self._flushed_nodes[node_id] = record["id"]
+                summary.rows += len(chunk)
+                summary.chunks += 1
+                summary.created += len(records)
+        for relationship_type, relationships in relationship_groups.items():
+            query = queries.unwind_create_relationships_query(
+                relationship_type, None, "__id__", None, "__id__", return_ids=False
+            )
+            for chunk in split_sequence(relationships, chunk_size):
+                rows = [
+                    {"f": self._flushed_nodes[start], "t": self._flushed_nodes[end], "p": properties, "i": position}
+                    for position, (_, start, end, properties) in enumerate(chunk)
+                    if start in self._flushed_nodes and end in self._flushed_nodes
+                ]
+                with measured(chunk_size, chunk):
+                    created = graph._run_in_transaction(query, rows=rows)[0]["created"] if rows else 0
+                self._flushed_relationships.update(relationship_id for relationship_id, *_ in chunk)
+                summary.rows += len(chunk)
+                summary.chunks += 1
+                summary.created += created
+                summary.missing += len(chunk) - created
+        summary.elapsed = time.perf_counter() - start
+        return summary
+
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+import threading
+from typing import Hashable, Optional, Tuple
+
+import py2neo
+
+NodeKey = Tuple[str, str, Hashable]
+
+
+class NodeCache:
+    """
+    Bounded LRU cache of :class:`py2neo.Node` objects used by :class:`.PandasGraph` to resolve nodes
+    without querying the database.
+
+    Nodes are identified with `(label, id_key, id_value)` tuples, where `id_key` is the name of the property
+    used to find the node and `id_value` is the property's value. Only found nodes are stored, so a node created
+    after an unsuccessful lookup will be fetched from the graph when requested again.
+
+    :param maxsize: Maximal number of stored nodes. When exceeded the least recently used node is dropped.
+    :type maxsize: int
+    """
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._nodes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, key: NodeKey) -> bool:
+        return key in self._nodes
+
+    def get(self, key: NodeKey) -> Optional[py2neo.Node]:
+        """
+        Return the node stored for `key` or None if it is not available in the cache.
+
+        :param key: `(label, id_key, id_value)` tuple identifying the node.
+        :type key: Tuple[str, str, Hashable]
+        """
+        with self._lock:
+            node = self._nodes.get(key)
+            if node is not None:
+                self._nodes.move_to_end(key)
+            return node
+
+    def put(self, key: NodeKey, node: py2neo.Node):
+        """
+        Store `node` for given `key`.
+
+        :param key: `(label, id_key, id_value)` tuple identifying the node.
+        :type key: Tuple[str, str, Hashable]
+        :param node: node that should be stored.
+        :type node: :class:`py2neo.Node`
+        """
+        with self._lock:
+            self._nodes[key] = node
+            self._nodes.move_to_end(key)
+            while len(self._nodes) > self.maxsize:
+                self._nodes.popitem(last=False)
+
+    def invalidate(self, label: str = None):
+        """
+        Drop stored nodes. If `label` is used only nodes with given label are dropped.
+
+        :param label: label of nodes that should be dropped.
+        :type label: str, optional
+        """
+        with self._lock:
+            if label is None:
+                self._nodes.clear()
+                return
+            for key in [key for key in self._nodes if key[0] == label]:
+                del self._nodes[key]
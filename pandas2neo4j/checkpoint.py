@@ -0,0 +1,252 @@
+from abc import ABC, abstractmethod
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pandas2neo4j import queries
+
+if TYPE_CHECKING:
+    from pandas2neo4j.pandas_graph import PandasGraph
+
+Range = Tuple[int, int]
+Statement = Tuple[str, Dict[str, Any]]
+
+
+class CheckpointStore(ABC):
+    """
+    Persistent storage of row ranges committed by named load jobs, used by :class:`.PandasGraph` bulk methods
+    to resume an interrupted load (see their `checkpoint` and `job_name` arguments).
+
+    Ranges are `(start, stop)` pairs of positions of rows (counted from 0 through all the loaded tables)
+    like in :func:`range`, sorted and not overlapping.
+    """
+
+    @abstractmethod
+    def load(self, job: str) -> List[Range]:
+        """
+        Return the ranges committed by `job` (an empty list if the job was not started yet).
+        """
+
+    @abstractmethod
+    def save(self, job: str, ranges: List[Range]):
+        """
+        Replace the ranges committed by `job`.
+        """
+
+    @abstractmethod
+    def clear(self, job: str):
+        """
+        Forget the ranges committed by `job`, so the next load of the job starts from the first row.
+        """
+
+    def transaction_statement(self, graph: "PandasGraph", job: str, ranges: List[Range]) -> Optional[Statement]:
+        """
+        Return a statement (and its parameters) adding `ranges` to the ranges committed by `job`, which can be
+        run by `graph` within the transaction of the chunk, or None if the store is not kept in `graph`. Then
+        the chunk and the record of its rows are committed (or rolled back) together.
+        """
+        return None
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    :class:`CheckpointStore` keeping ranges of all jobs in a local JSON file. The file is replaced atomically
+    on each save, so it is never left partially written.
+
+    :param path: path of the file. It is created on the first save.
+    :type path: str
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, List[List[int]]]:
+        try:
+            with open(self.path) as checkpoint_file:
+                return json.load(checkpoint_file)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, jobs: Dict[str, List[List[int]]]):
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as checkpoint_file:
+            json.dump(jobs, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temporary_path, self.path)
+
+    def load(self, job: str) -> List[Range]:
+        with self._lock:
+            return [(start, stop) for start, stop in self._read().get(job, [])]
+
+    def save(self, job: str, ranges: List[Range]):
+        with self._lock:
+            jobs = self._read()
+            jobs[job] = [[start, stop] for start, stop in ranges]
+            self._write(jobs)
+
+    def clear(self, job: str):
+        with self._lock:
+            jobs = self._read()
+            if jobs.pop(job, None) is not None:
+                self._write(jobs)
+
+
+class NodeCheckpointStore(CheckpointStore):
+    """
+    :class:`CheckpointStore` keeping ranges of each job in a marker node of the loaded graph. The node is
+    labeled with `label`, its `job` property holds the job's name and `starts` and `stops` list properties
+    hold the ranges. If the marker is kept in the loaded graph, the ranges of each chunk are appended to it
+    within the chunk's transaction, so a chunk is never committed without its record (and vice versa).
+
+    :param graph: graph storing the markers, usually the loaded one.
+    :type graph: :class:`.PandasGraph`
+    :param label: label of the marker nodes.
+    :type label: str, optional
+    """
+
+    def __init__(self, graph: "PandasGraph", label: str = "Pandas2Neo4jCheckpoint"):
+        self.graph = graph
+        self.label = label
+
+    def load(self, job: str) -> List[Range]:
+        records = self.graph._run_query(queries.match_nodes_by_keys_query(self.label, "job"), keys=[job])
+        return [
+            (start, stop)
+            for record in records
+            for start, stop in zip(record["node"].get("starts") or [], record["node"].get("stops") or [])
+        ]
+
+    def save(self, job: str, ranges: List[Range]):
+        self.graph._run_in_transaction(
+            queries.unwind_merge_nodes_query(self.label, "job", return_ids=False),
+            rows=[
+                {
+                    "k": job,
+                    "p": {"starts": [start for start, _ in ranges], "stops": [stop for _, stop in ranges]},
+                }
+            ],
+        )
+
+    def clear(self, job: str):
+        self.graph._run_in_transaction(queries.delete_nodes_by_keys_query(self.label, "job"), keys=[job])
+
+    def transaction_statement(self, graph: "PandasGraph", job: str, ranges: List[Range]) -> Optional[Statement]:
+        if graph is not self.graph:
+            return None
+        return (
+            queries.merge_node_append_lists_query(self.label, "job", ["starts", "stops"]),
+            {"key": job, "lists": {"starts": [start for start, _ in ranges], "stops": [stop for _, stop in ranges]}},
+        )
+
+
+def _runs(positions: np.ndarray) -> List[Range]:
+    if len(positions) == 0:
+        return []
+    positions = np.unique(positions)
+    breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+    starts = positions[np.concatenate(([0], breaks))]
+    stops = positions[np.concatenate((breaks - 1, [len(positions) - 1]))] + 1
+    return [(int(start), int(stop)) for start, stop in zip(starts, stops)]
+
+
+def _merge(ranges: Iterable[Range]) -> List[Range]:
+    merged = []
+    for start, stop in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+class Checkpoint:
+    """
+    Progress of a single load job kept in a :class:`CheckpointStore`, used by :class:`.PandasGraph` bulk methods.
+
+    Rows are identified by their positions, so the loaded tables must be the same (and in the same order)
+    each time the job is run. Before the rows are split into chunks the already committed ones are dropped
+    with :meth:`Checkpoint.pending` and the index of the remaining ones is replaced with their positions.
+    Positions of each chunk are then recorded with :meth:`Checkpoint.commit` after its transaction is
+    committed (or within the transaction, if the store provides :meth:`Checkpoint.statement`). Ranges
+    do not depend on the size of chunks, so a job may be resumed with a different (or an adaptive) chunk
+    size, partitioning and number of workers.
+
+    :param store: store of the committed ranges.
+    :type store: :class:`CheckpointStore`
+    :param job: name of the job.
+    :type job: str
+    :ivar skipped: number of rows dropped by :meth:`Checkpoint.pending` as already committed.
+    """
+
+    def __init__(self, store: CheckpointStore, job: str):
+        self.store = store
+        self.job = job
+        self.skipped = 0
+        self._ranges = _merge(store.load(job))
+        self._lock = threading.Lock()
+
+    @property
+    def ranges(self) -> List[Range]:
+        """Committed ranges of the job."""
+        return list(self._ranges)
+
+    def committed(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Return a boolean mask of `positions` which rows were already committed.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        if not self._ranges:
+            return np.zeros(len(positions), dtype=bool)
+        starts, stops = (np.array(bound, dtype=np.int64) for bound in zip(*self._ranges))
+        containing = np.searchsorted(starts, positions, side="right") - 1
+        return (containing >= 0) & (positions < stops[np.maximum(containing, 0)])
+
+    def pending(self, df: pd.DataFrame, offset: int = 0) -> pd.DataFrame:
+        """
+        Return rows of `df` which were not committed yet, indexed with their positions. `offset` is
+        the position of the first row of `df`.
+        """
+        positions = pd.RangeIndex(offset, offset + len(df))
+        mask = self.committed(positions.to_numpy())
+        self.skipped += int(mask.sum())
+        pending = df.set_axis(positions, axis=0)
+        return pending[~mask] if mask.any() else pending
+
+    def iter_pending(self, dfs: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Apply :meth:`Checkpoint.pending` to consecutive tables yielded by `dfs`.
+        """
+        offset = 0
+        for df in dfs:
+            yield self.pending(df, offset)
+            offset += len(df)
+
+    def statement(self, graph: "PandasGraph", positions: Iterable[int]) -> Optional[Statement]:
+        """
+        Return the statement recording rows at `positions` within a transaction of `graph`
+        (see :meth:`CheckpointStore.transaction_statement`), or None if the store does not provide it.
+        """
+        runs = _runs(np.asarray(positions, dtype=np.int64))
+        return self.store.transaction_statement(graph, self.job, runs) if runs else None
+
+    def commit(self, positions: Iterable[int], saved: bool = False):
+        """
+        Record rows at `positions` as committed and save the ranges in the store, unless they were already
+        `saved` with :meth:`Checkpoint.statement`.
+        """
+        runs = _runs(np.asarray(positions, dtype=np.int64))
+        if not runs:
+            return
+        with self._lock:
+            self._ranges = _merge(self._ranges + runs)
+            if not saved:
+                self.store.save(self.job, self._ranges)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(job={self.job!r}, ranges={len(self._ranges)})"
@@ -0,0 +1,176 @@
+from contextlib import contextmanager
+import threading
+import time
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
+
+import pandas as pd
+
+from pandas2neo4j.errors import InvalidArgumentsConfigurationError
+from pandas2neo4j.instrumentation import payload_size
+from pandas2neo4j.pandas_model import dataframe_to_records
+
+
+class AdaptiveChunkSize:
+    """
+    Chunk size adjusted after each written chunk (or read page) to keep the latency of transactions close to
+    `target_latency` seconds and, if `target_bytes` is used, the size of their parameters below `target_bytes`.
+    Pass it as `chunk_size` argument of :class:`.PandasGraph` methods instead of a fixed number of rows.
+
+    After each chunk its rows per second (and bytes per row) are measured and the size that would hit the targets
+    is computed. The size moves towards it by `smoothing` fraction of the difference, growing at most
+    `max_growth` times per chunk, and stays within `min_size` and `max_size`. Tables with narrow rows get large
+    chunks while wide rows or a loaded database lead to smaller ones. The same object may be passed to several
+    calls to carry the measured size over, and it may be shared by threads writing chunks concurrently.
+
+    :param initial_size: Number of rows of the first chunk.
+    :type initial_size: int, optional
+    :param min_size: Minimal number of rows of a chunk.
+    :type min_size: int, optional
+    :param max_size: Maximal number of rows of a chunk.
+    :type max_size: int, optional
+    :param target_latency: Desired time of writing a single chunk in seconds (including the commit). If None
+        only `target_bytes` is used.
+    :type target_latency: float, optional
+    :param target_bytes: Desired size of a chunk's parameters in bytes (estimated as sent with PackStream from
+        a sample of rows). If None the size is not limited by the payload.
+    :type target_bytes: int, optional
+    :param smoothing: Fraction of the difference between the current and the computed size applied after each
+        chunk, in (0, 1].
+    :type smoothing: float, optional
+    :param max_growth: Maximal ratio of consecutive sizes when the size grows.
+    :type max_growth: float, optional
+    """
+
+    sample_rows = 100
+
+    def __init__(
+        self,
+        initial_size: int = 1000,
+        min_size: int = 100,
+        max_size: int = 100000,
+        target_latency: Optional[float] = 1.0,
+        target_bytes: Optional[int] = None,
+        smoothing: float = 0.5,
+        max_growth: float = 2.0,
+    ):
+        if target_latency is None and target_bytes is None:
+            raise InvalidArgumentsConfigurationError("Either `target_latency` or `target_bytes` must be used.")
+        if not 0 < min_size <= max_size:
+            raise InvalidArgumentsConfigurationError("`min_size` must be positive and not greater than `max_size`.")
+        if not 0 < smoothing <= 1:
+            raise InvalidArgumentsConfigurationError("`smoothing` must be in (0, 1] range.")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.target_bytes = target_bytes
+        self.smoothing = smoothing
+        self.max_growth = max_growth
+        self._size = float(min(max(initial_size, min_size), max_size))
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of rows of the next chunk."""
+        return int(round(self._size))
+
+    def observe(self, rows: int, elapsed: float, payload_bytes: int = None):
+        """
+        Adjust the size after a chunk of `rows` rows was processed within `elapsed` seconds.
+
+        :param rows: number of rows of the chunk.
+        :type rows: int
+        :param elapsed: time of writing the chunk (or reading the page) in seconds.
+        :type elapsed: float
+        :param payload_bytes: estimated size of the chunk's parameters in bytes.
+        :type payload_bytes: int, optional
+        """
+        if rows <= 0:
+            return
+        sizes = []
+        if self.target_latency is not None and elapsed > 0:
+            sizes.append(rows * self.target_latency / elapsed)
+        if self.target_bytes is not None and payload_bytes:
+            sizes.append(rows * self.target_bytes / payload_bytes)
+        if not sizes:
+            return
+        with self._lock:
+            size = self._size + self.smoothing * (min(sizes) - self._size)
+            self._size = min(max(size, self.min_size), self._size * self.max_growth, self.max_size)
+
+    def estimate_payload(self, chunk: pd.DataFrame) -> Optional[int]:
+        """
+        Estimate the size in bytes of `chunk` rows sent as statement's parameters from a sample of its rows.
+        Returns None if `target_bytes` is not used.
+        """
+        if self.target_bytes is None or chunk.empty:
+            return None
+        sample = chunk.iloc[: self.sample_rows]
+        return payload_size(dataframe_to_records(sample)) * len(chunk) // len(sample)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={self.size})"
+
+
+ChunkSize = Union[int, AdaptiveChunkSize]
+
+
+def _next_size(chunk_size: ChunkSize, remaining: int) -> int:
+    if isinstance(chunk_size, AdaptiveChunkSize):
+        return chunk_size.size
+    return chunk_size if chunk_size > 0 else remaining
+
+
+def split_dataframe(df: pd.DataFrame, chunk_size: ChunkSize) -> Iterator[pd.DataFrame]:
+    """
+    Split `df` into consecutive chunks of exactly `chunk_size` rows (the last one may be shorter). Chunks are
+    ``iloc`` slices sharing the data of `df`, so no rows are copied. If `chunk_size` is 0 the whole table is
+    a single chunk. If `chunk_size` is an :class:`AdaptiveChunkSize` the size of each chunk is read when the
+    chunk is requested, so it follows the measurements of the previously written chunks. Empty tables
+    have no chunks.
+
+    :param df: split table.
+    :type df: :class:`pandas.DataFrame`
+    :param chunk_size: number of rows of each chunk or :class:`AdaptiveChunkSize`.
+    :type chunk_size: Union[int, :class:`AdaptiveChunkSize`]
+    :return: Iterator of chunks.
+    """
+    start = 0
+    while start < len(df):
+        stop = start + max(_next_size(chunk_size, len(df) - start), 1)
+        yield df.iloc[start:stop]
+        start = stop
+
+
+def split_sequence(items: Sequence[Any], chunk_size: ChunkSize) -> Iterator[Sequence[Any]]:
+    """
+    Variant of :func:`split_dataframe` splitting a list (or other sequence) into slices.
+    """
+    start = 0
+    while start < len(items):
+        stop = start + max(_next_size(chunk_size, len(items) - start), 1)
+        yield items[start:stop]
+        start = stop
+
+
+def iter_dataframes_chunks(dfs: Iterable[pd.DataFrame], chunk_size: ChunkSize) -> Iterator[pd.DataFrame]:
+    """
+    Split each table yielded by `dfs` with :func:`split_dataframe`. Tables are requested one at a time.
+    """
+    for df in dfs:
+        yield from split_dataframe(df, chunk_size)
+
+
+@contextmanager
+def measured(chunk_size: ChunkSize, chunk: Union[pd.DataFrame, Sequence[Any]]) -> Iterator[None]:
+    """
+    Context manager timing processing of `chunk` within its block and reporting it to `chunk_size` if it is
+    an :class:`AdaptiveChunkSize`. The time is not reported if the block raises an exception.
+    """
+    if not isinstance(chunk_size, AdaptiveChunkSize):
+        yield
+        return
+    payload = chunk_size.estimate_payload(chunk) if isinstance(chunk, pd.DataFrame) else None
+    start = time.perf_counter()
+    yield
+    chunk_size.observe(len(chunk), time.perf_counter() - start, payload)
+
@@ -44,3 +44,60 @@ class NotNullPropertyError(Pandas2Neo4jError):
 
 class InvalidArgumentsConfigurationError(Pandas2Neo4jError):
     pass
+
+
+class InvalidDataFrameError(PropertyValueWithInvalidTypeError, NotNullPropertyError):
+    def __init__(self, model_class, invalid_rows=None, null_rows=None):
+        self.model_class = model_class
+        self.invalid_rows = invalid_rows or {}
+        self.null_rows = null_rows or {}
+
+    def __str__(self):
+        if isinstance(self.model_class, str):
+            messages = [f"Table does not match the schema of {self.model_class} nodes."]
+        else:
+            messages = [f"Table does not match the schema of {self.model_class.__name__} model."]
+        for column, rows in self.invalid_rows.items():
+            messages.append(f"Column {column} has values with invalid type in rows: {rows}")
+        for column, rows in self.null_rows.items():
+            messages.append(f"Column {column} cannot contain missing values but is null in rows: {rows}")
+        return "\n".join(messages)
+
+
+class UnsupportedQueryError(Pandas2Neo4jError):
+    def __init__(self, query):
+        self.query = query
+
+    def __str__(self):
+        return f"Statement is not supported by the in-memory graph: {self.query}"
+
+
+class UniquenessConstraintViolationError(Pandas2Neo4jError):
+    def __init__(self, label, key, value):
+        self.label = label
+        self.key = key
+        self.value = value
+
+    def __str__(self):
+        return f"Node with {self.label} label and {self.key} property equal to {self.value!r} already exists."
+
+
+class NullMergeKeyError(Pandas2Neo4jError):
+    def __init__(self, label, key):
+        self.label = label
+        self.key = key
+
+    def __str__(self):
+        return f"Cannot merge node with {self.label} label using null value of {self.key} property."
+
+
+class UnindexedLookupWarning(UserWarning):
+    def __init__(self, label, key):
+        self.label = label
+        self.key = key
+
+    def __str__(self):
+        return (
+            f"Nodes with {self.label} label are looked up by {self.key} property which is not indexed, "
+            f"so each lookup scans the whole label. Use `PandasGraph.ensure_indexes` to create the index."
+        )
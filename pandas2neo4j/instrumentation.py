@@ -0,0 +1,351 @@
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import py2neo
+
+_state = threading.local()
+_lock = threading.Lock()
+
+
+@dataclass
+class Metrics:
+    """
+    Counters describing a single call of :class:`.PandasGraph` method or a single chunk written by such call.
+
+    Bytes are estimated from the sizes of values serialized with PackStream (the serialization format of Bolt
+    protocol), since py2neo does not expose counters of its connections. Statements run by py2neo on behalf of
+    graph objects (e.g. in non-bulk mode) are counted, but their bytes are not estimated.
+
+    :ivar method: name of the called :class:`.PandasGraph` method.
+    :ivar rows: number of processed rows: written rows, rows which nodes or relationships were looked up
+        or rows of exported tables.
+    :ivar chunks: number of written chunks.
+    :ivar queries: number of statements run (retried statements are counted for each attempt).
+    :ivar round_trips: number of requests waiting for the server's response: statements and commits.
+    :ivar records: number of received records.
+    :ivar bytes_sent: estimated size of statements and their parameters.
+    :ivar bytes_received: estimated size of received records.
+    :ivar commit_time: time of waiting for transactions commits in seconds.
+    :ivar construction_time: client CPU time of building rows or graph objects from tables in seconds.
+    :ivar conversion_time: client CPU time of converting received records into tables or graph objects
+        in seconds.
+    :ivar elapsed: wall time of the call or chunk in seconds.
+    """
+    method: str
+    rows: int = 0
+    chunks: int = 0
+    queries: int = 0
+    round_trips: int = 0
+    records: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    commit_time: float = 0.0
+    construction_time: float = 0.0
+    conversion_time: float = 0.0
+    elapsed: float = 0.0
+
+    def add(self, **counters):
+        """
+        Increase counters given as keyword arguments.
+        """
+        for name, value in counters.items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def merge(self, other: "Metrics"):
+        """
+        Add counters of `other` metrics (e.g. of a chunk) to these metrics. `elapsed` time is not added.
+        """
+        for metrics_field in fields(self):
+            if metrics_field.name not in ("method", "elapsed"):
+                self.add(**{metrics_field.name: getattr(other, metrics_field.name)})
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the metrics as a dictionary, e.g. to be exported to a monitoring system.
+        """
+        return asdict(self)
+
+
+class Instrumentation:
+    """
+    Receiver of :class:`Metrics` reported by :class:`.PandasGraph` initialized with `instrumentation` argument.
+    :meth:`Instrumentation.on_chunk` is called after each written chunk and :meth:`Instrumentation.on_call`
+    after each call of an instrumented method (with counters of all its chunks). Override these methods or pass
+    callables to the constructor to export the metrics.
+
+    Chunks may be written by several threads (see `max_workers` arguments), so `on_chunk` should be thread-safe.
+
+    :param on_call: Callable receiving :class:`Metrics` of each call.
+    :type on_call: Callable[[:class:`Metrics`], None], optional
+    :param on_chunk: Callable receiving :class:`Metrics` of each written chunk.
+    :type on_chunk: Callable[[:class:`Metrics`], None], optional
+    """
+    def __init__(
+        self, on_call: Callable[[Metrics], None] = None, on_chunk: Callable[[Metrics], None] = None
+    ):
+        self._on_call = on_call
+        self._on_chunk = on_chunk
+
+    def on_call(self, metrics: Metrics):
+        if self._on_call is not None:
+            self._on_call(metrics)
+
+    def on_chunk(self, metrics: Metrics):
+        if self._on_chunk is not None:
+            self._on_chunk(metrics)
+
+
+class MetricsCollector(Instrumentation):
+    """
+    :class:`Instrumentation` aggregating metrics of all calls per method, e.g. to be periodically exported
+    to a monitoring system with :meth:`MetricsCollector.snapshot`.
+    """
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Metrics] = {}
+        self._calls: Dict[str, int] = {}
+
+    def on_call(self, metrics: Metrics):
+        with self._lock:
+            total = self._totals.setdefault(metrics.method, Metrics(metrics.method))
+            total.merge(metrics)
+            total.elapsed += metrics.elapsed
+            self._calls[metrics.method] = self._calls.get(metrics.method, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return dictionary mapping names of called methods to their aggregated counters (with `calls` counter).
+        """
+        with self._lock:
+            return {
+                method: {**total.as_dict(), "calls": self._calls[method]} for method, total in self._totals.items()
+            }
+
+    def reset(self):
+        """
+        Drop all aggregated metrics.
+        """
+        with self._lock:
+            self._totals.clear()
+            self._calls.clear()
+
+
+def current_call() -> Optional[Metrics]:
+    """
+    Return metrics of the :class:`.PandasGraph` method call executed by the current thread or None. The call is
+    tracked even if the graph has no instrumentation, but then its counters are not collected.
+    """
+    return getattr(_state, "call", None)
+
+
+def current_method() -> Optional[str]:
+    """
+    Return name of the :class:`.PandasGraph` method called by the current thread or None.
+    """
+    call = getattr(_state, "call", None)
+    return None if call is None else call.method
+
+
+def enabled() -> bool:
+    """
+    Check whether metrics are being collected by the current thread.
+    """
+    return getattr(_state, "instrumentation", None) is not None
+
+
+def record(**counters):
+    """
+    Increase counters of the chunk (or the call if no chunk is written) executed by the current thread.
+    Nothing is done if the metrics are not collected.
+    """
+    if getattr(_state, "instrumentation", None) is None:
+        return
+    chunk = getattr(_state, "chunk", None)
+    if chunk is not None:
+        chunk.add(**counters)
+        return
+    with _lock:
+        _state.call.add(**counters)
+
+
+def record_query(query: str, parameters: Dict[str, Any], records: list):
+    """
+    Record a statement run with `parameters` which returned `records`.
+    """
+    if enabled():
+        record(
+            queries=1,
+            round_trips=1,
+            records=len(records),
+            bytes_sent=payload_size(query) + payload_size(parameters),
+            bytes_received=payload_size(records),
+        )
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Context manager recording CPU time of the current thread as `<name>_time` counter.
+    """
+    if not enabled():
+        yield
+        return
+    start = time.thread_time()
+    try:
+        yield
+    finally:
+        record(**{f"{name}_time": time.thread_time() - start})
+
+
+@contextmanager
+def _activated(
+    call: Metrics, chunk: Optional[Metrics], instrumentation: Optional[Instrumentation]
+) -> Iterator[None]:
+    previous = (
+        getattr(_state, "call", None),
+        getattr(_state, "chunk", None),
+        getattr(_state, "instrumentation", None),
+    )
+    _state.call, _state.chunk, _state.instrumentation = call, chunk, instrumentation
+    try:
+        yield
+    finally:
+        _state.call, _state.chunk, _state.instrumentation = previous
+
+
+@contextmanager
+def chunk_metrics(instrumentation: Optional[Instrumentation], call: Optional[Metrics], rows: int) -> Iterator[None]:
+    """
+    Context manager tracking a chunk with `rows` rows written within `call` (possibly by another thread than
+    the one executing the call). If `instrumentation` is used the chunk's metrics are added to `call` and
+    reported with :meth:`Instrumentation.on_chunk` when the chunk is written.
+    """
+    if call is None:
+        yield
+        return
+    if instrumentation is None:
+        with _activated(call, None, None):
+            yield
+        return
+    metrics = Metrics(call.method, rows=rows, chunks=1)
+    start = time.perf_counter()
+    try:
+        with _activated(call, metrics, instrumentation):
+            yield
+    finally:
+        metrics.elapsed = time.perf_counter() - start
+        with _lock:
+            call.merge(metrics)
+        instrumentation.on_chunk(metrics)
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Decorator of :class:`.PandasGraph` methods tracking each call and reporting its metrics to the graph's
+    `instrumentation`. Calls made by a tracked method (in the same thread) are included in its metrics instead of
+    being reported separately. Metrics of generator methods are reported when the generator is exhausted or
+    closed, and their `elapsed` time includes only producing the items.
+    """
+    if inspect.isgeneratorfunction(method):
+
+        @functools.wraps(method)
+        def generator_wrapper(self, *args, **kwargs):
+            iterator = method(self, *args, **kwargs)
+            if current_call() is not None:
+                yield from iterator
+                return
+            metrics = Metrics(method.__name__)
+            try:
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        with _activated(metrics, None, self.instrumentation):
+                            item = next(iterator)
+                    except StopIteration:
+                        return
+                    finally:
+                        metrics.elapsed += time.perf_counter() - start
+                    yield item
+            finally:
+                iterator.close()
+                if self.instrumentation is not None:
+                    self.instrumentation.on_call(metrics)
+
+        return generator_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if current_call() is not None:
+            return method(self, *args, **kwargs)
+        metrics = Metrics(method.__name__)
+        start = time.perf_counter()
+        try:
+            with _activated(metrics, None, self.instrumentation):
+                return method(self, *args, **kwargs)
+        finally:
+            metrics.elapsed = time.perf_counter() - start
+            if self.instrumentation is not None:
+                self.instrumentation.on_call(metrics)
+
+    return wrapper
+
+
+def _header_size(length: int) -> int:
+    if length < 16:
+        return 1
+    if length < 256:
+        return 2
+    if length < 65536:
+        return 3
+    return 5
+
+
+def payload_size(value: Any) -> int:
+    """
+    Estimate size in bytes of `value` serialized with PackStream.
+
+    :param value: value sent as a parameter or received in a record.
+    :return: Estimated number of bytes.
+    """
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, int):
+        if -16 <= value < 128:
+            return 1
+        if -128 <= value < 128:
+            return 2
+        if -32768 <= value < 32768:
+            return 3
+        if -2147483648 <= value < 2147483648:
+            return 5
+        return 9
+    if isinstance(value, float):
+        return 9
+    if isinstance(value, str):
+        length = len(value.encode("utf-8"))
+        return _header_size(length) + length
+    if isinstance(value, (bytes, bytearray)):
+        return _header_size(len(value)) + len(value)
+    if isinstance(value, dict):
+        return _header_size(len(value)) + sum(
+            payload_size(key) + payload_size(item) for key, item in value.items()
+        )
+    if isinstance(value, py2neo.Node):
+        return 2 + payload_size(value.identity) + payload_size(list(value.labels)) + payload_size(dict(value))
+    if isinstance(value, py2neo.Relationship):
+        return (
+            2
+            + payload_size(value.identity)
+            + 2 * payload_size(value.start_node.identity)
+            + payload_size(type(value).__name__)
+            + payload_size(dict(value))
+        )
+    if isinstance(value, (list, tuple)):
+        return _header_size(len(value)) + sum(payload_size(item) for item in value)
+    return payload_size(str(value))
@@ -1,22 +1,142 @@
-from typing import Any, Callable, Iterable, List, Tuple, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import os
+import random
+import sys
+import threading
+import time
+import warnings
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from cached_property import cached_property
+import numpy as np
 import pandas as pd
 import py2neo
 from py2neo import matching
 from py2neo import ogm
-import numpy as np
+from py2neo.errors import ConnectionBroken, ConnectionUnavailable, Neo4jError
 
 import pandas2neo4j
-from pandas2neo4j.pandas_model import PandasModel
+from pandas2neo4j import arrow, instrumentation, queries
+from pandas2neo4j.arrow import ArrowSource
+from pandas2neo4j.backends import GraphBackend
+from pandas2neo4j.cache import NodeCache
+from pandas2neo4j.checkpoint import Checkpoint, CheckpointStore
+from pandas2neo4j.chunking import (
+    AdaptiveChunkSize,
+    ChunkSize,
+    iter_dataframes_chunks,
+    measured,
+    split_dataframe,
+    split_sequence,
+)
+from pandas2neo4j.instrumentation import Instrumentation, instrumented
+from pandas2neo4j.pandas_model import (
+    PandasModel,
+    dataframe_row_hashes,
+    dataframe_to_records,
+    model_properties,
+)
+from pandas2neo4j.profiling import Profiler
+from pandas2neo4j.properties import SchemaProperty
+from pandas2neo4j.summary import IngestionSummary, SyncSummary
 from pandas2neo4j.errors import (
+    InvalidDataFrameError,
     NodeWithIdDoesNotExistError,
     NotSupportedModelClassError,
     InvalidArgumentsConfigurationError,
     RelationshipDoesNotExistError,
+    UnindexedLookupWarning,
 )
 
 
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+
+def _caller_stacklevel() -> int:
+    """
+    Return the `stacklevel` of :func:`warnings.warn` called by the caller of this function pointing at the first
+    frame outside of the package, e.g. the user's call of a public method (regardless of the internal calls
+    leading to the warning).
+    """
+    frame, level = sys._getframe(1), 1
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIRECTORY):
+        frame, level = frame.f_back, level + 1
+    return level
+
+
+def _single_round(chunks: Iterable[pd.DataFrame]) -> List[Iterator[List[pd.DataFrame]]]:
+    return [([chunk] for chunk in chunks)]
+
+
+def _disjoint_cells(partitions: int) -> List[List[Tuple[int, int]]]:
+    """
+    Schedule all cells of a `partitions` x `partitions` grid of relationships which start and end nodes share
+    the partitioning into rounds, so that no partition is used by more than one cell of a round. Pairs of
+    partitions are taken from rounds of a round-robin tournament (each pair in both directions), and the
+    diagonal cells fill the partitions left free by them.
+    """
+    players = list(range(partitions + partitions % 2))
+    rounds = []
+    for _ in range(len(players) - 1):
+        pairs = [(players[i], players[-1 - i]) for i in range(len(players) // 2)]
+        free = [a if b == partitions else b for a, b in pairs if partitions in (a, b)]
+        pairs = [(a, b) for a, b in pairs if partitions not in (a, b)]
+        rounds.append(pairs + [(partition, partition) for partition in free])
+        rounds.append([(b, a) for a, b in pairs])
+        players.insert(1, players.pop())
+    if partitions % 2 == 0:
+        rounds.append([(partition, partition) for partition in range(partitions)])
+    return rounds
+
+
+def _partition_relationships(
+    df: pd.DataFrame,
+    from_key_column: str,
+    to_key_column: str,
+    partitions: int,
+    chunk_size: ChunkSize,
+    same_label: bool = False,
+) -> Iterator[List[List[pd.DataFrame]]]:
+    from_partition = pd.util.hash_pandas_object(df[from_key_column], index=False).to_numpy() % partitions
+    to_partition = pd.util.hash_pandas_object(df[to_key_column], index=False).to_numpy() % partitions
+    if same_label:
+        rounds = _disjoint_cells(partitions)
+    else:
+        rounds = [
+            [(partition, (partition + shift) % partitions) for partition in range(partitions)]
+            for shift in range(partitions)
+        ]
+    for cells in rounds:
+        yield [
+            split_dataframe(df[(from_partition == start) & (to_partition == end)], chunk_size)
+            for start, end in cells
+        ]
+
+
+def _relationship_rounds(
+    dfs: Iterable[pd.DataFrame],
+    from_key_column: str,
+    to_key_column: str,
+    chunk_size: ChunkSize,
+    partitions: int = 1,
+    same_label: bool = False,
+) -> Iterable[Iterable[List[pd.DataFrame]]]:
+    if partitions <= 1:
+        return _single_round(iter_dataframes_chunks(dfs, chunk_size))
+    return (
+        batches
+        for df in dfs
+        for batches in _partition_relationships(
+            df, from_key_column, to_key_column, partitions, chunk_size, same_label
+        )
+    )
+
+
+ChunkResult = Tuple[int, int, int, pd.Series]
+
+
 class PandasGraph(ogm.Repository):
     """
     Class representing the underlying graph.
@@ -25,7 +145,71 @@ class PandasGraph(ogm.Repository):
     by :class:`ogm.Model` and :class:`.PandasModel`) using some data stored in `pandas.DataFrame`
     tables. One can create :class:`.PandasModel` instances and relationships between nodes based
     on rows of given table.
+
+    If `node_cache_size` is positive a :class:`.NodeCache` of such size is used to resolve nodes
+    referenced by their ids (e.g. when creating or matching relationships), so each node is fetched
+    from the database only once. The cache can be filled in advance with :meth:`PandasGraph.prefetch_nodes`.
+
+    Transactions of the bulk methods and of chunks written with :meth:`PandasGraph.create_graph_objects` are retried
+    up to `max_retries` times if they fail with a transient error (e.g. a deadlock between concurrent transactions)
+    or if the connection breaks before the commit is sent (a transaction which connection breaks during the commit
+    may have been committed, so it is never repeated). The n-th retry is delayed by about `retry_delay * 2 ** n`
+    seconds.
+
+    Nodes are looked up by their properties (e.g. `__primarykey__` of a model or `*_id_key` arguments). The first
+    time a label and property pair is used for a lookup its index is checked: if `auto_index` is True a missing
+    index is created (see :meth:`PandasGraph.ensure_indexes`), otherwise an :class:`.UnindexedLookupWarning` is
+    issued if `warn_unindexed` is True.
+
+    If `instrumentation` is used, metrics of each call of the methods operating on the graph and of each chunk
+    written by them (rows, statements, round trips, estimated bytes, commit latency and CPU time of building
+    and converting the data) are reported to it, see :class:`.Instrumentation`. If `profiler` is used a sample
+    of the sent statements is run under `PROFILE` or `EXPLAIN` and their plans are collected, see
+    :class:`.Profiler` and :meth:`PandasGraph.profiling`.
+
+    If `backend` is used it replaces the database connection, e.g. an :class:`.InMemoryGraph` can be used
+    to run the methods in-process. Then `profile`, `name` and other settings are ignored.
+
+    Other arguments are passed to :class:`ogm.Repository` constructor.
     """
+    node_cache = None
+    max_retries = 3
+    retry_delay = 0.1
+    auto_index = False
+    warn_unindexed = True
+    instrumentation = None
+    profiler = None
+    _checked_lookups = None
+    _chunk_statements = None
+
+    def __init__(
+        self,
+        profile=None,
+        name=None,
+        node_cache_size: int = 0,
+        max_retries: int = 3,
+        retry_delay: float = 0.1,
+        auto_index: bool = False,
+        warn_unindexed: bool = True,
+        instrumentation: Instrumentation = None,
+        profiler: Profiler = None,
+        backend: GraphBackend = None,
+        **settings,
+    ):
+        if backend is None:
+            super().__init__(profile, name=name, **settings)
+        else:
+            self.graph = backend
+        if node_cache_size > 0:
+            self.node_cache = NodeCache(node_cache_size)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.auto_index = auto_index
+        self.warn_unindexed = warn_unindexed
+        self.instrumentation = instrumentation
+        self.profiler = profiler
+        self._checked_lookups = set()
+
     @property
     def schema(self) -> py2neo.Schema:
         """
@@ -33,6 +217,63 @@ class PandasGraph(ogm.Repository):
         """
         return self.graph.schema
 
+    def _has_index(self, label: str, key: str) -> bool:
+        return (key,) in self.schema.get_indexes(label) or key in self.schema.get_uniqueness_constraints(label)
+
+    def _check_lookup_index(self, label: str, key: str):
+        if key == "__id__" or not (self.auto_index or self.warn_unindexed):
+            return
+        if self._checked_lookups is None:
+            self._checked_lookups = set()
+        if (label, key) in self._checked_lookups:
+            return
+        self._checked_lookups.add((label, key))
+        if self.auto_index:
+            self.ensure_indexes(label, [key])
+            return
+        try:
+            indexed = self._has_index(label, key)
+        except Neo4jError:
+            return
+        if not indexed:
+            warnings.warn(UnindexedLookupWarning(label, key), stacklevel=_caller_stacklevel())
+
+    def ensure_indexes(
+        self, model_class: Union[ogm.Model, str], keys: Iterable[str] = None, unique: bool = False
+    ) -> List[str]:
+        """
+        Make sure that properties used to look up nodes with `model_class` label are indexed. If `model_class` is
+        an :class:`ogm.Model` subclass its `__primarykey__` is indexed along with `keys`. Indexes are created with
+        the :attr:`PandasGraph.schema` object only for the properties that are not indexed yet.
+
+        :param model_class: either :class:`ogm.Model` subclass or `str` determining the label of indexed nodes.
+        :type model_class: Union[:class:`ogm.Model`, str]
+        :param keys: names of other indexed properties, e.g. used as `*_id_key` or `node_id_property` arguments.
+        :type keys: Iterable[str], optional
+        :param unique: Whether uniqueness constraints (backed by indexes) should be created instead of
+            plain indexes.
+        :type unique: bool, optional
+        :return: List of properties which indexes were created.
+        """
+        label = self._model_label(model_class)
+        keys = list(keys or [])
+        if not isinstance(model_class, str):
+            keys.insert(0, model_class.__primarykey__)
+        if self._checked_lookups is None:
+            self._checked_lookups = set()
+        created = []
+        for key in dict.fromkeys(keys):
+            if key == "__id__":
+                continue
+            if not self._has_index(label, key):
+                if unique:
+                    self.schema.create_uniqueness_constraint(label, key)
+                else:
+                    self.schema.create_index(label, key)
+                created.append(key)
+            self._checked_lookups.add((label, key))
+        return created
+
     @cached_property
     def _node_matcher(self) -> matching.NodeMatcher:
         return matching.NodeMatcher(self.graph)
@@ -41,6 +282,7 @@ class PandasGraph(ogm.Repository):
     def _relationship_matcher(self) -> matching.RelationshipMatcher:
         return matching.RelationshipMatcher(self.graph)
 
+    @instrumented
     def create_graph_object(self, subgraph: Union[ogm.Model, py2neo.Entity]):
         """
         Push object to remote graph
@@ -50,19 +292,375 @@ class PandasGraph(ogm.Repository):
         if hasattr(subgraph, "__node__"):
             subgraph = subgraph.__node__
         self.graph.create(subgraph)
+        instrumentation.record(queries=1, round_trips=1)
+        self._invalidate_node_cache(subgraph.labels)
 
+    @instrumented
     def create_graph_objects(self, objects: Iterable[Union[ogm.Model, py2neo.Entity]]):
         """
-        Push collection of objects to remote graph
+        Push collection of objects to remote graph within a single transaction, which is retried like
+        the transactions of the bulk methods (see :class:`.PandasGraph`).
 
         :param objects: an iterable of either :class:`py2neo.ogm.Model` or :class:`py2neo.Entity` instances.
         """
-        tx = self.graph.begin()
-        for obj in objects:
-            if hasattr(obj, "__node__"):
-                obj = obj.__node__
-            tx.create(obj)
-        tx.commit()
+        subgraphs = [obj.__node__ if hasattr(obj, "__node__") else obj for obj in objects]
+        unbound = [
+            entity
+            for subgraph in subgraphs
+            for entity in (*subgraph.nodes, *subgraph.relationships)
+            if entity.graph is None
+        ]
+
+        def create(tx: Any):
+            # entities bound by a failed attempt do not exist in the graph, so they have to be created again
+            for entity in unbound:
+                entity.graph, entity.identity = None, None
+            for subgraph in subgraphs:
+                tx.create(subgraph)
+                instrumentation.record(queries=1, round_trips=1)
+
+        self._in_transaction(create)
+        self._invalidate_node_cache(
+            set().union(*(subgraph.labels for subgraph in subgraphs if isinstance(subgraph, py2neo.Node)))
+        )
+
+    def _invalidate_node_cache(self, labels: Iterable[str] = None):
+        if self.node_cache is None:
+            return
+        if labels is None:
+            self.node_cache.invalidate()
+            return
+        for label in labels:
+            self.node_cache.invalidate(label)
+
+    def _cached_node(
+        self, label: str, id_key: str, id_value: Any, fetch_node: Callable[[], py2neo.Node]
+    ) -> py2neo.Node:
+        self._check_lookup_index(label, id_key)
+        if self.node_cache is None:
+            instrumentation.record(queries=1, round_trips=1)
+            return fetch_node()
+        key = (label, id_key, id_value)
+        node = self.node_cache.get(key)
+        if node is None:
+            node = fetch_node()
+            instrumentation.record(queries=1, round_trips=1)
+            if node is not None:
+                self.node_cache.put(key, node)
+        return node
+
+    @instrumented
+    def prefetch_nodes(
+        self,
+        df: pd.DataFrame,
+        model_class: Union[ogm.Model, str],
+        key_column: str,
+        id_key: str = None,
+        chunk_size: ChunkSize = 0,
+    ) -> int:
+        """
+        Fill the node cache with nodes referenced by values of `key_column` column of `df` table. The nodes are
+        fetched with a single query per chunk instead of a query per value. The graph must be initialized with
+        positive `node_cache_size`.
+
+        :param df: A table containing ids of nodes that should be cached.
+        :type df: :class:`pandas.DataFrame`
+        :param model_class: Either :class:`ogm.Model` subclass or `str` with label of cached nodes.
+        :type model_class: Union[:class:`ogm.Model`, str]
+        :param key_column: Name of the column containing ids of nodes.
+        :type key_column: str
+        :param id_key: Name of the property that should be used to identify the nodes. If `model_class` is
+            a :class:`ogm.Model` subclass its *__primarykey__* is used by default.
+        :type id_key: str, optional
+        :param chunk_size: Maximal number of ids sent within a single query.
+        :type chunk_size: ChunkSize, optional
+        :return: Number of nodes stored in the cache.
+        """
+        if self.node_cache is None:
+            raise InvalidArgumentsConfigurationError(
+                "Node cache is disabled. Initialize the graph with positive `node_cache_size` to use it."
+            )
+        label = self._model_label(model_class)
+        id_key = self._model_id_key(model_class, id_key)
+        nodes = self._fetch_nodes_by_keys(label, id_key, df[key_column], chunk_size, use_cache=False)
+        return len(nodes)
+
+    def _fetch_nodes_by_keys(
+        self,
+        label: str,
+        id_key: str,
+        keys: pd.Series,
+        chunk_size: ChunkSize = 0,
+        use_cache: bool = True,
+    ) -> Dict[Any, py2neo.Node]:
+        self._check_lookup_index(label, id_key)
+        instrumentation.record(rows=len(keys))
+        nodes = {}
+        keys = keys.dropna().drop_duplicates()
+        if use_cache and self.node_cache is not None:
+            for key in keys:
+                node = self.node_cache.get((label, id_key, key))
+                if node is not None:
+                    nodes[key] = node
+            keys = keys[~keys.isin(list(nodes))]
+        query = queries.match_nodes_by_keys_query(label, id_key)
+        for chunk in split_dataframe(keys.to_frame(), chunk_size):
+            with measured(chunk_size, chunk):
+                records = self._run_query(query, keys=chunk.iloc[:, 0].tolist())
+            for record in records:
+                node = nodes.setdefault(record["key"], record["node"])
+                if self.node_cache is not None:
+                    self.node_cache.put((label, id_key, record["key"]), node)
+        return nodes
+
+    def _match_nodes_for_keys(
+        self, label: str, id_key: str, keys: pd.Series, chunk_size: ChunkSize = 0
+    ) -> pd.Series:
+        nodes = pd.Series(self._fetch_nodes_by_keys(label, id_key, keys, chunk_size), dtype=object)
+        matched = keys.map(nodes) if not nodes.empty else pd.Series(index=keys.index, dtype=object)
+        return matched.astype(object).where(matched.notna(), None)
+
+    def _fetch_node_ids_by_keys(
+        self, label: str, id_key: str, keys: pd.Series, chunk_size: ChunkSize = 0
+    ) -> Dict[Any, int]:
+        return self._fetch_by_keys(
+            queries.match_node_ids_by_keys_query(label, id_key), "id", label, id_key, keys, chunk_size
+        )
+
+    def _fetch_by_keys(
+        self, query: str, field: str, label: str, id_key: str, keys: pd.Series, chunk_size: ChunkSize = 0
+    ) -> Dict[Any, Any]:
+        self._check_lookup_index(label, id_key)
+        values = {}
+        for chunk in split_sequence(keys.dropna().drop_duplicates().tolist(), chunk_size):
+            with measured(chunk_size, chunk):
+                records = self._run_query(query, keys=chunk)
+            for record in records:
+                values.setdefault(record["key"], record[field])
+        return values
+
+    def _resolve_node_ids(
+        self, endpoints: List[Tuple[pd.Series, pd.Series, str]], chunk_size: ChunkSize = 0
+    ) -> List[pd.Series]:
+        requests = pd.concat(
+            [
+                pd.DataFrame({"label": labels.to_numpy(), "id_key": id_key, "key": keys.to_numpy()})
+                for labels, keys, id_key in endpoints
+            ],
+            ignore_index=True,
+        ).dropna()
+        resolved = {
+            (label, id_key): self._fetch_node_ids_by_keys(label, id_key, group["key"], chunk_size)
+            for (label, id_key), group in requests.groupby(["label", "id_key"], sort=False)
+        }
+        results = []
+        for labels, keys, id_key in endpoints:
+            ids = np.full(len(keys), None, dtype=object)
+            groups = pd.DataFrame({"label": labels.to_numpy()}).groupby("label", sort=False).indices
+            for label, positions in groups.items():
+                found = resolved.get((label, id_key))
+                if not found:
+                    continue
+                found_ids = np.array(list(found.values()), dtype=object)
+                matched = pd.Index(list(found)).get_indexer(keys.iloc[positions])
+                ids[positions] = np.where(matched >= 0, found_ids[matched], None)
+            results.append(pd.Series(ids, index=keys.index, dtype=object))
+        return results
+
+    @contextmanager
+    def profiling(self, mode: str = "PROFILE", sample_rate: float = 1.0) -> Iterator[Profiler]:
+        """
+        Context manager profiling statements sent by the graph within its block (see :class:`.Profiler`), e.g.
+        to find out which statements of a slow call scan labels instead of using indexes. The previous
+        :attr:`PandasGraph.profiler` is restored when the block is left.
+
+        :param mode: Either `PROFILE` or `EXPLAIN`.
+        :type mode: str, optional
+        :param sample_rate: Fraction of statements that should be profiled.
+        :type sample_rate: float, optional
+        :return: :class:`.Profiler` collecting plans of the statements.
+        """
+        previous = self.profiler
+        self.profiler = Profiler(mode, sample_rate)
+        try:
+            yield self.profiler
+        finally:
+            self.profiler = previous
+
+    def _execute(
+        self, runner: Any, query: str, parameters: Dict[str, Any]
+    ) -> Tuple[List[py2neo.cypher.Record], py2neo.cypher.Cursor]:
+        profiler = self.profiler
+        if profiler is None or not profiler.sample():
+            cursor = runner.run(query, **parameters)
+            return list(cursor), cursor
+        if profiler.mode == "EXPLAIN":
+            explained = runner.run(f"EXPLAIN {query}", **parameters)
+            instrumentation.record_query(f"EXPLAIN {query}", parameters, [])
+            profiler.add(instrumentation.current_method(), query, explained.plan())
+            cursor = runner.run(query, **parameters)
+            return list(cursor), cursor
+        cursor = runner.run(f"PROFILE {query}", **parameters)
+        records = list(cursor)
+        profiler.add(instrumentation.current_method(), query, cursor.plan())
+        return records, cursor
+
+    def _run_query(self, query: str, **parameters) -> List[py2neo.cypher.Record]:
+        records, _ = self._execute(self.graph, query, parameters)
+        instrumentation.record_query(query, parameters, records)
+        return records
+
+    def _run_in_transaction(self, query: str, **parameters) -> List[py2neo.cypher.Record]:
+        return self._consume_in_transaction(query, parameters)[0]
+
+    def _run_in_transaction_with_stats(
+        self, query: str, **parameters
+    ) -> Tuple[List[py2neo.cypher.Record], Dict[str, int]]:
+        return self._consume_in_transaction(query, parameters)
+
+    def _consume_in_transaction(
+        self, query: str, parameters: Dict[str, Any]
+    ) -> Tuple[List[py2neo.cypher.Record], Dict[str, int]]:
+        def run(tx: Any) -> Tuple[List[py2neo.cypher.Record], Dict[str, int]]:
+            records, cursor = self._execute(tx, query, parameters)
+            instrumentation.record_query(query, parameters, records)
+            return records, cursor.stats()
+
+        return self._in_transaction(run)
+
+    def _in_transaction(self, work: Callable[[Any], Any]) -> Any:
+        # statements of the written chunk (e.g. its checkpoint record) are committed along with it
+        statements = getattr(self._chunk_statements, "pending", None) or []
+        attempt = 0
+        while True:
+            tx = self.graph.begin()
+            committing = False
+            try:
+                result = work(tx)
+                for query, parameters in statements:
+                    records, _ = self._execute(tx, query, parameters)
+                    instrumentation.record_query(query, parameters, records)
+                start = time.perf_counter()
+                committing = True
+                tx.commit()
+                instrumentation.record(round_trips=1, commit_time=time.perf_counter() - start)
+                if statements:
+                    self._chunk_statements.pending = []
+                return result
+            except Neo4jError as error:
+                self._rollback(tx)
+                if attempt >= self.max_retries or not error.should_retry():
+                    raise
+            except (ConnectionBroken, ConnectionUnavailable):
+                self._rollback(tx)
+                if committing or attempt >= self.max_retries:
+                    raise
+            except Exception:
+                self._rollback(tx)
+                raise
+            time.sleep(self.retry_delay * 2 ** attempt * (1 + random.random()))
+            attempt += 1
+
+    @staticmethod
+    def _rollback(tx: Any):
+        if tx.closed:
+            return
+        try:
+            tx.rollback()
+        except (ConnectionBroken, ConnectionUnavailable):
+            pass
+
+    def _write_batches(
+        self,
+        write_chunk: Callable[[pd.DataFrame], Any],
+        rounds: Iterable[Iterable[List[pd.DataFrame]]],
+        max_workers: int = 1,
+        stop_on_error: bool = True,
+        chunk_size: ChunkSize = 0,
+        checkpoint: Checkpoint = None,
+    ) -> Iterator[Tuple[pd.DataFrame, Any]]:
+        call = instrumentation.current_call()
+        if self._chunk_statements is None:
+            self._chunk_statements = threading.local()
+
+        def write_batch(batch: List[pd.DataFrame]) -> List[Tuple[pd.DataFrame, Any]]:
+            results = []
+            for chunk in batch:
+                if chunk.empty:
+                    continue
+                statement = None if checkpoint is None else checkpoint.statement(self, chunk.index)
+                self._chunk_statements.pending = [] if statement is None else [statement]
+                try:
+                    with instrumentation.chunk_metrics(self.instrumentation, call, len(chunk)):
+                        with measured(chunk_size, chunk):
+                            result = write_chunk(chunk)
+                except Exception as error:
+                    results.append((chunk, error))
+                    if stop_on_error:
+                        break
+                    continue
+                finally:
+                    saved = statement is not None and not self._chunk_statements.pending
+                    self._chunk_statements.pending = []
+                if checkpoint is not None:
+                    checkpoint.commit(chunk.index, saved)
+                results.append((chunk, result))
+            return results
+
+        if max_workers <= 1:
+            for batches in rounds:
+                for batch in batches:
+                    yield from write_batch(batch)
+            return
+        with ThreadPoolExecutor(max_workers) as executor:
+            for batches in rounds:
+                pending = deque()
+                for batch in batches:
+                    pending.append(executor.submit(write_batch, batch))
+                    if len(pending) >= 2 * max_workers:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+
+    def _model_label(self, model_class: Union[ogm.Model, str]) -> str:
+        if isinstance(model_class, str):
+            return model_class
+        elif issubclass(model_class, ogm.Model):
+            return model_class.__primarylabel__
+        raise NotSupportedModelClassError
+
+    def _model_id_key(
+        self,
+        model_class: Union[ogm.Model, str],
+        id_key: str,
+        class_argument: str = "model_class",
+        key_argument: str = "id_key",
+    ) -> str:
+        if id_key is not None:
+            return id_key
+        if isinstance(model_class, str):
+            raise InvalidArgumentsConfigurationError(
+                f"If `{class_argument}` is string ('{model_class}' provided) it is assumed to be "
+                f"the label of a `py2neo.Node` object and `{key_argument}` must be defined to match the node."
+            )
+        return model_class.__primarykey__
+
+    def _relationship_endpoints(
+        self,
+        from_model_class: Union[ogm.Model, str],
+        to_model_class: Union[ogm.Model, str],
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+    ) -> Tuple[str, str, str, str]:
+        from_label = self._model_label(from_model_class)
+        from_id_key = self._model_id_key(
+            from_model_class, from_model_id_key, "from_model_class", "from_model_id_key"
+        )
+        to_label = self._model_label(to_model_class)
+        to_id_key = self._model_id_key(to_model_class, to_model_id_key, "to_model_class", "to_model_id_key")
+        self._check_lookup_index(from_label, from_id_key)
+        self._check_lookup_index(to_label, to_id_key)
+        return from_label, from_id_key, to_label, to_id_key
 
     def _get_node_from_model(
         self,
@@ -71,10 +669,17 @@ class PandasGraph(ogm.Repository):
         id_value: Any,
     ) -> py2neo.Node:
         del id_key
-        model_instance = self.get(model_class, id_value)
-        if model_instance is None:
+
+        def fetch_node():
+            model_instance = self.get(model_class, id_value)
+            return None if model_instance is None else model_instance.__node__
+
+        node = self._cached_node(
+            model_class.__primarylabel__, model_class.__primarykey__, id_value, fetch_node
+        )
+        if node is None:
             raise NodeWithIdDoesNotExistError(model_class, id_value)
-        return model_instance.__node__
+        return node
 
     def _get_node_from_str(
         self,
@@ -82,7 +687,12 @@ class PandasGraph(ogm.Repository):
         id_key: str,
         id_value: Any,
     ) -> py2neo.Node:
-        return self.graph.nodes.match(model_class, **{id_key: id_value}).first()
+        return self._cached_node(
+            model_class,
+            id_key,
+            id_value,
+            lambda: self.graph.nodes.match(model_class, **{id_key: id_value}).first(),
+        )
 
     def _node_getter(self, model_class: Union[ogm.Model, str]) -> Callable:
         if type(model_class) is str:
@@ -118,6 +728,7 @@ class PandasGraph(ogm.Repository):
             raise NodeWithIdDoesNotExistError()
         return py2neo.Relationship(from_node, relationship, to_node)
 
+    @instrumented
     def create_relationships_from_dataframe(
         self,
         df: pd.DataFrame,
@@ -128,8 +739,14 @@ class PandasGraph(ogm.Repository):
         to_key_column: str,
         from_model_id_key: str = None,
         to_model_id_key: str = None,
-        chunk_size: int = 0,
-    ) -> pd.Series:
+        chunk_size: ChunkSize = 0,
+        bulk: bool = False,
+        return_ids: bool = True,
+        max_workers: int = 1,
+        partition: bool = False,
+        checkpoint: CheckpointStore = None,
+        job_name: str = None,
+    ) -> Union[pd.Series, IngestionSummary]:
         """
         Create relationships of type `relationship` between instances of `from_model_class` and `to_model_class`.
         Return a :class:`pandas.Series` of :class:`py2neo.Relationship` objects that represent each relationship
@@ -143,8 +760,35 @@ class PandasGraph(ogm.Repository):
         `ogm.Model` but a string with node label is provided instead.
 
         `chunk_size` parameter can be used if the `df` table is large. It specifies the maximal number of relationships
-        than can be created within a single transaction. Note that `numpy.array_split` function is used to split the
-        table into chunks, so the size of each part may be different than the number specified in the `chunk_size`.
+        than can be created within a single transaction. Chunks are consecutive slices of `df` with exactly `chunk_size`
+        rows (except the last one). Pass an :class:`.AdaptiveChunkSize` instead of a number to adjust the size to
+        the measured latency of the transactions.
+
+        If `bulk` is True the nodes are not fetched from the graph row by row. Instead the key pairs of each chunk
+        are sent as a single parameter list of a ``UNWIND ... MATCH (a:From {key: row.f}), (b:To {key: row.t})
+        CREATE (a)-[:REL]->(b)`` statement, so the nodes are resolved by the database. Columns of `df` other than
+        `from_key_column` and `to_key_column` become properties of created relationships. Rows which nodes could
+        not be found do not raise :class:`.NodeWithIdDoesNotExistError` but are counted as `missing` in the
+        returned :class:`.IngestionSummary`.
+
+        If `max_workers` is greater than 1 the chunks are written concurrently by a pool of threads, each chunk
+        within its own transaction. Creating a relationship locks both of its nodes, so concurrent chunks sharing
+        nodes may wait for each other or deadlock (deadlocked transactions are retried, see
+        :class:`.PandasGraph`). With `partition=True` rows are assigned to a `max_workers` x `max_workers` grid
+        by hashes of their start and end keys, and the grid is written in `max_workers` rounds of cells that
+        share neither start nor end keys, so concurrently written chunks never touch the same nodes. If start
+        and end nodes have the same label (e.g. ``(:Person)-[:KNOWS]->(:Person)``) a node may be both a start
+        and an end node, so the cells are scheduled in about `2 * max_workers` rounds in which no partition of
+        keys is used twice (for either end). This isolates the chunks only if both ends are identified by
+        the same property and the key columns have the same dtype, otherwise the chunks may share nodes and
+        rely on the retries of deadlocked transactions. Rows of the returned :class:`pandas.Series` (or `ids`
+        of the summary) keep their index, but follow the order in which the partitions were written then.
+
+        If `checkpoint` is used (only in the `bulk` mode) positions of the rows of each committed chunk are
+        recorded in it under `job_name`, see :class:`.Checkpoint`. When the call is repeated with the same
+        table and `job_name` after a failure, the recorded rows are skipped (and counted as `skipped` in
+        the summary), so the load continues from the first uncommitted chunk without creating duplicates.
+        `ids` of the summary cover only rows written by the current call then.
 
         :param df: A table with relationships key pairs. Each row should contain ids of already existing nodes in
             `from_key_column` and `to_key_column` columns.
@@ -172,12 +816,85 @@ class PandasGraph(ogm.Repository):
             by default and this parameter can be omitted.
         :type to_model_id_key: str, optional
         :param chunk_size: Maximal number of rows that should be converted into relationships within a single transation.
-        :type chunk_size: int, optional
+        :type chunk_size: ChunkSize, optional
+        :param bulk: Whether relationships should be created with a single statement per chunk with nodes resolved
+            by the database.
+        :type bulk: bool, optional
+        :param return_ids: Used only if `bulk` is True. Determines whether internal ids of created relationships
+            should be collected in the returned summary. Rows which nodes were not found have None id.
+        :type return_ids: bool, optional
+        :param max_workers: Number of threads writing the chunks concurrently.
+        :type max_workers: int, optional
+        :param partition: Whether rows should be partitioned by their keys, so that concurrently written chunks
+            do not share nodes. Used only if `max_workers` is greater than 1.
+        :type partition: bool, optional
+        :param checkpoint: Store recording committed rows, which allows to resume an interrupted load.
+        :type checkpoint: :class:`.CheckpointStore`, optional
+        :param job_name: Name identifying the load in `checkpoint`. Required if `checkpoint` is used.
+        :type job_name: str, optional
         :return: A :class:`pandas.Series` with :class:`py2neo.Relationship` objects for each row in the `df` table.
+            If `bulk` is True an :class:`.IngestionSummary` is returned instead.
         """
-        chunk_num = 1 if chunk_size == 0 else np.ceil(len(df) / chunk_size)
+        job = self._job_checkpoint(checkpoint, job_name, bulk)
+        rounds = _relationship_rounds(
+            [df if job is None else job.pending(df)],
+            from_key_column,
+            to_key_column,
+            chunk_size,
+            max_workers if partition else 1,
+            self._model_label(from_model_class) == self._model_label(to_model_class),
+        )
+        if bulk:
+            summary = self._bulk_create_relationships(
+                rounds,
+                relationship,
+                from_model_class,
+                to_model_class,
+                from_key_column,
+                to_key_column,
+                from_model_id_key,
+                to_model_id_key,
+                return_ids,
+                max_workers=max_workers,
+                chunk_size=chunk_size,
+                checkpoint=job,
+            )
+            return summary if job is None else self._restore_ids_index(summary, df.index)
         all_relationships = []
-        for chunk in np.array_split(df, chunk_num):
+        for chunk, relationships in self._write_batches(
+            lambda chunk: self._create_relationships_objects_chunk(
+                chunk,
+                relationship,
+                from_model_class,
+                to_model_class,
+                from_key_column,
+                to_key_column,
+                from_model_id_key,
+                to_model_id_key,
+            ),
+            rounds,
+            max_workers,
+            chunk_size=chunk_size,
+        ):
+            if isinstance(relationships, Exception):
+                raise relationships
+            all_relationships.append(relationships)
+        if not all_relationships:
+            return pd.Series(dtype=object)
+        return pd.concat(all_relationships)
+
+    def _create_relationships_objects_chunk(
+        self,
+        chunk: pd.DataFrame,
+        relationship: str,
+        from_model_class: Union[ogm.Model, str],
+        to_model_class: Union[ogm.Model, str],
+        from_key_column: str,
+        to_key_column: str,
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+    ) -> pd.Series:
+        with instrumentation.stage("construction"):
             relationships = chunk.apply(
                 lambda row: self._create_relationship(
                     relationship,
@@ -193,16 +910,91 @@ class PandasGraph(ogm.Repository):
                 ),
                 axis=1,
             )
-            self.create_graph_objects(relationships)
-            all_relationships.append(relationships)
-        return pd.concat(all_relationships)
+        self.create_graph_objects(relationships)
+        return relationships
+
+    def _relationship_rows(
+        self, chunk: pd.DataFrame, from_key_column: str, to_key_column: str
+    ) -> List[Dict[str, Any]]:
+        with instrumentation.stage("construction"):
+            keys = dataframe_to_records(chunk[[from_key_column, to_key_column]])
+            properties = dataframe_to_records(chunk.drop(columns=[from_key_column, to_key_column]))
+            return [
+                {"f": key[from_key_column], "t": key[to_key_column], "p": props, "i": position}
+                for position, (key, props) in enumerate(zip(keys, properties))
+            ]
+
+    def _create_relationships_chunk(
+        self,
+        chunk: pd.DataFrame,
+        query: str,
+        from_key_column: str,
+        to_key_column: str,
+        return_ids: bool = True,
+    ) -> ChunkResult:
+        rows = self._relationship_rows(chunk, from_key_column, to_key_column)
+        return self._write_relationship_rows(rows, query, chunk.index, return_ids)
 
+    def _write_relationship_rows(
+        self, rows: List[Dict[str, Any]], query: str, index: pd.Index, return_ids: bool = True
+    ) -> ChunkResult:
+        result = self._run_in_transaction(query, rows=rows)
+        if not return_ids:
+            created = result[0]["created"]
+            return created, 0, max(len(rows) - created, 0), None
+        ids = [None] * len(rows)
+        for record in result:
+            ids[record["i"]] = record["id"]
+        missing = sum(1 for relationship_id in ids if relationship_id is None)
+        return len(result), 0, missing, pd.Series(ids, index=index, dtype=object)
+
+    def _bulk_create_relationships(
+        self,
+        rounds: Iterable[Iterable[List[pd.DataFrame]]],
+        relationship: str,
+        from_model_class: Union[ogm.Model, str],
+        to_model_class: Union[ogm.Model, str],
+        from_key_column: str,
+        to_key_column: str,
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+        return_ids: bool = True,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+        chunk_size: ChunkSize = 0,
+        checkpoint: Checkpoint = None,
+    ) -> IngestionSummary:
+        query = queries.unwind_create_relationships_query(
+            relationship,
+            *self._relationship_endpoints(
+                from_model_class, to_model_class, from_model_id_key, to_model_id_key
+            ),
+            return_ids,
+        )
+        return self._bulk_write(
+            rounds,
+            lambda chunk: self._create_relationships_chunk(
+                chunk, query, from_key_column, to_key_column, return_ids
+            ),
+            return_ids,
+            raise_on_error,
+            max_workers,
+            chunk_size,
+            checkpoint,
+        )
+
+    @instrumented
     def create_nodes_from_dataframe(
         self,
         df: pd.DataFrame,
         model_class: Union[ogm.Model, str],
-        chunk_size: int = 0,
-    ) -> pd.Series:
+        chunk_size: ChunkSize = 0,
+        bulk: bool = False,
+        return_ids: bool = True,
+        max_workers: int = 1,
+        checkpoint: CheckpointStore = None,
+        job_name: str = None,
+    ) -> Union[pd.Series, IngestionSummary]:
         """
         Create graph nodes defined in `df` table. Each row should contain data of a single node.
         `model_class` parameter determines the class/label of :class:`py2neo.ogm.Model`/:class:`py2neo.Node`
@@ -215,12 +1007,26 @@ class PandasGraph(ogm.Repository):
         :class:`py2neo.ogm.Model` instance but not the :class:`.PandasModel` it must provide
         :meth:`from_pandas_series` classmethod that construct a class instance given a :class:`pandas.Series`
         containing a table's row data. If `model_class` is a subclass of :class:`.PandasModel`
-        the :meth:`__init__` will be triggered.
+        each chunk is validated with :meth:`PandasModel.validate_dataframe` and the instances are created
+        from the casted values, so :class:`.InvalidDataFrameError` reporting all invalid rows of the chunk
+        may be raised.
 
         `chunk_size` parameter can be used if the `df` table is large and should be splitted into chunks when
         creating the nodes. It specifies the maximal numbers of graph nodes to be created within a single transaction.
-        `numpy.array_split` function is used for splitting, so the size of each part may be different than
-        the number passed as the parameter.
+        Chunks are consecutive slices of `df` with exactly `chunk_size` rows (except the last one). Pass an
+        :class:`.AdaptiveChunkSize` instead of a number to adjust the size to the measured latency of the transactions.
+
+        If `bulk` is True no Python object is constructed for the rows. Instead each chunk is sent to the
+        graph as a single parameter list of a ``UNWIND $rows AS row CREATE (n:Label) SET n = row`` statement.
+        If `model_class` is a :class:`.PandasModel` subclass its label is used and only the columns matching
+        the model's properties are written, otherwise all the columns are transformed into properties of
+        nodes labeled with `model_class`. In this mode an :class:`.IngestionSummary` is returned.
+
+        If `max_workers` is greater than 1 the chunks are written concurrently by a pool of threads, each chunk
+        within its own transaction.
+
+        If `checkpoint` is used (only in the `bulk` mode) the load can be resumed after a failure by repeating
+        the call with the same `job_name`, see :meth:`PandasGraph.create_relationships_from_dataframe`.
 
         :param df: A table containing data of nodes that should be created.
         :type df: :class:`pandas.DataFrame`
@@ -228,25 +1034,884 @@ class PandasGraph(ogm.Repository):
             be used to construct each object.
         :type model_class: Union[:class:`ogm.Model`, str]
         :param chunk_size: Maximal number of rows that should be converted into nodes within a single transation.
-        :type chunk_size: int, optional
+        :type chunk_size: ChunkSize, optional
+        :param bulk: Whether nodes should be created with a single statement per chunk without constructing
+            node objects.
+        :type bulk: bool, optional
+        :param return_ids: Used only if `bulk` is True. Determines whether internal ids of created nodes should be
+            collected in the returned summary.
+        :type return_ids: bool, optional
+        :param max_workers: Number of threads writing the chunks concurrently.
+        :type max_workers: int, optional
+        :param checkpoint: Store recording committed rows, which allows to resume an interrupted load.
+        :type checkpoint: :class:`.CheckpointStore`, optional
+        :param job_name: Name identifying the load in `checkpoint`. Required if `checkpoint` is used.
+        :type job_name: str, optional
         :return: A :class:`pandas.Series` with node objects of class determined by `model_class` param and properties
-            provided in the `df` table.
+            provided in the `df` table. If `bulk` is True an :class:`.IngestionSummary` is returned instead.
         """
-        chunk_num = 1 if chunk_size == 0 else np.ceil(len(df) / chunk_size)
+        job = self._job_checkpoint(checkpoint, job_name, bulk)
+        rounds = _single_round(split_dataframe(df if job is None else job.pending(df), chunk_size))
+        if bulk:
+            summary = self._bulk_create_nodes(
+                rounds, model_class, return_ids, max_workers=max_workers, chunk_size=chunk_size, checkpoint=job
+            )
+            return summary if job is None else self._restore_ids_index(summary, df.index)
+        if not (
+            isinstance(model_class, str)
+            or issubclass(model_class, PandasModel)
+            or hasattr(model_class, "from_pandas_series")
+        ):
+            raise NotSupportedModelClassError
         all_nodes = []
-        for chunk in np.array_split(df, chunk_num):
+        for chunk, nodes in self._write_batches(
+            lambda chunk: self._create_nodes_objects_chunk(chunk, model_class),
+            rounds,
+            max_workers,
+            chunk_size=chunk_size,
+        ):
+            if isinstance(nodes, Exception):
+                raise nodes
+            all_nodes.append(nodes)
+        if not all_nodes:
+            return pd.Series(dtype=object)
+        return pd.concat(all_nodes)
+
+    def _create_nodes_objects_chunk(
+        self, chunk: pd.DataFrame, model_class: Union[ogm.Model, str]
+    ) -> pd.Series:
+        with instrumentation.stage("construction"):
             if isinstance(model_class, str):
                 nodes = chunk.apply(lambda row: py2neo.Node(model_class, **row), axis=1)
             elif issubclass(model_class, PandasModel):
-                nodes = chunk.apply(model_class, axis=1)
-            elif hasattr(model_class, "from_pandas_series"):
+                nodes = model_class.from_dataframe(chunk)
+            else:
                 nodes = chunk.apply(model_class.from_pandas_series, axis=1)
+        self.create_graph_objects(nodes)
+        return nodes
+
+    def _create_nodes_chunk(
+        self,
+        chunk: pd.DataFrame,
+        model_class: Union[PandasModel, str],
+        return_ids: bool = True,
+    ) -> ChunkResult:
+        with instrumentation.stage("construction"):
+            if isinstance(model_class, str):
+                records = dataframe_to_records(chunk)
+            elif issubclass(model_class, PandasModel):
+                records = dataframe_to_records(model_class.validate_dataframe(chunk), model_class)
             else:
-                raise NotSupportedModelClassError
-            self.create_graph_objects(nodes)
-            all_nodes.append(nodes)
-        return pd.concat(all_nodes)
+                raise NotSupportedModelClassError(
+                    "Bulk nodes creation requires either a label or a `PandasModel` subclass."
+                )
+        return self._write_node_records(records, self._model_label(model_class), chunk.index, return_ids)
 
+    def _write_node_records(
+        self, records: List[Dict[str, Any]], label: str, index: pd.Index, return_ids: bool = True
+    ) -> ChunkResult:
+        result = self._run_in_transaction(
+            queries.unwind_create_nodes_query(label, return_ids), rows=records
+        )
+        self._invalidate_node_cache([label])
+        if not return_ids:
+            return result[0]["created"], 0, 0, None
+        return len(result), 0, 0, pd.Series([record["id"] for record in result], index=index)
+
+    def _bulk_create_nodes(
+        self,
+        rounds: Iterable[Iterable[List[pd.DataFrame]]],
+        model_class: Union[PandasModel, str],
+        return_ids: bool = True,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+        chunk_size: ChunkSize = 0,
+        checkpoint: Checkpoint = None,
+    ) -> IngestionSummary:
+        return self._bulk_write(
+            rounds,
+            lambda chunk: self._create_nodes_chunk(chunk, model_class, return_ids),
+            return_ids,
+            raise_on_error,
+            max_workers,
+            chunk_size,
+            checkpoint,
+        )
+
+    def _bulk_write(
+        self,
+        rounds: Iterable[Iterable[List[pd.DataFrame]]],
+        write_chunk: Callable[[pd.DataFrame], ChunkResult],
+        return_ids: bool = True,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+        chunk_size: ChunkSize = 0,
+        checkpoint: Checkpoint = None,
+    ) -> IngestionSummary:
+        summary = IngestionSummary()
+        start = time.perf_counter()
+        all_ids = []
+        for chunk, result in self._write_batches(
+            write_chunk, rounds, max_workers, raise_on_error, chunk_size, checkpoint
+        ):
+            summary.rows += len(chunk)
+            summary.chunks += 1
+            if isinstance(result, Exception):
+                if raise_on_error:
+                    raise result
+                summary.failures += len(chunk)
+                summary.errors.append(result)
+                continue
+            created, matched, missing, ids = result
+            summary.created += created
+            summary.matched += matched
+            summary.missing += missing
+            if return_ids:
+                all_ids.append(ids)
+        if return_ids:
+            summary.ids = pd.concat(all_ids) if all_ids else pd.Series(dtype=object)
+        if checkpoint is not None:
+            summary.skipped = checkpoint.skipped
+        summary.elapsed = time.perf_counter() - start
+        return summary
+
+    def _job_checkpoint(
+        self, checkpoint: Optional[CheckpointStore], job_name: Optional[str], bulk: bool = True
+    ) -> Optional[Checkpoint]:
+        if checkpoint is None:
+            return None
+        if not job_name:
+            raise InvalidArgumentsConfigurationError("`job_name` is required when `checkpoint` is used.")
+        if not bulk:
+            raise InvalidArgumentsConfigurationError("`checkpoint` can be used only in the `bulk` mode.")
+        return Checkpoint(checkpoint, job_name)
+
+    @staticmethod
+    def _restore_ids_index(summary: IngestionSummary, index: pd.Index) -> IngestionSummary:
+        if summary.ids is not None:
+            summary.ids.index = index.take(summary.ids.index.to_numpy(dtype="int64"))
+        return summary
+
+    @instrumented
+    def create_nodes_from_dataframes(
+        self,
+        dfs: Iterable[pd.DataFrame],
+        model_class: Union[PandasModel, str],
+        chunk_size: ChunkSize = 0,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+        checkpoint: CheckpointStore = None,
+        job_name: str = None,
+    ) -> IngestionSummary:
+        """
+        Streaming variant of :meth:`PandasGraph.create_nodes_from_dataframe` in the `bulk` mode. Create graph nodes
+        defined in each table yielded by `dfs`, which can be any iterable of `pandas.DataFrame` objects, e.g.
+        `pandas.read_csv(..., chunksize=...)` reader or a generator. Each table is written and dropped before the
+        next one is requested and no per-row result is collected, so the memory usage does not depend on the total
+        number of rows.
+
+        If `checkpoint` is used the load can be resumed after a failure by repeating the call with the same
+        tables and `job_name`. Rows are identified by their positions counted through all the tables, so `dfs`
+        must yield the same rows in the same order. Tables are still read, but their committed rows are skipped.
+
+        :param dfs: An iterable of tables containing data of nodes that should be created.
+        :type dfs: Iterable[:class:`pandas.DataFrame`]
+        :param model_class: either :class:`.PandasModel` subclass or `str` determining the label of created nodes.
+        :type model_class: Union[:class:`.PandasModel`, str]
+        :param chunk_size: Maximal number of rows that should be written within a single transaction. If not used
+            each table yielded by `dfs` is written within a single transaction.
+        :type chunk_size: ChunkSize, optional
+        :param raise_on_error: Whether an error raised when writing a chunk should be propagated. If False the error
+            is stored in the returned summary and the ingestion continues with the next chunk.
+        :type raise_on_error: bool, optional
+        :param max_workers: Number of threads writing the chunks concurrently.
+        :type max_workers: int, optional
+        :param checkpoint: Store recording committed rows, which allows to resume an interrupted load.
+        :type checkpoint: :class:`.CheckpointStore`, optional
+        :param job_name: Name identifying the load in `checkpoint`. Required if `checkpoint` is used.
+        :type job_name: str, optional
+        :return: :class:`.IngestionSummary` describing the ingestion.
+        """
+        job = self._job_checkpoint(checkpoint, job_name)
+        return self._bulk_create_nodes(
+            _single_round(iter_dataframes_chunks(dfs if job is None else job.iter_pending(dfs), chunk_size)),
+            model_class,
+            return_ids=False,
+            raise_on_error=raise_on_error,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+            checkpoint=job,
+        )
+
+    @instrumented
+    def create_relationships_from_dataframes(
+        self,
+        dfs: Iterable[pd.DataFrame],
+        relationship: str,
+        from_model_class: Union[ogm.Model, str],
+        to_model_class: Union[ogm.Model, str],
+        from_key_column: str,
+        to_key_column: str,
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+        chunk_size: ChunkSize = 0,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+        partition: bool = False,
+        checkpoint: CheckpointStore = None,
+        job_name: str = None,
+    ) -> IngestionSummary:
+        """
+        Streaming variant of :meth:`PandasGraph.create_relationships_from_dataframe` in the `bulk` mode. Create
+        relationships listed in each table yielded by `dfs`, which can be any iterable of `pandas.DataFrame` objects,
+        e.g. `pandas.read_csv(..., chunksize=...)` reader or a generator. Each table is written and dropped before
+        the next one is requested and no per-row result is collected, so the memory usage does not depend on the
+        total number of rows.
+
+        See :meth:`PandasGraph.create_relationships_from_dataframe` for description of the relationship's parameters
+        and :meth:`PandasGraph.create_nodes_from_dataframes` for description of resuming the load with `checkpoint`.
+
+        :param dfs: An iterable of tables with relationships key pairs.
+        :type dfs: Iterable[:class:`pandas.DataFrame`]
+        :param relationship: Name of the relationship that should be created
+        :type relationship: str
+        :param from_model_class: Either :class:`ogm.Model` subclass or `str` with label of starting nodes.
+        :type from_model_class: Union[:class:`ogm.Model`, str]
+        :param to_model_class: Either :class:`ogm.Model` subclass or `str` with label of ending nodes.
+        :type to_model_class: Union[:class:`ogm.Model`, str]
+        :param from_key_column: Name of the column containing ids of the relationships starting nodes.
+        :type from_key_column: str
+        :param to_key_column: Name of the column containing ids of the relationships ending nodes.
+        :type to_key_column: str
+        :param from_model_id_key: Name of the property that should be used to identify starting nodes.
+        :type from_model_id_key: str, optional
+        :param to_model_id_key: Name of the property that should be used to identify ending nodes.
+        :type to_model_id_key: str, optional
+        :param chunk_size: Maximal number of rows that should be written within a single transaction. If not used
+            each table yielded by `dfs` is written within a single transaction.
+        :type chunk_size: ChunkSize, optional
+        :param raise_on_error: Whether an error raised when writing a chunk should be propagated. If False the error
+            is stored in the returned summary and the ingestion continues with the next chunk.
+        :type raise_on_error: bool, optional
+        :param max_workers: Number of threads writing the chunks concurrently.
+        :type max_workers: int, optional
+        :param partition: Whether rows of each table should be partitioned by their keys, so that concurrently
+            written chunks do not share nodes.
+        :type partition: bool, optional
+        :param checkpoint: Store recording committed rows, which allows to resume an interrupted load.
+        :type checkpoint: :class:`.CheckpointStore`, optional
+        :param job_name: Name identifying the load in `checkpoint`. Required if `checkpoint` is used.
+        :type job_name: str, optional
+        :return: :class:`.IngestionSummary` describing the ingestion.
+        """
+        job = self._job_checkpoint(checkpoint, job_name)
+        return self._bulk_create_relationships(
+            _relationship_rounds(
+                dfs if job is None else job.iter_pending(dfs),
+                from_key_column,
+                to_key_column,
+                chunk_size,
+                max_workers if partition else 1,
+                self._model_label(from_model_class) == self._model_label(to_model_class),
+            ),
+            relationship,
+            from_model_class,
+            to_model_class,
+            from_key_column,
+            to_key_column,
+            from_model_id_key,
+            to_model_id_key,
+            return_ids=False,
+            raise_on_error=raise_on_error,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+            checkpoint=job,
+        )
+
+    @instrumented
+    def create_dynamic_relationships_from_dataframe(
+        self,
+        df: pd.DataFrame,
+        type_column: str,
+        from_model_class: Union[ogm.Model, str, None],
+        to_model_class: Union[ogm.Model, str, None],
+        from_key_column: str,
+        to_key_column: str,
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+        from_label_column: str = None,
+        to_label_column: str = None,
+        chunk_size: ChunkSize = 0,
+        return_ids: bool = True,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+        checkpoint: CheckpointStore = None,
+        job_name: str = None,
+    ) -> IngestionSummary:
+        """
+        Variant of :meth:`PandasGraph.create_relationships_from_dataframe` in the `bulk` mode creating relationships
+        of various types listed in a single table: the type of each relationship is taken from `type_column`
+        column and, if `from_label_column` or `to_label_column` are used, labels of its nodes are taken from these
+        columns instead of `from_model_class` and `to_model_class`.
+
+        Keys of the nodes are grouped by their labels and internal ids of all the referenced nodes are looked up
+        once for each label (with a query per chunk of distinct keys), so nodes shared by rows of various types
+        are resolved only once. Rows are then grouped by their types with a single ``groupby`` and each group is
+        written in chunks of ``UNWIND ... MATCH ... CREATE`` statements matching the nodes by their internal ids,
+        so rows with different labels but the same type share the statements. Rows which nodes were not found
+        (or which label is null) are counted as `missing` in the returned summary. If several nodes with the same
+        label have the same key only one of them is connected.
+
+        Columns other than the key, type and label columns become properties of created relationships. See
+        :meth:`PandasGraph.create_relationships_from_dataframe` for description of `checkpoint` argument.
+
+        :param df: A table with relationships key pairs and types.
+        :type df: :class:`pandas.DataFrame`
+        :param type_column: Name of the column containing types of relationships.
+        :type type_column: str
+        :param from_model_class: Either :class:`ogm.Model` subclass or `str` with label of starting nodes. If
+            `from_label_column` is used it determines only the default `from_model_id_key` and can be None.
+        :type from_model_class: Union[:class:`ogm.Model`, str, None]
+        :param to_model_class: Either :class:`ogm.Model` subclass or `str` with label of ending nodes. If
+            `to_label_column` is used it determines only the default `to_model_id_key` and can be None.
+        :type to_model_class: Union[:class:`ogm.Model`, str, None]
+        :param from_key_column: Name of the column containing ids of the relationships starting nodes.
+        :type from_key_column: str
+        :param to_key_column: Name of the column containing ids of the relationships ending nodes.
+        :type to_key_column: str
+        :param from_model_id_key: Name of the property that should be used to identify starting nodes.
+        :type from_model_id_key: str, optional
+        :param to_model_id_key: Name of the property that should be used to identify ending nodes.
+        :type to_model_id_key: str, optional
+        :param from_label_column: Name of the column containing labels of starting nodes.
+        :type from_label_column: str, optional
+        :param to_label_column: Name of the column containing labels of ending nodes.
+        :type to_label_column: str, optional
+        :param chunk_size: Maximal number of rows that should be written within a single transaction (and
+            of distinct keys looked up with a single query).
+        :type chunk_size: ChunkSize, optional
+        :param return_ids: Whether internal ids of created relationships should be collected in the returned
+            summary. Rows which nodes were not found have None id.
+        :type return_ids: bool, optional
+        :param raise_on_error: Whether an error raised when writing a chunk should be propagated. If False the error
+            is stored in the returned summary and the ingestion continues with the next chunk.
+        :type raise_on_error: bool, optional
+        :param max_workers: Number of threads writing the chunks concurrently.
+        :type max_workers: int, optional
+        :param checkpoint: Store recording committed rows, which allows to resume an interrupted load.
+        :type checkpoint: :class:`.CheckpointStore`, optional
+        :param job_name: Name identifying the load in `checkpoint`. Required if `checkpoint` is used.
+        :type job_name: str, optional
+        :return: :class:`.IngestionSummary` describing the ingestion.
+        """
+        if df[type_column].isna().any():
+            raise InvalidArgumentsConfigurationError(f"Column `{type_column}` with relationship types has null values.")
+        job = self._job_checkpoint(checkpoint, job_name)
+        pending = df if job is None else job.pending(df)
+        endpoints = []
+        for model_class, id_key, key_column, label_column, side in (
+            (from_model_class, from_model_id_key, from_key_column, from_label_column, "from"),
+            (to_model_class, to_model_id_key, to_key_column, to_label_column, "to"),
+        ):
+            if model_class is None and (label_column is None or id_key is None):
+                raise InvalidArgumentsConfigurationError(
+                    f"If `{side}_model_class` is None both `{side}_label_column` and `{side}_model_id_key` "
+                    "must be defined to match the nodes."
+                )
+            if label_column is None:
+                labels = pd.Series(self._model_label(model_class), index=pending.index, dtype=object)
+            else:
+                labels = pending[label_column]
+            id_key = self._model_id_key(model_class, id_key, f"{side}_model_class", f"{side}_model_id_key")
+            endpoints.append((labels, pending[key_column], id_key))
+        from_ids, to_ids = self._resolve_node_ids(endpoints, chunk_size)
+        label_columns = [column for column in (from_label_column, to_label_column) if column is not None]
+        rows = pending.drop(columns=label_columns).assign(**{from_key_column: from_ids, to_key_column: to_ids})
+        resolved = from_ids.notna() & to_ids.notna()
+        queries_by_type = {}
+
+        def write_chunk(chunk: pd.DataFrame) -> ChunkResult:
+            relationship = chunk[type_column].iat[0]
+            if relationship not in queries_by_type:
+                queries_by_type[relationship] = queries.unwind_create_relationships_query(
+                    relationship, None, "__id__", None, "__id__", return_ids
+                )
+            return self._create_relationships_chunk(
+                chunk.drop(columns=[type_column]),
+                queries_by_type[relationship],
+                from_key_column,
+                to_key_column,
+                return_ids,
+            )
+
+        resolved_rows = rows[resolved]
+        groups = resolved_rows.groupby(type_column, sort=False).indices
+        summary = self._bulk_write(
+            _single_round(
+                chunk
+                for positions in groups.values()
+                for chunk in split_dataframe(resolved_rows.iloc[positions], chunk_size)
+            ),
+            write_chunk,
+            return_ids,
+            raise_on_error,
+            max_workers,
+            chunk_size,
+            job,
+        )
+        unresolved = int((~resolved).sum())
+        summary.rows += unresolved
+        summary.missing += unresolved
+        if return_ids:
+            summary.ids = pd.concat([summary.ids, pd.Series(None, index=rows.index[~resolved], dtype=object)])
+        return summary if job is None else self._restore_ids_index(summary, df.index)
+
+    @instrumented
+    def create_nodes_from_arrow(
+        self,
+        source: ArrowSource,
+        model_class: Union[PandasModel, str],
+        chunk_size: ChunkSize = 0,
+        return_ids: bool = False,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+        checkpoint: CheckpointStore = None,
+        job_name: str = None,
+    ) -> IngestionSummary:
+        """
+        Variant of :meth:`PandasGraph.create_nodes_from_dataframes` reading the nodes from Parquet files
+        or Arrow data: `source` is a Parquet file path, a :class:`pyarrow.Table`, a :class:`pyarrow.RecordBatch`
+        or an iterable of them. Requires the `pyarrow` package (``pip install pandas2neo4j[arrow]``).
+
+        Parquet files are memory mapped and read in record batches, reading only the columns matching
+        the properties of `model_class` if it is a :class:`.PandasModel` subclass. Each chunk (a slice of
+        a record batch, see :func:`.arrow.iter_arrow_chunks`) is converted directly to the statement's parameters
+        without constructing a :class:`pandas.DataFrame`. Columns of a :class:`.PandasModel` are cast to
+        the types of its properties with Arrow compute functions, see :func:`.arrow.validate_batch`.
+
+        Rows are identified by their positions in the whole `source`, which index `ids` of the returned
+        summary and are recorded by `checkpoint` (see :meth:`PandasGraph.create_nodes_from_dataframes`).
+
+        :param source: Parquet file path, :class:`pyarrow.Table`, :class:`pyarrow.RecordBatch` or an iterable
+            of them.
+        :type source: ArrowSource
+        :param model_class: either :class:`.PandasModel` subclass or `str` determining the label of created nodes.
+        :type model_class: Union[:class:`.PandasModel`, str]
+        :param chunk_size: Maximal number of rows that should be written within a single transaction. If not used
+            each record batch is written within a single transaction.
+        :type chunk_size: ChunkSize, optional
+        :param return_ids: Whether internal ids of created nodes should be collected in the returned summary.
+        :type return_ids: bool, optional
+        :param raise_on_error: Whether an error raised when writing a chunk should be propagated. If False the error
+            is stored in the returned summary and the ingestion continues with the next chunk.
+        :type raise_on_error: bool, optional
+        :param max_workers: Number of threads writing the chunks concurrently.
+        :type max_workers: int, optional
+        :param checkpoint: Store recording committed rows, which allows to resume an interrupted load.
+        :type checkpoint: :class:`.CheckpointStore`, optional
+        :param job_name: Name identifying the load in `checkpoint`. Required if `checkpoint` is used.
+        :type job_name: str, optional
+        :return: :class:`.IngestionSummary` describing the ingestion.
+        """
+        if not (isinstance(model_class, str) or issubclass(model_class, PandasModel)):
+            raise NotSupportedModelClassError(
+                "Arrow nodes creation requires either a label or a `PandasModel` subclass."
+            )
+        label = self._model_label(model_class)
+        job = self._job_checkpoint(checkpoint, job_name)
+
+        def write_chunk(chunk: arrow.ArrowChunk) -> ChunkResult:
+            with instrumentation.stage("construction"):
+                records = arrow.node_records(chunk, model_class)
+            return self._write_node_records(records, label, chunk.index, return_ids)
+
+        return self._bulk_write(
+            _single_round(arrow.iter_arrow_chunks(source, chunk_size, arrow.model_columns(model_class), job)),
+            write_chunk,
+            return_ids,
+            raise_on_error,
+            max_workers,
+            chunk_size,
+            job,
+        )
+
+    @instrumented
+    def create_relationships_from_arrow(
+        self,
+        source: ArrowSource,
+        relationship: str,
+        from_model_class: Union[ogm.Model, str],
+        to_model_class: Union[ogm.Model, str],
+        from_key_column: str,
+        to_key_column: str,
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+        chunk_size: ChunkSize = 0,
+        return_ids: bool = False,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+        checkpoint: CheckpointStore = None,
+        job_name: str = None,
+    ) -> IngestionSummary:
+        """
+        Variant of :meth:`PandasGraph.create_relationships_from_dataframes` reading the relationships from Parquet
+        files or Arrow data, see :meth:`PandasGraph.create_nodes_from_arrow`. Columns other than `from_key_column`
+        and `to_key_column` become properties of the relationships.
+
+        :param source: Parquet file path, :class:`pyarrow.Table`, :class:`pyarrow.RecordBatch` or an iterable
+            of them.
+        :type source: ArrowSource
+        :param relationship: Name of the relationship that should be created
+        :type relationship: str
+        :param from_model_class: Either :class:`ogm.Model` subclass or `str` with label of starting nodes.
+        :type from_model_class: Union[:class:`ogm.Model`, str]
+        :param to_model_class: Either :class:`ogm.Model` subclass or `str` with label of ending nodes.
+        :type to_model_class: Union[:class:`ogm.Model`, str]
+        :param from_key_column: Name of the column containing ids of the relationships starting nodes.
+        :type from_key_column: str
+        :param to_key_column: Name of the column containing ids of the relationships ending nodes.
+        :type to_key_column: str
+        :param from_model_id_key: Name of the property that should be used to identify starting nodes.
+        :type from_model_id_key: str, optional
+        :param to_model_id_key: Name of the property that should be used to identify ending nodes.
+        :type to_model_id_key: str, optional
+        :param chunk_size: Maximal number of rows that should be written within a single transaction. If not used
+            each record batch is written within a single transaction.
+        :type chunk_size: ChunkSize, optional
+        :param return_ids: Whether internal ids of created relationships should be collected in the returned
+            summary. Rows which nodes were not found have None id.
+        :type return_ids: bool, optional
+        :param raise_on_error: Whether an error raised when writing a chunk should be propagated. If False the error
+            is stored in the returned summary and the ingestion continues with the next chunk.
+        :type raise_on_error: bool, optional
+        :param max_workers: Number of threads writing the chunks concurrently.
+        :type max_workers: int, optional
+        :param checkpoint: Store recording committed rows, which allows to resume an interrupted load.
+        :type checkpoint: :class:`.CheckpointStore`, optional
+        :param job_name: Name identifying the load in `checkpoint`. Required if `checkpoint` is used.
+        :type job_name: str, optional
+        :return: :class:`.IngestionSummary` describing the ingestion.
+        """
+        query = queries.unwind_create_relationships_query(
+            relationship,
+            *self._relationship_endpoints(
+                from_model_class, to_model_class, from_model_id_key, to_model_id_key
+            ),
+            return_ids,
+        )
+        job = self._job_checkpoint(checkpoint, job_name)
+
+        def write_chunk(chunk: arrow.ArrowChunk) -> ChunkResult:
+            with instrumentation.stage("construction"):
+                rows = arrow.relationship_rows(chunk, from_key_column, to_key_column)
+            return self._write_relationship_rows(rows, query, chunk.index, return_ids)
+
+        return self._bulk_write(
+            _single_round(arrow.iter_arrow_chunks(source, chunk_size, checkpoint=job)),
+            write_chunk,
+            return_ids,
+            raise_on_error,
+            max_workers,
+            chunk_size,
+            job,
+        )
+
+    def _upsert_key(self, model_class: Union[PandasModel, str], key_column: str = None) -> str:
+        if isinstance(model_class, str):
+            if key_column is None:
+                raise InvalidArgumentsConfigurationError(
+                    f"If `model_class` is string ('{model_class}' provided) `key_column` must be defined "
+                    "to identify the merged nodes."
+                )
+            return key_column
+        if not issubclass(model_class, PandasModel):
+            raise NotSupportedModelClassError(
+                "Nodes upsert requires either a label or a `PandasModel` subclass."
+            )
+        if key_column is None:
+            if model_class.__primarykey__ == "__id__":
+                raise InvalidArgumentsConfigurationError(
+                    f"{model_class.__name__} has no `__primarykey__` defined, so `key_column` must be used "
+                    "to identify the merged nodes."
+                )
+            return model_class.__primarykey__
+        properties = model_properties(model_class)
+        if key_column not in properties:
+            raise InvalidArgumentsConfigurationError(
+                f"`key_column` ('{key_column}' provided) must be one of {model_class.__name__} properties."
+            )
+        return properties[key_column].key
+
+    @staticmethod
+    def _key_column(model_class: Union[PandasModel, str], key: str) -> str:
+        if isinstance(model_class, str):
+            return key
+        return next((name for name, prop in model_properties(model_class).items() if prop.key == key), key)
+
+    def _upsert_nodes_chunk(
+        self, chunk: pd.DataFrame, model_class: Union[PandasModel, str], key: str, return_ids: bool = True
+    ) -> ChunkResult:
+        with instrumentation.stage("construction"):
+            if isinstance(model_class, str):
+                records = dataframe_to_records(chunk)
+            else:
+                records = dataframe_to_records(model_class.validate_dataframe(chunk), model_class)
+            rows = [{"k": record.get(key), "p": record, "i": position} for position, record in enumerate(records)]
+            null_keys = [row["k"] is None for row in rows]
+            if any(null_keys):
+                raise InvalidDataFrameError(
+                    model_class, null_rows={self._key_column(model_class, key): list(chunk.index[null_keys])}
+                )
+        label = self._model_label(model_class)
+        result, stats = self._run_in_transaction_with_stats(
+            queries.unwind_merge_nodes_query(label, key, return_ids), rows=rows
+        )
+        self._invalidate_node_cache([label])
+        created = stats.get("nodes_created", 0)
+        if not return_ids:
+            return created, result[0]["merged"] - created, 0, None
+        ids = [None] * len(rows)
+        for record in result:
+            ids[record["i"]] = record["id"]
+        return created, len(result) - created, 0, pd.Series(ids, index=chunk.index, dtype=object)
+
+    @instrumented
+    def upsert_nodes_from_dataframe(
+        self,
+        df: pd.DataFrame,
+        model_class: Union[PandasModel, str],
+        key_column: str = None,
+        chunk_size: ChunkSize = 0,
+        return_ids: bool = True,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+    ) -> IngestionSummary:
+        """
+        Create or update graph nodes defined in `df` table, so that loading the same table again does not create
+        duplicates. Each chunk is sent as a single ``UNWIND $rows AS row MERGE (n:Label {key: row.key})
+        SET n += row`` statement: a node with given key is created if it does not exist yet, otherwise its
+        properties are updated with the row's values (properties with missing values are removed).
+
+        If `model_class` is a :class:`.PandasModel` subclass its `__primarykey__` identifies the nodes by default
+        and each chunk is validated with :meth:`PandasModel.validate_dataframe`. If `model_class` is a label
+        all the columns become properties and `key_column` must be used. The key property should be backed by
+        a uniqueness constraint or an index, otherwise each row requires a label scan. Rows with a missing key
+        cannot be merged, so a chunk containing them fails with :class:`.InvalidDataFrameError` before it is sent.
+        If the graph already contains several nodes with the same key all of them are updated (and counted as
+        `matched`), while the returned ids contain one of them for each row.
+
+        :param df: A table containing data of nodes that should be created or updated.
+        :type df: :class:`pandas.DataFrame`
+        :param model_class: either :class:`.PandasModel` subclass or `str` determining the label of the nodes.
+        :type model_class: Union[:class:`.PandasModel`, str]
+        :param key_column: Name of the column identifying the nodes. If `model_class` is a :class:`.PandasModel`
+            subclass the column's property is used.
+        :type key_column: str, optional
+        :param chunk_size: Maximal number of rows that should be written within a single transaction.
+        :type chunk_size: ChunkSize, optional
+        :param return_ids: Determines whether internal ids of created or updated nodes should be collected in the
+            returned summary.
+        :type return_ids: bool, optional
+        :param raise_on_error: Whether an error raised when writing a chunk should be propagated. If False the error
+            is stored in the returned summary and the upsert continues with the next chunk.
+        :type raise_on_error: bool, optional
+        :param max_workers: Number of threads writing the chunks concurrently.
+        :type max_workers: int, optional
+        :return: :class:`.IngestionSummary` with numbers of `created` and `matched` (updated) nodes.
+        """
+        key = self._upsert_key(model_class, key_column)
+        self._check_lookup_index(self._model_label(model_class), key)
+        return self._bulk_write(
+            _single_round(split_dataframe(df, chunk_size)),
+            lambda chunk: self._upsert_nodes_chunk(chunk, model_class, key, return_ids),
+            return_ids,
+            raise_on_error,
+            max_workers,
+            chunk_size,
+        )
+
+    def _upsert_relationships_chunk(
+        self,
+        chunk: pd.DataFrame,
+        query: str,
+        from_key_column: str,
+        to_key_column: str,
+        return_ids: bool = True,
+    ) -> ChunkResult:
+        rows = self._relationship_rows(chunk, from_key_column, to_key_column)
+        result, stats = self._run_in_transaction_with_stats(query, rows=rows)
+        created = stats.get("relationships_created", 0)
+        if not return_ids:
+            merged = result[0]["merged"]
+            return created, merged - created, max(len(rows) - merged, 0), None
+        ids = [None] * len(rows)
+        for record in result:
+            ids[record["i"]] = record["id"]
+        missing = sum(1 for relationship_id in ids if relationship_id is None)
+        return created, len(result) - created, missing, pd.Series(ids, index=chunk.index, dtype=object)
+
+    @instrumented
+    def upsert_relationships_from_dataframe(
+        self,
+        df: pd.DataFrame,
+        relationship: str,
+        from_model_class: Union[ogm.Model, str],
+        to_model_class: Union[ogm.Model, str],
+        from_key_column: str,
+        to_key_column: str,
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+        chunk_size: ChunkSize = 0,
+        return_ids: bool = True,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+        partition: bool = False,
+    ) -> IngestionSummary:
+        """
+        Counterpart of :meth:`PandasGraph.create_relationships_from_dataframe` in the `bulk` mode that does not
+        duplicate existing relationships. Each chunk is sent as a single ``UNWIND ... MATCH ... MERGE
+        (a)-[r:REL]->(b) SET r += row.properties`` statement, so a relationship is created only if its nodes are not
+        connected with `relationship` yet, otherwise its properties are updated. Rows which nodes could not be
+        found are counted as `missing`.
+
+        See :meth:`PandasGraph.create_relationships_from_dataframe` for description of the parameters.
+
+        :return: :class:`.IngestionSummary` with numbers of `created` and `matched` (updated) relationships.
+        """
+        query = queries.unwind_merge_relationships_query(
+            relationship,
+            *self._relationship_endpoints(
+                from_model_class, to_model_class, from_model_id_key, to_model_id_key
+            ),
+            return_ids,
+        )
+        return self._bulk_write(
+            _relationship_rounds(
+                [df],
+                from_key_column,
+                to_key_column,
+                chunk_size,
+                max_workers if partition else 1,
+                self._model_label(from_model_class) == self._model_label(to_model_class),
+            ),
+            lambda chunk: self._upsert_relationships_chunk(
+                chunk, query, from_key_column, to_key_column, return_ids
+            ),
+            return_ids,
+            raise_on_error,
+            max_workers,
+            chunk_size,
+        )
+
+    @instrumented
+    def sync_dataframe(
+        self,
+        df: pd.DataFrame,
+        model_class: Union[PandasModel, str],
+        key_column: str = None,
+        hash_property: str = "_row_hash",
+        delete: bool = False,
+        chunk_size: ChunkSize = 0,
+        raise_on_error: bool = True,
+        max_workers: int = 1,
+    ) -> SyncSummary:
+        """
+        Synchronize nodes with `model_class` label with `df` table, writing only the rows that have changed since
+        the previous synchronization.
+
+        A content hash of each row is computed with :func:`.dataframe_row_hashes` and stored in `hash_property`
+        property of its node. Only hashes of the nodes with keys of `df` are read from the graph (in chunks of
+        `chunk_size` keys), so rows with unknown keys are inserted, rows with different hashes are updated with
+        :meth:`PandasGraph.upsert_nodes_from_dataframe` and the remaining rows are skipped without pulling
+        the nodes' properties. Nodes written without the hash are treated as changed. If `delete` is True keys
+        of the existing nodes are read page by page (with pages of `chunk_size` keys, see
+        :meth:`PandasGraph.iter_graph_nodes`) and nodes which keys are not available in `df` are deleted along
+        with their relationships.
+
+        Nodes are identified as in :meth:`PandasGraph.upsert_nodes_from_dataframe` - with `__primarykey__` of
+        :class:`.PandasModel` subclass or `key_column` values, which must not be missing.
+
+        :param df: A table containing the current data of the nodes.
+        :type df: :class:`pandas.DataFrame`
+        :param model_class: either :class:`.PandasModel` subclass or `str` determining the label of the nodes.
+        :type model_class: Union[:class:`.PandasModel`, str]
+        :param key_column: Name of the column identifying the nodes.
+        :type key_column: str, optional
+        :param hash_property: Name of the property storing hashes of the rows.
+        :type hash_property: str, optional
+        :param delete: Whether nodes which keys are not available in `df` should be deleted.
+        :type delete: bool, optional
+        :param chunk_size: Maximal number of rows that should be written (or keys read or deleted) within a single
+            transaction.
+        :type chunk_size: ChunkSize, optional
+        :param raise_on_error: Whether an error raised when writing a chunk should be propagated.
+        :type raise_on_error: bool, optional
+        :param max_workers: Number of threads writing the chunks concurrently.
+        :type max_workers: int, optional
+        :return: :class:`.SyncSummary` describing the synchronization.
+        """
+        start = time.perf_counter()
+        key = self._upsert_key(model_class, key_column)
+        label = self._model_label(model_class)
+        if isinstance(model_class, str):
+            rows_df = df
+        else:
+            properties = model_properties(model_class)
+            rows_df = model_class.validate_dataframe(df)
+            rows_df = rows_df.rename(columns={col: properties[col].key for col in rows_df.columns})
+        hashes = dataframe_row_hashes(rows_df).to_numpy()
+        keys = rows_df[key]
+
+        stored = self._fetch_by_keys(
+            queries.match_node_values_by_keys_query(label, key, hash_property), "value", label, key, keys, chunk_size
+        )
+        key_values = keys.to_numpy()
+        exists = np.fromiter((value in stored for value in key_values), dtype=bool, count=len(key_values))
+        stored_hashes = np.array([stored.get(value) for value in key_values], dtype=object)
+        changed = exists & (pd.isna(stored_hashes) | (stored_hashes != hashes))
+
+        summary = SyncSummary(rows=len(df))
+        summary.unchanged = int((exists & ~changed).sum())
+        to_write = ~exists | changed
+        positions = np.flatnonzero(to_write)
+        written = self.upsert_nodes_from_dataframe(
+            rows_df.iloc[positions].set_axis(positions, axis=0).assign(**{hash_property: hashes[positions]}),
+            label,
+            key,
+            chunk_size,
+            return_ids=True,
+            raise_on_error=raise_on_error,
+            max_workers=max_workers,
+        )
+        written_positions = written.ids.index.to_numpy(dtype=np.int64)
+        summary.inserted = int((~exists[written_positions]).sum())
+        summary.updated = int(changed[written_positions].sum())
+        summary.failures = written.failures
+        summary.errors = written.errors
+
+        if delete:
+            present = set(key_values.tolist())
+            query = queries.delete_nodes_by_keys_query(label, key)
+            for stored_keys in self._iter_stored_keys(label, key, chunk_size):
+                removed = [value for value in stored_keys if value not in present]
+                for removed_keys in split_sequence(removed, chunk_size):
+                    with measured(chunk_size, removed_keys):
+                        summary.deleted += self._run_in_transaction(query, keys=removed_keys)[0]["deleted"]
+            self._invalidate_node_cache([label])
+        summary.elapsed = time.perf_counter() - start
+        return summary
+
+    def _iter_stored_keys(self, label: str, key: str, chunk_size: ChunkSize = 0) -> Iterator[List[Any]]:
+        if not isinstance(chunk_size, AdaptiveChunkSize) and chunk_size <= 0:
+            records = self._run_query(queries.project_nodes_query(label, [key]))
+            yield [record["p0"] for record in records if record["p0"] is not None]
+            return
+        for records in self._iter_pages(
+            lambda first_page: queries.project_nodes_query(label, [key], key, first_page), chunk_size
+        ):
+            yield [record["p0"] for record in records]
+
+    @instrumented
     def get_graph_models(self, model_class: ogm.Model) -> List[ogm.Model]:
         """
         Return list with all `model_class` objects available in the graph.
@@ -254,8 +1919,10 @@ class PandasGraph(ogm.Repository):
         :param model_class: :class:`ogm.Model` class which objects should be returned.
         :type model_class: :class:`ogm.Model`
         """
+        instrumentation.record(queries=1, round_trips=1)
         return list(model_class.match(self))
 
+    @instrumented
     def get_graph_nodes(self, label: str) -> List[py2neo.Node]:
         """
         Return list with all `py2neo.Node` nodes matching given label availbale in the graph.
@@ -263,8 +1930,10 @@ class PandasGraph(ogm.Repository):
         :param label: label determining nodes to return.
         :type label: str
         """
+        instrumentation.record(queries=1, round_trips=1)
         return list(self._node_matcher.match(label))
 
+    @instrumented
     def get_nodes_for_dataframe(
         self, df: pd.DataFrame, node_label: str, node_id_property: str, id_column_name: str
     ) -> List[py2neo.Node]:
@@ -286,9 +1955,12 @@ class PandasGraph(ogm.Repository):
         :type id_column_name: str
         :return: List with all :class:`py2neo.Node` objects matching the rows of `df` table.
         """
+        self._check_lookup_index(node_label, node_id_property)
+        instrumentation.record(rows=len(df), queries=1, round_trips=1)
         match_condition = {node_id_property: matching.IN(df[id_column_name])}
         return list(self._node_matcher.match(node_label, **match_condition).all())
 
+    @instrumented
     def get_nodes_models_for_dataframe(
         self,
         df: pd.DataFrame,
@@ -325,83 +1997,183 @@ class PandasGraph(ogm.Repository):
         """
         if node_id_property is None:
             node_id_property = id_column_name
-        models_column = pd.Series(
-            self.get_nodes_for_dataframe(df, node_label, node_id_property, id_column_name)
-        ).apply(model_class.wrap)
-        models_dict = {
-            node_id_property: models_column.apply(lambda n: getattr(n, node_id_property)),
-            model_class.__name__: models_column,
-        }
-        return pd.DataFrame(models_dict)
+        nodes = self.get_nodes_for_dataframe(df, node_label, node_id_property, id_column_name)
+        with instrumentation.stage("conversion"):
+            models_column = pd.Series(nodes).apply(model_class.wrap)
+            models_dict = {
+                node_id_property: models_column.apply(lambda n: getattr(n, node_id_property)),
+                model_class.__name__: models_column,
+            }
+            return pd.DataFrame(models_dict)
 
     def _match_model(
         self, model_class: Union[ogm.Model, str], **match_condition
     ) -> Union[ogm.Model, py2neo.Node]:
         if isinstance(model_class, str):
-            return self._node_matcher.match(model_class).first()
-        return model_class.match(self).where(**match_condition).first()
+            if len(match_condition) != 1:
+                return self._node_matcher.match(model_class, **match_condition).first()
+            ((id_key, id_value),) = match_condition.items()
+            return self._get_node_from_str(model_class, id_key, id_value)
+        if len(match_condition) != 1:
+            return model_class.match(self).where(**match_condition).first()
+        ((id_key, id_value),) = match_condition.items()
+
+        def fetch_node():
+            model_instance = model_class.match(self).where(**match_condition).first()
+            return None if model_instance is None else model_instance.__node__
 
+        return model_class.wrap(
+            self._cached_node(model_class.__primarylabel__, id_key, id_value, fetch_node)
+        )
+
+    @instrumented
     def get_models_for_dataframe(
         self,
         df: pd.DataFrame,
-        model_class: ogm.Model,
+        model_class: Union[ogm.Model, str],
         id_column_name: str,
         node_id_property: str = None,
+        chunk_size: ChunkSize = 0,
     ) -> pd.DataFrame:
         """
         Get all available `model_class` nodes matching rows of `df` table. For each row of the table
         return a single `model_class` object or None if a row could not be mapped to one of the graph's
         nodes.
 
+        Distinct values of `id_column_name` column are sent to the graph with a single ``IN`` query per chunk
+        and the matched nodes are joined back with the rows of `df` table, so the order of rows is preserved.
+        If `model_class` is a label string :class:`py2neo.Node` objects are returned instead of models.
+
         :param df: a table which rows describe nodes that should be found in the graph.
         :type df: :class:`pandas.DataFrame`
-        :param model_class: the :class:`ogm.Model` which models should be matched and returned.
-        :type model_class: :class:`ogm.Model`
+        :param model_class: the :class:`ogm.Model` which models should be matched and returned or label of
+            matched nodes.
+        :type model_class: Union[:class:`ogm.Model`, str]
         :param id_column_name: name of `df` table's column which values should be matched with
             `node_id_property` property of nodes.
         :type id_column_name: str
         :param node_id_property: name of property that should be use to determine whether a particular
             node maps to a row of `df` table. If not provided map by property named with `id_column_name`.
         :type node_id_property: str, optional
+        :param chunk_size: Maximal number of distinct ids sent within a single query.
+        :type chunk_size: ChunkSize, optional
         :return: :class:`pandas.DataFrame` table which one column is a duplicate of df[id_column_name] and
             the other contains corresponding `model_class` objects.
         """
         if node_id_property is None:
             node_id_property = id_column_name
-        models_df = df[[id_column_name]]
-        models_df[model_class.__name__] = df[id_column_name].apply(
-            lambda id_value: self._match_model(model_class, **{node_id_property: id_value})
-        )
-        return models_df
+        label = self._model_label(model_class)
+        nodes = self._match_nodes_for_keys(label, node_id_property, df[id_column_name], chunk_size)
+        with instrumentation.stage("conversion"):
+            models_df = df[[id_column_name]].copy()
+            if isinstance(model_class, str):
+                models_df[label] = nodes
+            else:
+                models_df[model_class.__name__] = nodes.map(model_class.wrap, na_action="ignore")
+            return models_df
+
+    def _projected_keys(self, columns: List[str], model_class: ogm.Model = None) -> List[str]:
+        if columns is None:
+            return None
+        properties = {} if model_class is None else model_properties(model_class)
+        return [properties[col].key if col in properties else col for col in columns]
+
+    def _records_to_dataframe(
+        self, records: List[py2neo.cypher.Record], columns: List[str] = None, model_class: ogm.Model = None
+    ) -> pd.DataFrame:
+        properties = {} if model_class is None else model_properties(model_class)
+        if columns is None:
+            rows = [record["properties"] for record in records]
+            keys = list(dict.fromkeys(key for row in rows for key in row))
+            properties = {prop.key: prop for prop in properties.values()}
+            columns, values = keys, [[row.get(key) for row in rows] for key in keys]
+        else:
+            values = list(zip(*records))[: len(columns)] or [[] for _ in columns]
+        data = {}
+        for column, column_values in zip(columns, values):
+            if isinstance(properties.get(column), SchemaProperty):
+                data[column] = properties[column].to_series(list(column_values), column)
+            else:
+                data[column] = pd.Series(list(column_values), name=column)
+        return pd.DataFrame(data, columns=columns)
+
+    def _project_nodes_to_dataframe(
+        self, label: str, columns: List[str] = None, model_class: ogm.Model = None
+    ) -> pd.DataFrame:
+        if columns is not None and not columns:
+            return pd.DataFrame()
+        query = queries.project_nodes_query(label, self._projected_keys(columns, model_class))
+        records = self._run_query(query)
+        instrumentation.record(rows=len(records))
+        with instrumentation.stage("conversion"):
+            return self._records_to_dataframe(records, columns, model_class)
+
+    def _iter_pages(
+        self, page_query: Callable[[bool], str], chunk_size: ChunkSize
+    ) -> Iterator[List[py2neo.cypher.Record]]:
+        if not isinstance(chunk_size, AdaptiveChunkSize) and chunk_size <= 0:
+            raise InvalidArgumentsConfigurationError("`chunk_size` must be a positive number.")
+        last = None
+        while True:
+            query = page_query(last is None)
+            limit = chunk_size.size if isinstance(chunk_size, AdaptiveChunkSize) else chunk_size
+            start = time.perf_counter()
+            records = self._run_query(query, last=last, limit=limit)
+            if isinstance(chunk_size, AdaptiveChunkSize):
+                chunk_size.observe(len(records), time.perf_counter() - start)
+            if records:
+                yield records
+            if len(records) < limit:
+                return
+            last = records[-1]["page_key"]
 
+    def _iter_projected_pages(
+        self,
+        label: str,
+        columns: List[str],
+        model_class: ogm.Model,
+        page_key: str,
+        chunk_size: ChunkSize,
+    ) -> Iterator[pd.DataFrame]:
+        keys = self._projected_keys(columns, model_class)
+        offset = 0
+        for records in self._iter_pages(
+            lambda first_page: queries.project_nodes_query(label, keys, page_key, first_page), chunk_size
+        ):
+            instrumentation.record(rows=len(records))
+            with instrumentation.stage("conversion"):
+                df = self._records_to_dataframe(records, columns, model_class)
+            df.index = pd.RangeIndex(offset, offset + len(records))
+            offset += len(records)
+            yield df
+
+    @instrumented
     def get_dataframe_for_models(
         self, model_class: ogm.Model, columns: List[str] = None
     ) -> pd.DataFrame:
         """
-        Dump `model_class` nodes available in the graph to `pandas.DataFrame`. The `model_class` must
-        provide `to_dict` method that is used to construct a row for each node. If only subset of the
-        dictionary items returned by the `to_dict` methods should be used one can specify them (and their
-        order) with `columns` parameter.
+        Dump `model_class` nodes available in the graph to `pandas.DataFrame`. If only subset of the
+        class' properties should be used one can specify them (and their order) with `columns` parameter.
 
-        `to_dict` method is provided by each :class:`.PandasModel` instance.
+        Only the requested properties are returned by the database and the table is built column by column.
+        Columns of :class:`.properties.SchemaProperty` properties get a dtype matching the property's type
+        (e.g. `int64`, or `Int64` if some values are missing, for :class:`.properties.IntegerProperty`).
 
         :param model_class: class of nodes that should be used to construct the table.
         :type model_class: :class:`ogm.Model`
-        :param columns: list of produced table columns names.
+        :param columns: list of produced table columns names. Names of `model_class` attributes are
+            mapped to the properties' keys.
         :type columns: List[str], optional.
         :return: :class:`pandas.DataFrame` which rows represent the `model_class` nodes in the graph.
         """
-        if not hasattr(model_class, "to_dict"):
-            raise NotSupportedModelClassError(
-                f"Unable to construct pd.DataFrame from {model_class.__name__} model class - `to_dict` method is missing."
-            )
-        return pandas2neo4j.models_to_dataframe(model_class.match(self), columns)
+        return self._project_nodes_to_dataframe(model_class.__primarylabel__, columns, model_class)
 
+    @instrumented
     def get_dataframe_for_label(self, label: str, columns: List[str] = None):
         """
         Dump all nodes with `label` label available in the graph to `pandas.DataFrame` table. If only subset
         of nodes' properties should be used to construct each row of the table one can specify them with `columns`
-        parameter.
+        parameter - only these properties are returned by the database then.
 
         :param label: label of nodes that should be dumped to the table.
         :type label: str
@@ -409,13 +2181,94 @@ class PandasGraph(ogm.Repository):
         :type columns: List[str], optional
         :return: :class:`pandas.DataFrame` which rows represent the graph's nodes.
         """
-        return pandas2neo4j.nodes_to_dataframe(self._node_matcher.match(label), columns)
+        return self._project_nodes_to_dataframe(label, columns)
+
+    @instrumented
+    def iter_graph_nodes(
+        self, label: str, chunk_size: ChunkSize = 10000, page_key: str = "__id__"
+    ) -> Iterator[List[py2neo.Node]]:
+        """
+        Generator variant of :meth:`PandasGraph.get_graph_nodes` yielding lists of at most `chunk_size` nodes
+        with `label` label, so the whole label never has to be kept in memory.
+
+        Nodes are read with keyset pagination: they are ordered by `page_key` property and each page starts
+        right after the last key of the previous one (``WHERE key > $last ORDER BY key LIMIT $limit``), so later
+        pages are not slower than the first one, as opposed to ``SKIP`` pagination. `page_key` should be
+        a unique and indexed property - by default the nodes' internal ids are used. Nodes without the
+        `page_key` property are skipped.
+
+        :param label: label determining nodes to return.
+        :type label: str
+        :param chunk_size: Maximal number of nodes in a single yielded list.
+        :type chunk_size: ChunkSize, optional
+        :param page_key: name of property used to paginate the nodes or `__id__` for their internal ids.
+        :type page_key: str, optional
+        :return: Iterator over lists of :class:`py2neo.Node` objects.
+        """
+        for records in self._iter_pages(
+            lambda first_page: queries.match_nodes_page_query(label, page_key, first_page), chunk_size
+        ):
+            instrumentation.record(rows=len(records))
+            yield [record["node"] for record in records]
 
+    @instrumented
+    def iter_dataframe_for_label(
+        self, label: str, columns: List[str] = None, chunk_size: ChunkSize = 10000, page_key: str = "__id__"
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Generator variant of :meth:`PandasGraph.get_dataframe_for_label` yielding tables with at most
+        `chunk_size` rows. Pages are read with keyset pagination on `page_key` property, see
+        :meth:`PandasGraph.iter_graph_nodes`. Index of the yielded tables continues between the pages.
+
+        :param label: label of nodes that should be dumped to the tables.
+        :type label: str
+        :param columns: list of produced tables columns names.
+        :type columns: List[str], optional
+        :param chunk_size: Maximal number of rows of a single yielded table.
+        :type chunk_size: ChunkSize, optional
+        :param page_key: name of property used to paginate the nodes or `__id__` for their internal ids.
+        :type page_key: str, optional
+        :return: Iterator over :class:`pandas.DataFrame` tables which rows represent the graph's nodes.
+        """
+        yield from self._iter_projected_pages(label, columns, None, page_key, chunk_size)
+
+    @instrumented
+    def iter_dataframe_for_models(
+        self,
+        model_class: ogm.Model,
+        columns: List[str] = None,
+        chunk_size: ChunkSize = 10000,
+        page_key: str = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Generator variant of :meth:`PandasGraph.get_dataframe_for_models` yielding tables with at most
+        `chunk_size` rows. Pages are read with keyset pagination on `page_key` property, see
+        :meth:`PandasGraph.iter_graph_nodes`. Index of the yielded tables continues between the pages.
+
+        :param model_class: class of nodes that should be used to construct the tables.
+        :type model_class: :class:`ogm.Model`
+        :param columns: list of produced tables columns names.
+        :type columns: List[str], optional
+        :param chunk_size: Maximal number of rows of a single yielded table.
+        :type chunk_size: ChunkSize, optional
+        :param page_key: name of property used to paginate the nodes. If not used the `__primarykey__` of
+            `model_class` is used.
+        :type page_key: str, optional
+        :return: Iterator over :class:`pandas.DataFrame` tables which rows represent the `model_class` nodes.
+        """
+        if page_key is None:
+            page_key = model_class.__primarykey__
+        yield from self._iter_projected_pages(
+            model_class.__primarylabel__, columns, model_class, page_key, chunk_size
+        )
+
+    @instrumented
     def get_relationships(
         self,
         relationship: str,
         nodes: Iterable[Union[ogm.Model, py2neo.Node]] = None,
         inner_only=False,
+        chunk_size: ChunkSize = 0,
     ) -> List[py2neo.Relationship]:
         """
         Return list of :class:`py2neo.Relationship` objects representing given relationship available in the graph.
@@ -430,6 +2283,9 @@ class PandasGraph(ogm.Repository):
         :type nodes: Iterable[Union[:class:`ogm.Model`, :class:`py2neo.Node`]]
         :param inner_only: Boolean value determining whether both start and end nodes of a single :class:`py2neo.Relationship`
             object should be available in `nodes`.
+        :param chunk_size: Maximal number of `nodes` which relationships are matched within a single query. If 0 all
+            relationships are matched with one query. Each relationship is returned once, regardless of the chunking.
+        :type chunk_size: ChunkSize, optional
         :return: List of :class:`py2neo.Relationship` objects matching the relationship.
         """
         if nodes is None and inner_only:
@@ -439,24 +2295,29 @@ class PandasGraph(ogm.Repository):
 
         if nodes is None:
             return self._relationship_matcher.match(r_type=relationship)
-        relationships = set()
         try:
-            nodes_set = {node if type(node) is py2neo.Node else node.__node__ for node in nodes}
+            node_ids = list(
+                {
+                    (node if type(node) is py2neo.Node else node.__node__).identity
+                    for node in nodes
+                }
+                - {None}
+            )
         except AttributeError:
             raise NotSupportedModelClassError(
                 f"Unable to obtain `py2neo.Node` instance from provided nodes."
             )
-        for node in nodes_set:
-            node_relationships = set(
-                self._relationship_matcher.match(nodes={node}, r_type=relationship)
-            )
-            if inner_only:
-                node_relationships = {
-                    rel for rel in node_relationships if set(rel.nodes).issubset(nodes_set)
-                }
-            relationships |= set(node_relationships)
-        return list(relationships)
+        query = queries.match_relationships_for_nodes_query(relationship, inner_only)
+        relationships = []
+        for chunk in split_sequence(node_ids, chunk_size):
+            with measured(chunk_size, chunk):
+                records = self._run_query(query, chunk=chunk, ids=node_ids)
+            with instrumentation.stage("conversion"):
+                relationships.extend(self._relationship_with_nodes(record) for record in records)
+        instrumentation.record(rows=len(relationships))
+        return relationships
 
+    @instrumented
     def get_dataframe_for_relationship(
         self,
         relationship: str,
@@ -464,6 +2325,7 @@ class PandasGraph(ogm.Repository):
         to_node_property: str,
         nodes: Iterable[Union[ogm.Model, py2neo.Node]] = None,
         inner_only=False,
+        chunk_size: ChunkSize = 0,
     ) -> pd.DataFrame:
         """
         Find all :class:`py2neo.Relationship` objects representing given relationship available in the graph
@@ -490,18 +2352,99 @@ class PandasGraph(ogm.Repository):
         :type nodes: Iterable[Union[:class:`ogm.Model`, :class:`py2neo.Node`]]
         :param inner_only: Boolean value determining whether both start and end nodes of a single :class:`py2neo.Relationship`
             object should be available in `nodes`.
+        :param chunk_size: Maximal number of `nodes` which relationships are matched within a single query.
+        :type chunk_size: ChunkSize, optional
         :return: :class:`pandas.DataFrame` table that rows represent the available relationship objects in the graph.
         """
-        relationship_objects = self.get_relationships(relationship, nodes, inner_only)
-        relationship_ids = []
-        for rel in relationship_objects:
-            form_node, to_node = rel.nodes
-            relationship_ids.append((form_node[from_node_property], to_node[to_node_property]))
-        if from_node_property == to_node_property:
-            from_node_property = f"{from_node_property}_from"
-            to_node_property = f"{to_node_property}_to"
-        return pd.DataFrame(relationship_ids, columns=[from_node_property, to_node_property])
+        relationship_objects = self.get_relationships(relationship, nodes, inner_only, chunk_size)
+        with instrumentation.stage("conversion"):
+            relationship_ids = []
+            for rel in relationship_objects:
+                form_node, to_node = rel.nodes
+                relationship_ids.append((form_node[from_node_property], to_node[to_node_property]))
+            if from_node_property == to_node_property:
+                from_node_property = f"{from_node_property}_from"
+                to_node_property = f"{to_node_property}_to"
+            return pd.DataFrame(relationship_ids, columns=[from_node_property, to_node_property])
+
+    def _relationship_with_nodes(self, record: py2neo.cypher.Record) -> py2neo.Relationship:
+        matched = record["r"]
+        relationship = py2neo.Relationship(
+            record["a"], type(matched).__name__, record["b"], **dict(matched)
+        )
+        relationship.graph = matched.graph
+        relationship.identity = matched.identity
+        return relationship
+
+    def _match_relationships_for_dataframe(
+        self,
+        df: pd.DataFrame,
+        relationship: str,
+        from_model_class: Union[ogm.Model, str],
+        to_model_class: Union[ogm.Model, str],
+        from_key_column: str,
+        to_key_column: str,
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+        chunk_size: ChunkSize = 0,
+        return_relationships: bool = True,
+    ) -> pd.Series:
+        query = queries.unwind_match_relationships_query(
+            relationship,
+            *self._relationship_endpoints(
+                from_model_class, to_model_class, from_model_id_key, to_model_id_key
+            ),
+            return_relationships,
+        )
+        instrumentation.record(rows=len(df))
+        matched = []
+        for chunk in split_dataframe(df[[from_key_column, to_key_column]], chunk_size):
+            with instrumentation.stage("construction"):
+                rows = [
+                    {"f": key[from_key_column], "t": key[to_key_column], "i": position}
+                    for position, key in enumerate(dataframe_to_records(chunk))
+                    if key[from_key_column] is not None and key[to_key_column] is not None
+                ]
+            chunk_matches = [None] * len(chunk) if return_relationships else [False] * len(chunk)
+            with measured(chunk_size, chunk):
+                records = self._run_query(query, rows=rows) if rows else []
+            with instrumentation.stage("conversion"):
+                for record in records:
+                    if not return_relationships:
+                        chunk_matches[record["i"]] = True
+                    elif chunk_matches[record["i"]] is None:
+                        chunk_matches[record["i"]] = self._relationship_with_nodes(record)
+            matched.append(pd.Series(chunk_matches, index=chunk.index, dtype=object))
+        if not matched:
+            return pd.Series(index=df.index, dtype=object if return_relationships else bool)
+        matched = pd.concat(matched)
+        return matched if return_relationships else matched.astype(bool)
+
+    def _missing_relationship_error(
+        self,
+        relationship: str,
+        from_model_class: Union[ogm.Model, str],
+        to_model_class: Union[ogm.Model, str],
+        from_id: Any,
+        to_id: Any,
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+    ) -> Exception:
+        from_id_key = self._model_id_key(from_model_class, from_model_id_key, "from_model_class", "from_model_id_key")
+        to_id_key = self._model_id_key(to_model_class, to_model_id_key, "to_model_class", "to_model_id_key")
+        from_model_instance = self._match_model(from_model_class, **{from_id_key: from_id})
+        if from_model_instance is None:
+            return NodeWithIdDoesNotExistError(from_model_class, from_id)
+        to_model_instance = self._match_model(to_model_class, **{to_id_key: to_id})
+        if to_model_instance is None:
+            return NodeWithIdDoesNotExistError(to_model_class, to_id)
+        return RelationshipDoesNotExistError(
+            relationship,
+            from_model_instance if isinstance(from_model_instance, py2neo.Node) else from_model_instance.__node__,
+            to_model_instance if isinstance(to_model_instance, py2neo.Node) else to_model_instance.__node__,
+        )
 
+    @instrumented
     def get_relationships_for_dataframe(
         self,
         df: pd.DataFrame,
@@ -512,6 +2455,8 @@ class PandasGraph(ogm.Repository):
         to_key_column: str,
         from_model_id_key: str = None,
         to_model_id_key: str = None,
+        chunk_size: ChunkSize = 0,
+        raise_on_missing: bool = True,
     ) -> pd.DataFrame:
         """
         Map relationships described by `df` table with :class:`py2neo.Relationship` objects available in the
@@ -521,6 +2466,13 @@ class PandasGraph(ogm.Repository):
         values (e.g. with :meth:`PandasGraph.create_relationships_from_dataframe` method) and wants to retreive
         these objects in another execution.
 
+        Key pairs of each chunk are resolved with a single ``UNWIND ... MATCH (a)-[r:REL]->(b)`` query. If a row
+        has no matching relationship :class:`.RelationshipDoesNotExistError` is raised (or
+        :class:`.NodeWithIdDoesNotExistError` if one of its nodes does not exist), unless `raise_on_missing`
+        is False - then None is used for such row. Use
+        :meth:`PandasGraph.relationships_exist_for_dataframe` or
+        :meth:`PandasGraph.get_missing_relationships_for_dataframe` to only check which relationships exist.
+
         :param df: table describing the relationships that should be mapped with :class:`py2neo.Relationship`
             objects in the graph.
         :type df: :class:`pandas.DataFrame`
@@ -546,53 +2498,104 @@ class PandasGraph(ogm.Repository):
             If `to_model_class` is a :class:`ogm.Model` subclass this parameter can be omitted and the
             `__primarykey__` of the class will be used.
         :type to_model_id_key: str, optional
+        :param chunk_size: Maximal number of rows matched within a single query.
+        :type chunk_size: ChunkSize, optional
+        :param raise_on_missing: Whether :class:`.RelationshipDoesNotExistError` should be raised if a row
+            has no matching relationship.
+        :type raise_on_missing: bool, optional
         :return: :class:`pandas.DataFrame` table where a single row contains df[from_key_column], df[to_key_column]
             and :class:`py2neo.Relationship` representing corresponding relationship.
         """
-        if from_model_id_key is None:
-            if isinstance(from_model_class, str):
-                raise InvalidArgumentsConfigurationError(
-                    f"If `from_model_class` is string ('{from_model_class}' provided) it is assumed to be "
-                    "the label of a `py2neo.Node` object and `from_model_id_key` must be defined to match the node."
-                )
-            from_model_id_key = from_model_class.__primarykey__
-
-        if to_model_id_key is None:
-            if isinstance(to_model_class, str):
-                raise InvalidArgumentsConfigurationError(
-                    f"If `to_model_id_key` is string ('{to_model_id_key}' provided) it is assumed to be "
-                    "the label of a `py2neo.Node` object and `from_model_id_key` must be defined to match the node."
-                )
-            to_model_id_key = to_model_class.__primarykey__
-
-        def _match_relationship(row: pd.Series):
-            from_model_id = row[from_key_column]
-            to_model_id = row[to_key_column]
-            from_model_instance = self._match_model(
-                from_model_class, **{from_model_id_key: from_model_id}
-            )
-            to_model_instance = self._match_model(to_model_class, **{to_model_id_key: to_model_id})
-            if from_model_instance is None:
-                raise NodeWithIdDoesNotExistError(from_model_class, from_model_id)
-            if to_model_instance is None:
-                raise NodeWithIdDoesNotExistError(to_model_class, to_model_id)
-            from_node = (
-                from_model_instance
-                if isinstance(from_model_instance, py2neo.Node)
-                else from_model_instance.__node__
-            )
-            to_node = (
-                to_model_instance
-                if isinstance(to_model_instance, py2neo.Node)
-                else to_model_instance.__node__
+        relationships = self._match_relationships_for_dataframe(
+            df,
+            relationship,
+            from_model_class,
+            to_model_class,
+            from_key_column,
+            to_key_column,
+            from_model_id_key,
+            to_model_id_key,
+            chunk_size,
+        )
+        relationship_df = df[[from_key_column, to_key_column]].copy()
+        missing = relationships.isna()
+        if raise_on_missing and missing.any():
+            (first_missing,) = dataframe_to_records(relationship_df[missing].iloc[:1])
+            raise self._missing_relationship_error(
+                relationship,
+                from_model_class,
+                to_model_class,
+                first_missing[from_key_column],
+                first_missing[to_key_column],
+                from_model_id_key,
+                to_model_id_key,
             )
-            relationship_object = self._relationship_matcher.match(
-                nodes=[from_node, to_node], r_type=relationship
-            ).first()
-            if relationship_object is None:
-                raise RelationshipDoesNotExistError(relationship, from_node, to_node)
-            return relationship_object
-
-        relationship_df = df[[from_key_column, to_key_column]]
-        relationship_df[relationship] = relationship_df.apply(_match_relationship, axis=1)
+        relationship_df[relationship] = relationships
         return relationship_df
+
+    @instrumented
+    def relationships_exist_for_dataframe(
+        self,
+        df: pd.DataFrame,
+        relationship: str,
+        from_model_class: Union[ogm.Model, str],
+        to_model_class: Union[ogm.Model, str],
+        from_key_column: str,
+        to_key_column: str,
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+        chunk_size: ChunkSize = 0,
+    ) -> pd.Series:
+        """
+        Check which relationships described by `df` table are available in the graph. Only positions of rows
+        with existing relationships are returned by the database, so no relationship or node is transferred.
+        Parameters have the same meaning as in :meth:`PandasGraph.get_relationships_for_dataframe`.
+
+        :return: Boolean :class:`pandas.Series` aligned with `df` table that is True for rows with existing
+            relationship.
+        """
+        return self._match_relationships_for_dataframe(
+            df,
+            relationship,
+            from_model_class,
+            to_model_class,
+            from_key_column,
+            to_key_column,
+            from_model_id_key,
+            to_model_id_key,
+            chunk_size,
+            return_relationships=False,
+        )
+
+    @instrumented
+    def get_missing_relationships_for_dataframe(
+        self,
+        df: pd.DataFrame,
+        relationship: str,
+        from_model_class: Union[ogm.Model, str],
+        to_model_class: Union[ogm.Model, str],
+        from_key_column: str,
+        to_key_column: str,
+        from_model_id_key: str = None,
+        to_model_id_key: str = None,
+        chunk_size: ChunkSize = 0,
+    ) -> pd.DataFrame:
+        """
+        Return key pairs of relationships described by `df` table that are not available in the graph.
+        Parameters have the same meaning as in :meth:`PandasGraph.get_relationships_for_dataframe`.
+
+        :return: :class:`pandas.DataFrame` with `from_key_column` and `to_key_column` columns of `df` rows
+            which relationships were not found.
+        """
+        exists = self.relationships_exist_for_dataframe(
+            df,
+            relationship,
+            from_model_class,
+            to_model_class,
+            from_key_column,
+            to_key_column,
+            from_model_id_key,
+            to_model_id_key,
+            chunk_size,
+        )
+        return df.loc[~exists, [from_key_column, to_key_column]]
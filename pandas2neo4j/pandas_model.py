@@ -1,9 +1,12 @@
-from typing import Any, Dict, List, Iterable
+from typing import Any, Dict, List, Iterable, Mapping
 
 import pandas as pd
 import py2neo
 from py2neo import ogm
 
+from pandas2neo4j.errors import InvalidDataFrameError
+from pandas2neo4j.properties import SchemaProperty
+
 
 class PandasModel(ogm.Model):
     """
@@ -15,11 +18,76 @@ class PandasModel(ogm.Model):
     to set the properties' values.
 
     :meth:`properties.SchemaProperty` subclasses can be used to specify properties along with their types.
+    Whole tables can be checked against the schema at once with :meth:`PandasModel.validate_dataframe`
+    and converted into instances with :meth:`PandasModel.from_dataframe`, which is much faster than
+    initializing an instance with each row.
     """
     def __init__(self, row: pd.Series):
-        for column in [col for col in row.keys() if hasattr(self, col)]:
+        for column in construction_plan(type(self)).attributes(row.keys()):
             self.__setattr__(column, row[column])
 
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> pd.Series:
+        """
+        Create an instance for each row of `df` table. The table is validated and cast at once with
+        :meth:`PandasModel.validate_dataframe` and the nodes of instances are built directly from the casted
+        values with the class' :class:`ConstructionPlan`, so no :class:`pandas.Series` is created for a row
+        and the properties' setters are skipped. Only the columns matching the class' properties are used.
+
+        :param df: A table which rows should be converted into the class' instances.
+        :type df: :class:`pandas.DataFrame`
+        :return: :class:`pandas.Series` with the instances aligned with `df` index.
+        """
+        validated = cls.validate_dataframe(df)
+        return pd.Series(construction_plan(cls).instances(validated), index=df.index, dtype=object)
+
+    @classmethod
+    def validate_dataframe(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validate and cast columns of `df` table matching the class' properties. Each column is processed at
+        once with :meth:`properties.SchemaProperty.cast_series`, `NaN` values are replaced with None and
+        `not_null` flags are checked. All the offending rows are reported with a single
+        :class:`.InvalidDataFrameError`.
+
+        :param df: A table which rows should be converted into the class' instances.
+        :type df: :class:`pandas.DataFrame`
+        :return: :class:`pandas.DataFrame` with `object` columns containing casted values of the class' properties.
+            It can be used to create instances with :meth:`PandasModel.from_validated_row`
+            (:meth:`PandasModel.from_dataframe` validates the table and creates all the instances at once).
+        """
+        properties = model_properties(cls)
+        validated = pd.DataFrame(index=df.index)
+        invalid_rows, null_rows = {}, {}
+        for column in [col for col in df.columns if col in properties]:
+            schema_property = properties[column]
+            if isinstance(schema_property, SchemaProperty):
+                values, invalid = schema_property.cast_series(df[column])
+                if invalid.any():
+                    invalid_rows[column] = list(df.index[invalid])
+                if schema_property.not_null:
+                    nulls = values.isna() & ~invalid
+                    if nulls.any():
+                        null_rows[column] = list(df.index[nulls])
+            else:
+                values = df[column].astype(object).where(df[column].notna(), None)
+            validated[column] = values
+        if invalid_rows or null_rows:
+            raise InvalidDataFrameError(cls, invalid_rows, null_rows)
+        return validated
+
+    @classmethod
+    def from_validated_row(cls, row: Mapping[str, Any]) -> "PandasModel":
+        """
+        Create an instance from a row of table returned by :meth:`PandasModel.validate_dataframe`. The values
+        are already casted, so they are stored in the node directly, skipping properties' setters.
+
+        :param row: Mapping of the class' properties names to their values.
+        :type row: Mapping[str, Any]
+        :return: Instance of the class.
+        """
+        plan = construction_plan(cls)
+        return plan.instance({plan.keys[column]: value for column, value in row.items()})
+
     def to_dict(self, properties: List[str] = None) -> Dict[str, Any]:
         """
         Create dictionary with properties and their values. This method is used to create `pandas.DataFrame`
@@ -35,6 +103,115 @@ class PandasModel(ogm.Model):
         return {p: getattr(self, p) for p in properties}
 
 
+class ConstructionPlan:
+    """
+    Mapping of table columns to the properties of an :class:`ogm.Model` subclass, resolved once and cached on
+    the class (see :func:`construction_plan`). It is used to build the class' instances from rows of a table
+    without inspecting the class for each row.
+
+    :param model_class: :class:`ogm.Model` subclass which instances are constructed.
+    :type model_class: :class:`ogm.Model`
+    :ivar properties: dictionary mapping attribute names to :class:`ogm.Property` instances (including the ones
+        inherited from the class' base classes).
+    :ivar keys: dictionary mapping attribute names of the properties to their nodes' property names.
+    :ivar labels: labels of the instances' nodes.
+    """
+
+    def __init__(self, model_class: ogm.Model):
+        self.model_class = model_class
+        self.properties = {}
+        for cls in reversed(model_class.__mro__):
+            self.properties.update(
+                {name: attr for name, attr in vars(cls).items() if isinstance(attr, ogm.Property)}
+            )
+        self.keys = {name: schema_property.key for name, schema_property in self.properties.items()}
+        primary_label = model_class.__primarylabel__
+        self.labels = primary_label if isinstance(primary_label, tuple) else (primary_label,)
+        self._attributes = {}
+
+    def attributes(self, columns: Iterable[str]) -> List[str]:
+        """
+        Return the `columns` matching attributes of the class (set by :class:`PandasModel` constructor).
+        The result is cached for each sequence of columns.
+        """
+        columns = tuple(columns)
+        attributes = self._attributes.get(columns)
+        if attributes is None:
+            attributes = [
+                column for column in columns if any(column in vars(cls) for cls in self.model_class.__mro__)
+            ]
+            self._attributes[columns] = attributes
+        return attributes
+
+    def instance(self, properties: Dict[str, Any]) -> ogm.Model:
+        """
+        Create an instance which node has given `properties` (keyed with the nodes' property names).
+        Properties with None value are skipped.
+        """
+        return self.model_class.wrap(py2neo.Node(*self.labels, **properties))
+
+    def instances(self, validated: pd.DataFrame) -> List[ogm.Model]:
+        """
+        Create an instance for each row of `validated` table returned by :meth:`PandasModel.validate_dataframe`.
+        Rows are read from the table's array and the values are stored in the nodes as they are.
+        """
+        keys = [self.keys[column] for column in validated.columns]
+        return [self.instance(dict(zip(keys, values))) for values in validated.to_numpy()]
+
+
+def construction_plan(model_class: ogm.Model) -> ConstructionPlan:
+    """
+    Return the :class:`ConstructionPlan` of `model_class`, creating it on the first use. The plan is stored
+    in the class' `__construction_plan__` attribute (subclasses have their own plans), so properties added
+    to the class after its first use are not taken into account.
+
+    :param model_class: :class:`ogm.Model` subclass.
+    :type model_class: :class:`ogm.Model`
+    :return: The class' :class:`ConstructionPlan`.
+    """
+    plan = vars(model_class).get("__construction_plan__")
+    if plan is None:
+        plan = ConstructionPlan(model_class)
+        setattr(model_class, "__construction_plan__", plan)
+    return plan
+
+
+def model_properties(model_class: ogm.Model) -> Dict[str, ogm.Property]:
+    """
+    Collect :class:`ogm.Property` declarations of given :class:`ogm.Model` subclass (including the ones
+    inherited from its base classes). The declarations are collected once, see :func:`construction_plan`.
+
+    :param model_class: :class:`ogm.Model` subclass which properties should be returned.
+    :type model_class: :class:`ogm.Model`
+    :return: Dictionary mapping attribute names to :class:`ogm.Property` instances. The node's property name
+        is available as the `key` attribute of each value.
+    """
+    return dict(construction_plan(model_class).properties)
+
+
+def dataframe_to_records(df: pd.DataFrame, model_class: ogm.Model = None) -> List[Dict[str, Any]]:
+    """
+    Convert `df` table into a list of dictionaries that can be sent to the graph as a query parameter.
+    `NaN` values are replaced with None and numpy scalars are converted to built-in Python types.
+
+    If `model_class` is provided only the columns matching the class' properties are used and
+    they are renamed to the properties' keys.
+
+    :param df: A table which rows should be converted.
+    :type df: :class:`pandas.DataFrame`
+    :param model_class: :class:`ogm.Model` subclass determining the columns of each record.
+    :type model_class: :class:`ogm.Model`, optional
+    :return: List with a dictionary for each row of `df` table.
+    """
+    if model_class is not None:
+        properties = model_properties(model_class)
+        columns = [col for col in df.columns if col in properties]
+        df = df[columns].rename(columns={col: properties[col].key for col in columns})
+    if len(df.columns) == 0:
+        return [{} for _ in range(len(df))]
+    return df.astype(object).where(pd.notnull(df), None).to_dict("records")
+
+
 def models_to_dataframe(models: Iterable[PandasModel], columns: List[str] = None) -> pd.DataFrame:
     """
     Construct a `pandas.DataFrame` from given collection of :class:`.PandasModel` instances. Each row of
@@ -70,3 +247,20 @@ def nodes_to_dataframe(nodes: Iterable[py2neo.Node], columns: List[str] = None)
             node_dict = {k: node_dict[k] for k in columns}
         nodes_properties.append(node_dict)
     return pd.DataFrame(nodes_properties)
+
+
+def dataframe_row_hashes(df: pd.DataFrame) -> pd.Series:
+    """
+    Compute a content hash of each row of `df` table with vectorized :func:`pandas.util.hash_pandas_object`.
+    Columns are hashed in order of their names, so the hashes do not depend on the columns order. `NaN`
+    and None values give the same hash.
+
+    :param df: A table which rows should be hashed.
+    :type df: :class:`pandas.DataFrame`
+    :return: :class:`pandas.Series` with signed 64-bit integer hashes (so they can be stored as graph
+        properties) aligned with `df` index.
+    """
+    df = df[sorted(df.columns)]
+    df = df.astype(object).where(pd.notnull(df), None)
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy().view("int64")
+    return pd.Series(hashes, index=df.index)
@@ -0,0 +1,205 @@
+from dataclasses import dataclass, field
+import random
+import re
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from pandas2neo4j.errors import InvalidArgumentsConfigurationError
+
+SCAN_OPERATORS = ("NodeByLabelScan", "AllNodesScan")
+_LOOKUP = re.compile(r"\{[^}]*: (?:row\.\w+|\$\w+)\}|\.\S+ (?:IN|=|>) (?:\$|row\.)")
+
+
+def expects_index_seek(query: str) -> bool:
+    """
+    Check whether `query` looks up nodes by values of its parameters (e.g. ``MATCH (n:Label {key: row.k})``
+    or ``WHERE n.key IN $keys``), so its plan should use index seeks instead of scanning nodes.
+
+    :param query: Cypher statement.
+    :type query: str
+    :return: True if an index seek is expected.
+    """
+    return _LOOKUP.search(query) is not None
+
+
+@dataclass
+class PlanOperator:
+    """
+    A single operator of a statement's execution plan.
+
+    :ivar operator: name of the operator, e.g. `NodeIndexSeek` or `NodeByLabelScan`.
+    :ivar rows: number of rows produced by the operator (only for profiled statements).
+    :ivar db_hits: number of database accesses made by the operator (only for profiled statements).
+    :ivar estimated_rows: number of rows estimated by the planner.
+    :ivar details: description of the operator, e.g. the scanned label or the used index.
+    :ivar identifiers: variables bound by the operator.
+    :ivar children: operators producing the operator's input.
+    """
+    operator: str
+    rows: Optional[int] = None
+    db_hits: Optional[int] = None
+    estimated_rows: Optional[float] = None
+    details: Optional[str] = None
+    identifiers: List[str] = field(default_factory=list)
+    children: List["PlanOperator"] = field(default_factory=list)
+
+    @classmethod
+    def from_metadata(cls, metadata: Dict[str, Any]) -> "PlanOperator":
+        """
+        Build the plan's tree from `plan` or `profile` metadata of a statement's result.
+
+        :param metadata: dictionary describing the root operator.
+        :type metadata: Dict[str, Any]
+        """
+        arguments = metadata.get("args", {})
+        return cls(
+            operator=metadata.get("operatorType", "").split("@")[0],
+            rows=metadata.get("rows"),
+            db_hits=metadata.get("dbHits"),
+            estimated_rows=arguments.get("EstimatedRows"),
+            details=arguments.get("Details") or arguments.get("LabelName") or arguments.get("Index"),
+            identifiers=list(metadata.get("identifiers", [])),
+            children=[cls.from_metadata(child) for child in metadata.get("children", [])],
+        )
+
+    def walk(self) -> Iterator["PlanOperator"]:
+        """
+        Iterate over the operator and all operators below it (depth-first).
+        """
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+@dataclass
+class QueryProfile:
+    """
+    Execution plan of a single statement sent by :class:`.PandasGraph`.
+
+    :ivar method: name of the :class:`.PandasGraph` method which sent the statement.
+    :ivar mode: either `PROFILE` or `EXPLAIN`.
+    :ivar query: the profiled statement.
+    :ivar plan: the root operator of the plan.
+    """
+    method: Optional[str]
+    mode: str
+    query: str
+    plan: PlanOperator
+
+    @property
+    def db_hits(self) -> Optional[int]:
+        """Total number of database accesses (None if the statement was only explained)."""
+        hits = [operator.db_hits for operator in self.plan.walk() if operator.db_hits is not None]
+        return sum(hits) if hits else None
+
+    @property
+    def rows(self) -> Optional[int]:
+        """Number of rows returned by the statement (None if the statement was only explained)."""
+        return self.plan.rows
+
+    @property
+    def scans(self) -> List[PlanOperator]:
+        """Operators scanning all nodes or all nodes with a label."""
+        return [operator for operator in self.plan.walk() if operator.operator in SCAN_OPERATORS]
+
+    @property
+    def unexpected_scans(self) -> List[PlanOperator]:
+        """Scanning operators of a statement which looks up nodes by values, see :func:`expects_index_seek`."""
+        return self.scans if expects_index_seek(self.query) else []
+
+
+class Profiler:
+    """
+    Profiling mode of :class:`.PandasGraph`. A sample of statements sent by the graph is run under `PROFILE` or
+    `EXPLAIN` and their plans are collected as :class:`QueryProfile` objects tied to the calling method.
+
+    In `PROFILE` mode the sampled statement itself is run with `PROFILE` prefix, so its results are used as usual
+    while db hits and rows of each operator are collected. In `EXPLAIN` mode an additional `EXPLAIN` statement is
+    sent before the sampled one - it is not executed by the database, so only the plan (with estimated rows)
+    is collected.
+
+    :param mode: Either `PROFILE` or `EXPLAIN`.
+    :type mode: str, optional
+    :param sample_rate: Fraction of statements that should be profiled. With 1.0 each statement (i.e. each
+        written chunk) is profiled.
+    :type sample_rate: float, optional
+    :param on_profile: Callable receiving each collected :class:`QueryProfile`.
+    :type on_profile: Callable[[:class:`QueryProfile`], None], optional
+    """
+    def __init__(
+        self,
+        mode: str = "PROFILE",
+        sample_rate: float = 1.0,
+        on_profile: Callable[[QueryProfile], None] = None,
+    ):
+        mode = mode.upper()
+        if mode not in ("PROFILE", "EXPLAIN"):
+            raise InvalidArgumentsConfigurationError(f"`mode` must be PROFILE or EXPLAIN ('{mode}' provided).")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.on_profile = on_profile
+        self._lock = threading.Lock()
+        self._profiles: List[QueryProfile] = []
+
+    def sample(self) -> bool:
+        """
+        Decide whether the next statement should be profiled.
+        """
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def add(self, method: Optional[str], query: str, plan: Optional[Dict[str, Any]]):
+        """
+        Store the plan of `query` sent by `method`.
+
+        :param method: name of the :class:`.PandasGraph` method which sent the statement.
+        :type method: str
+        :param query: the profiled statement (without `PROFILE` or `EXPLAIN` prefix).
+        :type query: str
+        :param plan: `plan` or `profile` metadata of the statement's result.
+        :type plan: Dict[str, Any]
+        """
+        if plan is None:
+            return
+        profile = QueryProfile(method, self.mode, query, PlanOperator.from_metadata(plan))
+        with self._lock:
+            self._profiles.append(profile)
+        if self.on_profile is not None:
+            self.on_profile(profile)
+
+    @property
+    def profiles(self) -> List[QueryProfile]:
+        """Collected profiles in order of the statements."""
+        with self._lock:
+            return list(self._profiles)
+
+    def clear(self):
+        """
+        Drop the collected profiles.
+        """
+        with self._lock:
+            self._profiles.clear()
+
+    def report(self) -> pd.DataFrame:
+        """
+        Build a table with a row for each collected profile: the calling method, the statement, its db hits
+        and rows, the plan's operators (in depth-first order), scanned labels and whether a scan was found where
+        an index seek was expected.
+        """
+        return pd.DataFrame(
+            [
+                {
+                    "method": profile.method,
+                    "mode": profile.mode,
+                    "query": profile.query,
+                    "db_hits": profile.db_hits,
+                    "rows": profile.rows,
+                    "operators": [operator.operator for operator in profile.plan.walk()],
+                    "scans": [operator.details for operator in profile.scans],
+                    "unexpected_scan": bool(profile.unexpected_scans),
+                }
+                for profile in self.profiles
+            ],
+            columns=["method", "mode", "query", "db_hits", "rows", "operators", "scans", "unexpected_scan"],
+        )
@@ -1,5 +1,9 @@
+from typing import Any, List, Tuple
+
 import py2neo
 import numpy as np
+import pandas as pd
+from pandas.api import types as pd_types
 
 from pandas2neo4j.errors import PropertyValueWithInvalidTypeError, NotNullPropertyError
 
@@ -13,8 +17,14 @@ class SchemaProperty(py2neo.ogm.Property):
     initialized without specifying the property, but such a restriction is especially
     useful when creating model instances based on `pandas.DataFrame` rows, where some
     values may not be provided, so `NaN` would be used.
+
+    :meth:`cast_series` can be used to validate and cast a whole `pandas.Series` column at once
+    instead of setting the values one by one, and :meth:`to_series` to construct a column of values
+    read from the graph with a dtype matching the property's type.
     """
     TYPE = None
+    DTYPE = None
+    NULLABLE_DTYPE = None
 
     def __init__(self, cast_value=True, not_null=False, key=None, default=None):
         super().__init__(key, default)
@@ -58,12 +68,102 @@ class SchemaProperty(py2neo.ogm.Property):
         if value is None or (type(value) is float and np.isnan(value)):
             raise NotNullPropertyError(self)
 
+    def cast_series(self, series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Vectorized counterpart of setting the property's value. Cast all values of `series` to the property's
+        type (if `cast_value` is True) or check if they already have the required type. `NaN` values are
+        replaced with None. Note that `not_null` flag is not checked by this method.
+
+        :param series: column with values of the property.
+        :type series: :class:`pandas.Series`
+        :return: Tuple with a :class:`pandas.Series` of `object` dtype containing casted values (or None for
+            missing and invalid values) and a boolean :class:`pandas.Series` marking the invalid values.
+        """
+        notnull = series.notna()
+        values = series[notnull]
+        if self.cast_value:
+            values, invalid = self._cast_values(values)
+        else:
+            values = values.astype(object)
+            invalid = ~values.map(self._has_valid_type).astype(bool)
+        result = pd.Series([None] * len(series), index=series.index, dtype=object)
+        result[notnull] = values.where(~invalid, None)
+        return result, invalid.reindex(series.index, fill_value=False)
+
+    def to_series(self, values: List[Any], name: str = None) -> pd.Series:
+        """
+        Construct a column with the property's values using a dtype matching the property's type. If any
+        of the values is missing `NULLABLE_DTYPE` is used. If some of the values have invalid type the column
+        keeps the `object` dtype, so no value is silently converted.
+
+        :param values: values of the property.
+        :type values: List[Any]
+        :param name: name of the constructed column.
+        :type name: str, optional
+        :return: :class:`pandas.Series` with the values.
+        """
+        series = pd.Series(values, name=name, dtype=object)
+        notnull = series.notna()
+        if self.DTYPE is None or not series[notnull].map(type).eq(self.TYPE).all():
+            return series
+        return series.astype(self.DTYPE if notnull.all() else self.NULLABLE_DTYPE)
+
+    def _cast_values(self, values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        casted = values.to_numpy(dtype=object, copy=True)
+        invalid = np.zeros(len(values), dtype=bool)
+        castable = self._castable(values)
+        if castable.any():
+            try:
+                casted[castable] = values[castable].astype(self.DTYPE).to_numpy(dtype=object)
+            except (TypeError, ValueError, OverflowError):
+                castable[:] = False
+        for position in np.flatnonzero(~castable):
+            value = casted[position]
+            try:
+                if type(value) is not self.TYPE:
+                    value = self._cast_value(value)
+            except (TypeError, ValueError):
+                value = None
+            casted[position] = value
+            invalid[position] = value is None or not self._has_valid_type(value)
+        return pd.Series(casted, index=values.index, dtype=object), pd.Series(invalid, index=values.index)
+
+    def _castable(self, values: pd.Series) -> np.ndarray:
+        """
+        Mark the values that can be cast with a single `astype` call. The remaining values are cast one by one.
+
+        :param values: non-missing values of the property.
+        :type values: :class:`pandas.Series`
+        :return: boolean array aligned positionally with `values`.
+        """
+        if self.DTYPE is None:
+            return np.zeros(len(values), dtype=bool)
+        try:
+            numeric = pd.to_numeric(values, errors="coerce")
+        except TypeError:
+            return np.zeros(len(values), dtype=bool)
+        return np.isfinite(numeric.to_numpy(dtype="float64"))
+
+    def _cast_value(self, value: Any) -> Any:
+        return self.TYPE(value)
+
+    def _has_valid_type(self, value: Any) -> bool:
+        return type(value) is self.TYPE
+
+    def _no_invalid(self, values: pd.Series) -> pd.Series:
+        return pd.Series(False, index=values.index)
+
 
 class StringProperty(SchemaProperty):
     """
     Property storing `string` object.
     """
     TYPE = str
+    DTYPE = "string"
+    NULLABLE_DTYPE = "string"
+
+    def _cast_values(self, values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        return values.astype(str).astype(object), self._no_invalid(values)
 
 
 class IntegerProperty(SchemaProperty):
@@ -71,6 +171,17 @@ class IntegerProperty(SchemaProperty):
     Property storing `int` object.
     """
     TYPE = int
+    DTYPE = "int64"
+    NULLABLE_DTYPE = "Int64"
+
+    def _cast_values(self, values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        if pd_types.is_bool_dtype(values) or pd_types.is_integer_dtype(values):
+            return values.astype("int64").astype(object), self._no_invalid(values)
+        if pd_types.is_float_dtype(values):
+            invalid = ~np.isfinite(values)
+            casted = values.where(~invalid, 0).astype("int64").astype(object)
+            return casted, invalid
+        return super()._cast_values(values)
 
 
 class FloatProperty(SchemaProperty):
@@ -78,6 +189,13 @@ class FloatProperty(SchemaProperty):
     Property storing `float` object.
     """
     TYPE = float
+    DTYPE = "float64"
+    NULLABLE_DTYPE = "float64"
+
+    def _cast_values(self, values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        if pd_types.is_numeric_dtype(values):
+            return values.astype("float64").astype(object), self._no_invalid(values)
+        return super()._cast_values(values)
 
 
 class BooleanProperty(SchemaProperty):
@@ -85,6 +203,16 @@ class BooleanProperty(SchemaProperty):
     Property storing `bool` object.
     """
     TYPE = bool
+    DTYPE = "bool"
+    NULLABLE_DTYPE = "boolean"
+
+    def _cast_values(self, values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        if pd_types.is_numeric_dtype(values):
+            return (values != 0).astype(object), self._no_invalid(values)
+        return super()._cast_values(values)
+
+    def _castable(self, values: pd.Series) -> np.ndarray:
+        return values.map(type).isin((bool, int, float)).to_numpy()
 
 
 class ListProperty(SchemaProperty):
@@ -140,3 +268,9 @@ class ListProperty(SchemaProperty):
             self._validate_not_null(value)
 
         super(SchemaProperty, self).__set__(instance, value)
+
+    def _cast_value(self, value: Any) -> Any:
+        return [self.nested_type(elem) for elem in value]
+
+    def _has_valid_type(self, value: Any) -> bool:
+        return type(value) is list and all(type(elem) is self.nested_type for elem in value)
@@ -0,0 +1,381 @@
+from typing import Iterable, List, Union
+
+from py2neo.cypher import cypher_escape
+
+
+def _labels_pattern(labels: Union[str, Iterable[str], None]) -> str:
+    if labels is None:
+        return ""
+    if isinstance(labels, str):
+        labels = [labels]
+    return "".join(f":{cypher_escape(label)}" for label in labels)
+
+
+def unwind_create_nodes_query(label: Union[str, Iterable[str]], return_ids: bool = True) -> str:
+    """
+    Build a ``UNWIND ... CREATE`` statement creating a single node with `label` label for each element
+    of `$rows` parameter. Each element should be a dictionary with the node's properties.
+
+    :param label: label of created nodes or a collection of their labels.
+    :type label: Union[str, Iterable[str]]
+    :param return_ids: whether internal ids of created nodes should be returned (in order of `$rows`).
+    :type return_ids: bool, optional
+    :return: Cypher statement expecting `$rows` parameter.
+    """
+    query = f"UNWIND $rows AS row CREATE (n{_labels_pattern(label)}) SET n = row"
+    if return_ids:
+        return f"{query} RETURN id(n) AS id"
+    return f"{query} RETURN count(n) AS created"
+
+
+def match_node_clause(name: str, label: str, id_key: str, value: str) -> str:
+    """
+    Build a ``MATCH`` clause binding `name` variable to node with `label` label and `id_key` property
+    equal to `value` expression. If `id_key` is `__id__` the node is matched by its internal id.
+    If `label` is None the node's labels are not checked.
+
+    :param name: name of the variable bound to the node.
+    :type name: str
+    :param label: label of the matched node.
+    :type label: str
+    :param id_key: name of the property used to identify the node.
+    :type id_key: str
+    :param value: Cypher expression with the identifying value.
+    :type value: str
+    :return: Cypher ``MATCH`` clause.
+    """
+    if id_key == "__id__":
+        return f"MATCH ({name}{_labels_pattern(label)}) WHERE id({name}) = {value}"
+    return f"MATCH ({name}{_labels_pattern(label)} {{{cypher_escape(id_key)}: {value}}})"
+
+
+def unwind_create_relationships_query(
+    relationship: str,
+    from_label: str,
+    from_id_key: str,
+    to_label: str,
+    to_id_key: str,
+    return_ids: bool = True,
+) -> str:
+    """
+    Build a ``UNWIND ... MATCH ... CREATE`` statement creating a `relationship` relationship for each element
+    of `$rows` parameter. Each element should be a dictionary with `f` and `t` keys containing the identifying
+    values of start and end nodes, `p` key with the relationship's properties and `i` key with the row's position.
+    Rows which nodes could not be matched are skipped.
+
+    :param relationship: type of created relationships.
+    :type relationship: str
+    :param from_label: label of start nodes.
+    :type from_label: str
+    :param from_id_key: property used to match start nodes.
+    :type from_id_key: str
+    :param to_label: label of end nodes.
+    :type to_label: str
+    :param to_id_key: property used to match end nodes.
+    :type to_id_key: str
+    :param return_ids: whether positions of rows and internal ids of created relationships should be returned.
+    :type return_ids: bool, optional
+    :return: Cypher statement expecting `$rows` parameter.
+    """
+    query = " ".join(
+        [
+            "UNWIND $rows AS row",
+            match_node_clause("a", from_label, from_id_key, "row.f"),
+            match_node_clause("b", to_label, to_id_key, "row.t"),
+            f"CREATE (a)-[r:{cypher_escape(relationship)}]->(b) SET r = row.p",
+        ]
+    )
+    if return_ids:
+        return f"{query} RETURN row.i AS i, id(r) AS id"
+    return f"{query} RETURN count(r) AS created"
+
+
+def match_nodes_by_keys_query(label: str, id_key: str) -> str:
+    """
+    Build a statement matching all nodes with `label` label which `id_key` property value is one of
+    the elements of `$keys` parameter. If `id_key` is `__id__` the nodes are matched by their internal ids.
+
+    :param label: label of matched nodes.
+    :type label: str
+    :param id_key: property used to identify the nodes.
+    :type id_key: str
+    :return: Cypher statement expecting `$keys` parameter and returning `key` and `node` fields.
+    """
+    key = node_key_expression("n", id_key)
+    return f"MATCH (n:{cypher_escape(label)}) WHERE {key} IN $keys RETURN {key} AS key, n AS node"
+
+
+def match_node_ids_by_keys_query(label: str, id_key: str) -> str:
+    """
+    Variant of :func:`match_nodes_by_keys_query` returning only internal ids of the matched nodes.
+
+    :param label: label of matched nodes.
+    :type label: str
+    :param id_key: property used to identify the nodes.
+    :type id_key: str
+    :return: Cypher statement expecting `$keys` parameter and returning `key` and `id` fields.
+    """
+    key = node_key_expression("n", id_key)
+    return f"MATCH (n:{cypher_escape(label)}) WHERE {key} IN $keys RETURN {key} AS key, id(n) AS id"
+
+
+def match_node_values_by_keys_query(label: str, id_key: str, property_key: str) -> str:
+    """
+    Variant of :func:`match_nodes_by_keys_query` returning only `property_key` property of the matched nodes.
+
+    :param label: label of matched nodes.
+    :type label: str
+    :param id_key: property used to identify the nodes.
+    :type id_key: str
+    :param property_key: returned property.
+    :type property_key: str
+    :return: Cypher statement expecting `$keys` parameter and returning `key` and `value` fields.
+    """
+    key = node_key_expression("n", id_key)
+    return (
+        f"MATCH (n:{cypher_escape(label)}) WHERE {key} IN $keys "
+        f"RETURN {key} AS key, n.{cypher_escape(property_key)} AS value"
+    )
+
+
+def unwind_match_relationships_query(
+    relationship: str,
+    from_label: str,
+    from_id_key: str,
+    to_label: str,
+    to_id_key: str,
+    return_relationships: bool = True,
+) -> str:
+    """
+    Build a ``UNWIND ... MATCH (a)-[r:REL]->(b)`` statement matching `relationship` relationships for each
+    element of `$rows` parameter. Each element should be a dictionary with `f` and `t` keys containing the
+    identifying values of start and end nodes and `i` key with the row's position.
+
+    :param relationship: type of matched relationships.
+    :type relationship: str
+    :param from_label: label of start nodes.
+    :type from_label: str
+    :param from_id_key: property used to match start nodes.
+    :type from_id_key: str
+    :param to_label: label of end nodes.
+    :type to_label: str
+    :param to_id_key: property used to match end nodes.
+    :type to_id_key: str
+    :param return_relationships: whether matched relationships and their nodes should be returned. Otherwise
+        only distinct positions of rows with existing relationships are returned.
+    :type return_relationships: bool, optional
+    :return: Cypher statement expecting `$rows` parameter.
+    """
+    query = " ".join(
+        [
+            "UNWIND $rows AS row",
+            match_node_clause("a", from_label, from_id_key, "row.f"),
+            match_node_clause("b", to_label, to_id_key, "row.t"),
+            f"MATCH (a)-[r:{cypher_escape(relationship)}]->(b)",
+        ]
+    )
+    if return_relationships:
+        return f"{query} RETURN row.i AS i, a, r, b"
+    return f"{query} RETURN DISTINCT row.i AS i"
+
+
+def match_relationships_for_nodes_query(relationship: str, inner_only: bool = False) -> str:
+    """
+    Build a statement matching `relationship` relationships touching nodes which internal ids are elements
+    of `$chunk` parameter, where `$ids` parameter contains internal ids of all requested nodes (`$chunk` being
+    a part of it). If `inner_only` is True only relationships which both nodes are in `$ids` are matched.
+
+    A relationship is returned only for the chunk containing its start node, or - if its start node
+    is not requested - for the chunk containing its end node, so splitting `$ids` into chunks never matches
+    the same relationship twice.
+
+    :param relationship: type of matched relationships.
+    :type relationship: str
+    :param inner_only: whether both nodes of a relationship should be requested.
+    :type inner_only: bool, optional
+    :return: Cypher statement expecting `$chunk` and `$ids` parameters and returning `a`, `r` and `b` fields.
+    """
+    pattern = f"MATCH (a)-[r:{cypher_escape(relationship)}]->(b)"
+    if inner_only:
+        return f"{pattern} WHERE id(a) IN $chunk AND id(b) IN $ids RETURN a, r, b"
+    return " ".join(
+        [
+            f"{pattern} WHERE id(a) IN $chunk RETURN a, r, b",
+            "UNION",
+            f"{pattern} WHERE id(b) IN $chunk AND NOT id(a) IN $ids RETURN a, r, b",
+        ]
+    )
+
+
+def node_key_expression(name: str, id_key: str) -> str:
+    """
+    Build an expression with the value of `id_key` property of node bound to `name` variable. If `id_key`
+    is `__id__` the node's internal id is used.
+
+    :param name: name of the variable bound to the node.
+    :type name: str
+    :param id_key: name of the property.
+    :type id_key: str
+    :return: Cypher expression.
+    """
+    if id_key == "__id__":
+        return f"id({name})"
+    return f"{name}.{cypher_escape(id_key)}"
+
+
+def _paged_query(label: str, fields: List[str], page_key: str = None, first_page: bool = True) -> str:
+    query = f"MATCH (n:{cypher_escape(label)})"
+    if page_key is None:
+        return f"{query} RETURN {', '.join(fields)}"
+    key = node_key_expression("n", page_key)
+    if not first_page:
+        query = f"{query} WHERE {key} > $last"
+    elif page_key != "__id__":
+        query = f"{query} WHERE {key} IS NOT NULL"
+    fields = fields + [f"{key} AS page_key"]
+    return f"{query} RETURN {', '.join(fields)} ORDER BY page_key LIMIT $limit"
+
+
+def project_nodes_query(
+    label: str, keys: List[str] = None, page_key: str = None, first_page: bool = True
+) -> str:
+    """
+    Build a statement returning properties of all nodes with `label` label. If `keys` are used only these
+    properties are returned (a field for each key, in the order of `keys`), so the nodes themselves are
+    not transferred. Otherwise a single `properties` field with a map of all the node's properties is returned.
+
+    If `page_key` is used only a single page of nodes ordered by `page_key` property is returned (see
+    :func:`match_nodes_page_query`).
+
+    :param label: label of returned nodes.
+    :type label: str
+    :param keys: names of returned properties.
+    :type keys: List[str], optional
+    :param page_key: property used to order and paginate the nodes.
+    :type page_key: str, optional
+    :param first_page: whether the first page should be returned.
+    :type first_page: bool, optional
+    :return: Cypher statement.
+    """
+    if keys is None:
+        fields = ["properties(n) AS properties"]
+    else:
+        fields = [f"n.{cypher_escape(key)} AS p{position}" for position, key in enumerate(keys)]
+    return _paged_query(label, fields, page_key, first_page)
+
+
+def match_nodes_page_query(label: str, page_key: str, first_page: bool = True) -> str:
+    """
+    Build a statement returning a single page of nodes with `label` label using keyset pagination: nodes are
+    ordered by `page_key` property (or internal id if `page_key` is `__id__`) and the page starts right after
+    the `$last` key value, so each page is found with an index seek instead of skipping the previous pages.
+    Nodes without the `page_key` property are not returned.
+
+    :param label: label of returned nodes.
+    :type label: str
+    :param page_key: property used to order and paginate the nodes. Its values should be unique.
+    :type page_key: str
+    :param first_page: whether the first page should be returned. Otherwise `$last` parameter is expected.
+    :type first_page: bool, optional
+    :return: Cypher statement expecting `$limit` parameter and returning `node` and `page_key` fields.
+    """
+    return _paged_query(label, ["n AS node"], page_key, first_page)
+
+
+def unwind_merge_nodes_query(label: str, key: str, return_ids: bool = True) -> str:
+    """
+    Build a ``UNWIND ... MERGE`` statement creating or updating a single node with `label` label for each
+    element of `$rows` parameter. Each element should be a dictionary with `k` key containing value of the
+    node's `key` property (which must not be None), `p` key with properties that should be set and `i` key with
+    position of the row. Properties with None value are removed.
+
+    :param label: label of merged nodes.
+    :type label: str
+    :param key: property identifying the nodes.
+    :type key: str
+    :param return_ids: whether positions of rows and internal ids of merged nodes should be returned. If nodes
+        with the same key already exist a record is returned for each of them.
+    :type return_ids: bool, optional
+    :return: Cypher statement expecting `$rows` parameter.
+    """
+    node = f"(n:{cypher_escape(label)} {{{cypher_escape(key)}: row.k}})"
+    query = f"UNWIND $rows AS row MERGE {node} SET n += row.p"
+    if return_ids:
+        return f"{query} RETURN row.i AS i, id(n) AS id"
+    return f"{query} RETURN count(n) AS merged"
+
+
+def unwind_merge_relationships_query(
+    relationship: str,
+    from_label: str,
+    from_id_key: str,
+    to_label: str,
+    to_id_key: str,
+    return_ids: bool = True,
+) -> str:
+    """
+    Build a ``UNWIND ... MATCH ... MERGE`` statement creating a `relationship` relationship for each element
+    of `$rows` parameter unless its nodes are already connected with such relationship. Properties of the
+    relationship are updated in both cases. Rows are described as in :func:`unwind_create_relationships_query`.
+
+    :param relationship: type of merged relationships.
+    :type relationship: str
+    :param from_label: label of start nodes.
+    :type from_label: str
+    :param from_id_key: property used to match start nodes.
+    :type from_id_key: str
+    :param to_label: label of end nodes.
+    :type to_label: str
+    :param to_id_key: property used to match end nodes.
+    :type to_id_key: str
+    :param return_ids: whether positions of rows and internal ids of merged relationships should be returned.
+    :type return_ids: bool, optional
+    :return: Cypher statement expecting `$rows` parameter.
+    """
+    query = " ".join(
+        [
+            "UNWIND $rows AS row",
+            match_node_clause("a", from_label, from_id_key, "row.f"),
+            match_node_clause("b", to_label, to_id_key, "row.t"),
+            f"MERGE (a)-[r:{cypher_escape(relationship)}]->(b) SET r += row.p",
+        ]
+    )
+    if return_ids:
+        return f"{query} RETURN row.i AS i, id(r) AS id"
+    return f"{query} RETURN count(r) AS merged"
+
+
+def merge_node_append_lists_query(label: str, key: str, properties: List[str]) -> str:
+    """
+    Build a ``MERGE`` statement creating or matching the nodes with `label` label which `key` property value is
+    `$key` parameter and appending elements of lists in `$lists` parameter (a dictionary keyed with `properties`)
+    to the nodes' list `properties`. A node is locked before its properties are read, so elements appended by
+    concurrent transactions are never lost.
+
+    :param label: label of merged nodes.
+    :type label: str
+    :param key: property identifying the nodes.
+    :type key: str
+    :param properties: names of the extended list properties.
+    :type properties: List[str]
+    :return: Cypher statement expecting `$key` and `$lists` parameters and returning `merged` field.
+    """
+    updates = ", ".join(
+        f"n.{name} = coalesce(n.{name}, []) + $lists.{name}" for name in map(cypher_escape, properties)
+    )
+    return f"MERGE (n:{cypher_escape(label)} {{{cypher_escape(key)}: $key}}) SET {updates} RETURN count(n) AS merged"
+
+
+def delete_nodes_by_keys_query(label: str, key: str) -> str:
+    """
+    Build a statement deleting (along with their relationships) all nodes with `label` label which `key`
+    property value is one of the elements of `$keys` parameter.
+
+    :param label: label of deleted nodes.
+    :type label: str
+    :param key: property used to identify the nodes.
+    :type key: str
+    :return: Cypher statement expecting `$keys` parameter and returning `deleted` field.
+    """
+    key = node_key_expression("n", key)
+    return f"MATCH (n:{cypher_escape(label)}) WHERE {key} IN $keys DETACH DELETE n RETURN count(n) AS deleted"
@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pandas as pd
+
+
+@dataclass
+class IngestionSummary:
+    """
+    Lightweight result of a bulk write performed by :class:`.PandasGraph`.
+
+    Instead of keeping a Python object for each written row only the counters and (optionally)
+    internal ids of created graph entities are stored.
+
+    :ivar rows: number of processed rows.
+    :ivar chunks: number of chunks (transactions) used to write the rows.
+    :ivar created: number of created graph entities.
+    :ivar matched: number of rows merged with already existing graph entities (used by upserts).
+    :ivar missing: number of rows that could not be written because the nodes they refer to were not found.
+    :ivar failures: number of rows which chunks failed to be written.
+    :ivar errors: exceptions raised when writing the failed chunks.
+    :ivar skipped: number of rows skipped because a checkpoint recorded them as committed by a previous run.
+    :ivar elapsed: time of the whole write in seconds.
+    :ivar ids: :class:`pandas.Series` with internal ids of created entities aligned with the index
+        of written table, or None if ids were not collected.
+    """
+    rows: int = 0
+    chunks: int = 0
+    created: int = 0
+    matched: int = 0
+    missing: int = 0
+    failures: int = 0
+    errors: List[Exception] = field(default_factory=list)
+    skipped: int = 0
+    elapsed: float = 0.0
+    ids: Optional[pd.Series] = None
+
+
+@dataclass
+class SyncSummary:
+    """
+    Result of synchronizing a table with graph's nodes by :meth:`.PandasGraph.sync_dataframe`.
+
+    :ivar rows: number of rows of the synchronized table.
+    :ivar inserted: number of rows written as new nodes.
+    :ivar updated: number of rows which nodes were updated because their content has changed.
+    :ivar unchanged: number of rows skipped because their nodes are up to date.
+    :ivar deleted: number of nodes deleted because their keys are not available in the table.
+    :ivar failures: number of rows which chunks failed to be written.
+    :ivar errors: exceptions raised when writing the failed chunks.
+    :ivar elapsed: time of the whole synchronization in seconds.
+    """
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    failures: int = 0
+    errors: List[Exception] = field(default_factory=list)
+    elapsed: float = 0.0
@@ -6,7 +6,7 @@ setup(
     version="0.1.0",
     author=u"Wojciech Pratkowiecki",
     author_email="wpratkowiecki@gmail.com",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     include_package_data=True,
     install_requires=[
         "py2neo>=2021.0.0",
@@ -14,5 +14,8 @@ setup(
         "numpy>=1.18.0,<2",
         "cached-property>=1.5.2,<2",
     ],
+    extras_require={
+        "arrow": ["pyarrow>=7.0.0"],
+    },
     python_requires=">=3.7",
 )
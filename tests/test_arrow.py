@@ -0,0 +1,91 @@
+import math
+
+import pandas as pd
+import pytest
+
+from pandas2neo4j import PandasModel
+from pandas2neo4j.arrow import ArrowChunk, validate_batch
+from pandas2neo4j.errors import InvalidDataFrameError
+from pandas2neo4j.properties import BooleanProperty, FloatProperty, IntegerProperty, ListProperty, StringProperty
+
+pa = pytest.importorskip("pyarrow")
+
+PROPERTIES = {
+    "string": StringProperty(),
+    "integer": IntegerProperty(),
+    "float": FloatProperty(),
+    "boolean": BooleanProperty(),
+    "list": ListProperty(int),
+}
+STRICT_PROPERTIES = {
+    "string": StringProperty(cast_value=False),
+    "integer": IntegerProperty(cast_value=False),
+    "float": FloatProperty(cast_value=False),
+    "boolean": BooleanProperty(cast_value=False),
+}
+
+COLUMNS = {
+    "int8": pa.array([0, 1, -3, 5], type=pa.int8()),
+    "int32": pa.array([0, 1, -3, 2 ** 31 - 1], type=pa.int32()),
+    "uint16": pa.array([0, 1, 3, 65535], type=pa.uint16()),
+    "int64": pa.array([0, 1, -3, 2 ** 53 + 1], type=pa.int64()),
+    "float32": pa.array([0.0, 1.5, -2.0, float("nan")], type=pa.float32()),
+    "float64": pa.array([0.0, 1.0, -2.7, float("inf")], type=pa.float64()),
+    "bool": pa.array([True, False, True, False]),
+    "string": pa.array(["false", "0", "1", "True"]),
+    "numeric_string": pa.array(["12", " 7 ", "1.5", "1e3"]),
+    "large_string": pa.array(["a", "b", "", "1"], type=pa.large_string()),
+    "list": pa.array([[1, 2], [], [3], [4, 5]], type=pa.list_(pa.int32())),
+}
+
+
+def _model(name, schema_property):
+    return type(name, (PandasModel,), {"__primarylabel__": name, "value": schema_property})
+
+
+def _validated(model_class, column):
+    """
+    Values and invalid rows of `column` validated with :func:`validate_batch` and with
+    :meth:`.PandasModel.validate_dataframe` of the same table converted into a :class:`pandas.DataFrame`
+    (with Python lists rather than `numpy` arrays in list columns).
+    """
+    batch = pa.RecordBatch.from_arrays([column], names=["value"])
+    df = batch.to_pandas()
+    if pa.types.is_list(column.type):
+        df["value"] = pd.Series(column.to_pylist(), dtype=object)
+    results = []
+    for validate in (
+        lambda: validate_batch(model_class, ArrowChunk(batch, pd.RangeIndex(len(batch)))).column(0).to_pylist(),
+        lambda: model_class.validate_dataframe(df)["value"].tolist(),
+    ):
+        try:
+            results.append((validate(), {}))
+        except InvalidDataFrameError as error:
+            results.append((None, error.invalid_rows))
+    return results
+
+
+def _same(first, second):
+    if first is None or second is None:
+        return first is None and second is None
+    if isinstance(first, float) and isinstance(second, float) and math.isnan(first):
+        return math.isnan(second)
+    return first == second and type(first) is type(second)
+
+
+@pytest.mark.parametrize("property_name", PROPERTIES)
+@pytest.mark.parametrize("column_name", COLUMNS)
+def test_validate_batch_matches_validate_dataframe(property_name, column_name):
+    model_class = _model("Casted", PROPERTIES[property_name])
+    (arrow_values, arrow_invalid), (pandas_values, pandas_invalid) = _validated(model_class, COLUMNS[column_name])
+    assert arrow_invalid == pandas_invalid
+    assert arrow_values is None or all(map(_same, arrow_values, pandas_values))
+
+
+@pytest.mark.parametrize("property_name", STRICT_PROPERTIES)
+@pytest.mark.parametrize("column_name", COLUMNS)
+def test_validate_batch_without_casting_matches_validate_dataframe(property_name, column_name):
+    model_class = _model("Strict", STRICT_PROPERTIES[property_name])
+    (arrow_values, arrow_invalid), (pandas_values, pandas_invalid) = _validated(model_class, COLUMNS[column_name])
+    assert arrow_invalid == pandas_invalid
+    assert arrow_values is None or all(map(_same, arrow_values, pandas_values))